@@ -4,4 +4,14 @@ from .buttonComponents import *
 from .inputComponents import *
 from .themeManager import *
 from .cardComponents import *
-from .layoutComponents import *
\ No newline at end of file
+from .layoutComponents import *
+from .colorEngine import *
+from .themeFiles import *
+from .eventScheduler import *
+from .logComponents import *
+from .treeOptimizer import *
+from .virtualComponents import *
+from .pagingComponents import *
+from .gridComponents import *
+from .reconciler import *
+from .imagePipeline import *
\ No newline at end of file
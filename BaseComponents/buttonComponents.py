@@ -1,6 +1,6 @@
 # BaseComponents/buttonComponents.py
 import flet as ft
-from .themeManager import get_theme_colors
+from .themeManager import get_theme_colors, bind_theme
 
 
 def primary_button(text, on_click=None, width=None, height=None):
@@ -17,14 +17,15 @@ def primary_button(text, on_click=None, width=None, height=None):
         ft.ElevatedButton: 配置好的按钮组件
     """
     colors = get_theme_colors()
-    return ft.ElevatedButton(
+    button = ft.ElevatedButton(
         text=text,
         on_click=on_click,
         width=width,
         height=height,
-        color=colors["on_primary"],
-        bgcolor=colors["primary"],
+        color=colors.on_primary,
+        bgcolor=colors.primary,
     )
+    return bind_theme(button, color="on_primary", bgcolor="primary")
 
 
 def secondary_button(text, on_click=None, width=None, height=None):
@@ -41,14 +42,15 @@ def secondary_button(text, on_click=None, width=None, height=None):
         ft.ElevatedButton: 配置好的按钮组件
     """
     colors = get_theme_colors()
-    return ft.ElevatedButton(
+    button = ft.ElevatedButton(
         text=text,
         on_click=on_click,
         width=width,
         height=height,
-        color=colors["on_secondary"],
-        bgcolor=colors["secondary"],
+        color=colors.on_secondary,
+        bgcolor=colors.secondary,
     )
+    return bind_theme(button, color="on_secondary", bgcolor="secondary")
 
 
 def icon_button(icon, on_click=None, tooltip=None):
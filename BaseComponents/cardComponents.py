@@ -1,6 +1,117 @@
 # BaseComponents/cardComponents.py
+import asyncio
+import copy
+import enum
+from functools import lru_cache
+
 import flet as ft
-from .themeManager import get_theme_colors
+from flet.core.event_handler import EventHandler
+
+from .eventScheduler import UpdateBatcher, coalesce_events, _session_scheduler
+from .imagePipeline import lazy_image, thumbnail_image
+from .reconciler import is_handler_wrapper
+from .themeManager import get_theme_colors, get_theme_manager, bind_theme, _outline_border
+
+# 轻量模式下标题之后的内容文本样式（与 ft.Text 的默认正文大小一致）
+_CONTENT_SPAN_STYLE = ft.TextStyle(size=14, weight=ft.FontWeight.NORMAL)
+
+
+@lru_cache(maxsize=32)
+def _elevation_shadow(elevation, shadow_color=None):
+    """用 BoxShadow 近似 Material 卡片的阴影高度，高度为 0 时没有阴影"""
+    if not elevation:
+        return None
+    return ft.BoxShadow(
+        blur_radius=2 * elevation + 1,
+        offset=ft.Offset(0, (elevation + 1) // 2),
+        color=shadow_color or ft.Colors.with_opacity(0.2, ft.Colors.BLACK),
+    )
+
+
+# 悬停效果的默认过渡动画，在客户端执行
+_HOVER_ANIMATION = ft.Animation(150, ft.AnimationCurve.EASE_OUT)
+
+def _get_hover_batcher():
+    """当前会话所有卡片共享的悬停更新合并器，每帧最多发送一次批量更新"""
+    return _session_scheduler("card-hover", lambda: UpdateBatcher(name="card-hover"))
+
+
+def _coalesced(handler, interval):
+    return coalesce_events(handler, interval) if handler is not None else None
+
+
+class _HoverEffect:
+    """卡片的悬停效果
+
+    作为卡片容器的 on_hover 处理函数：进入和离开时只修改阴影高度、背景色和
+    缩放比例，并登记到共享的 UpdateBatcher，同一帧内所有卡片的修改合并为
+    一次 page.update()。快速进出时只发送最终状态。
+    """
+
+    __slots__ = (
+        "card", "container", "on_hover", "elevation", "shadow_color", "hover_elevation",
+        "hover_bgcolor", "hover_scale", "lightweight", "hovered", "_base_bgcolor", "__weakref__",
+    )
+
+    def __init__(self, card, container, on_hover, themed_bgcolor, elevation, shadow_color,
+                 hover_elevation, hover_bgcolor, hover_scale, lightweight):
+        self.card = card
+        self.container = container
+        self.on_hover = on_hover
+        self.elevation = elevation
+        self.shadow_color = shadow_color
+        self.hover_elevation = hover_elevation
+        self.hover_bgcolor = hover_bgcolor
+        self.hover_scale = hover_scale
+        self.lightweight = lightweight
+        self.hovered = False
+        self._base_bgcolor = container.bgcolor
+        if hover_scale is not None:
+            card.animate_scale = _HOVER_ANIMATION
+        if hover_bgcolor is not None and themed_bgcolor:
+            # 切换主题时更新离开后要恢复的背景色；登记晚于容器，悬停中会覆盖容器的主题色
+            bind_theme(self, owner=card, base_bgcolor="surface")
+        container.on_hover = self
+
+    def _config(self):
+        return (self.on_hover, self.elevation, self.shadow_color, self.hover_elevation,
+                self.hover_bgcolor, self.hover_scale, self.lightweight)
+
+    def same_as(self, other):
+        """配置是否与另一个效果相同；协调器修补卡片时据此保留页面上原有的处理函数"""
+        return isinstance(other, _HoverEffect) and self._config() == other._config()
+
+    @property
+    def base_bgcolor(self):
+        return self._base_bgcolor
+
+    @base_bgcolor.setter
+    def base_bgcolor(self, color):
+        self._base_bgcolor = color
+        if self.hovered:
+            self.container.bgcolor = self.hover_bgcolor
+
+    def apply(self, hovered):
+        """按悬停状态修改属性（不发送更新）"""
+        self.hovered = hovered
+        if self.hover_bgcolor is not None:
+            self.container.bgcolor = self.hover_bgcolor if hovered else self._base_bgcolor
+        if self.hover_elevation is not None:
+            elevation = self.hover_elevation if hovered else self.elevation
+            if self.lightweight:
+                self.container.shadow = _elevation_shadow(elevation, self.shadow_color)
+            else:
+                self.card.elevation = elevation
+        if self.hover_scale is not None:
+            self.card.scale = self.hover_scale if hovered else 1
+
+    def __call__(self, e):
+        hovered = e.data == "true"
+        if hovered != self.hovered:
+            self.apply(hovered)
+            _get_hover_batcher().mark(self.card)
+        if self.on_hover is not None:
+            self.on_hover(e)
 
 
 class Card:
@@ -30,7 +141,12 @@ class Card:
         url_target=None,
         on_click=None,
         on_long_press=None,
-        on_hover=None
+        on_hover=None,
+        lightweight=False,
+        hover_elevation=None,
+        hover_bgcolor=None,
+        hover_scale=None,
+        event_interval=None
     ):
         """
         创建一个功能完整的卡片
@@ -59,15 +175,63 @@ class Card:
             on_click: 点击事件处理函数
             on_long_press: 长按事件处理函数
             on_hover: 悬停事件处理函数
+            lightweight: 是否使用轻量模式，参见 Card.create_lightweight
+            hover_elevation: 悬停时的阴影高度 (可选)
+            hover_bgcolor: 悬停时的背景颜色 (可选)
+            hover_scale: 悬停时的缩放比例 (可选)
+            event_interval: 指定时 on_hover 和 on_long_press 按此间隔（秒）节流，
+                同一间隔内只处理最后一次事件，参见 coalesce_events
+            
+        悬停效果只修改属性，各卡片的修改每帧合并为一次批量更新；过渡动画通过
+        animate / animate_scale 在客户端执行（未指定 animate 时使用 150ms 的默认动画）。
             
         Returns:
-            ft.Card: 配置好的卡片组件
+            ft.Card: 配置好的卡片组件（轻量模式下为 ft.Container）
         """
+        if lightweight:
+            return Card.create_lightweight(
+                content,
+                title=title,
+                actions=actions,
+                expand=expand,
+                width=width,
+                height=height,
+                elevation=elevation,
+                border_radius=border_radius,
+                padding=padding,
+                margin=margin,
+                bgcolor=bgcolor,
+                outlined=outlined,
+                image_src=image_src,
+                image_src_base64=image_src_base64,
+                image_fit=image_fit,
+                image_repeat=image_repeat,
+                shadow_color=shadow_color,
+                animate=animate,
+                url=url,
+                url_target=url_target,
+                on_click=on_click,
+                on_long_press=on_long_press,
+                on_hover=on_hover,
+                hover_elevation=hover_elevation,
+                hover_bgcolor=hover_bgcolor,
+                hover_scale=hover_scale,
+                event_interval=event_interval,
+            )
+
+        if event_interval is not None:
+            on_hover = _coalesced(on_hover, event_interval)
+            on_long_press = _coalesced(on_long_press, event_interval)
+        hover = hover_elevation is not None or hover_bgcolor is not None or hover_scale is not None
+        if hover and animate is None:
+            animate = _HOVER_ANIMATION
+
         colors = get_theme_colors()
         
         # 如果没有指定背景色，使用主题色
-        if bgcolor is None:
-            bgcolor = colors["surface"]
+        themed_bgcolor = bgcolor is None
+        if themed_bgcolor:
+            bgcolor = colors.surface
             
         # 处理内容
         if isinstance(content, str):
@@ -79,7 +243,8 @@ class Card:
             title_widget = None
             if title:
                 if isinstance(title, str):
-                    title_widget = ft.Text(title, size=20, weight=ft.FontWeight.BOLD, color=colors["text_primary"])
+                    title_widget = ft.Text(title, size=20, weight=ft.FontWeight.BOLD, color=colors.text_primary)
+                    bind_theme(title_widget, color="text_primary")
                 else:
                     title_widget = title
                     
@@ -118,12 +283,20 @@ class Card:
             "expand": expand,
         }
         
+        # 记录取自调色板的属性，以便切换主题时就地更新
+        container_roles = {}
+        if themed_bgcolor:
+            container_roles["bgcolor"] = "surface"
+            
         # 如果需要边框，添加边框
         if outlined:
-            container_params["border"] = ft.border.all(1, colors["text_secondary"])
+            container_params["border"] = _outline_border(colors.text_secondary)
+            container_roles["border"] = ("text_secondary", _outline_border)
             
         # 创建容器
         container = ft.Container(**container_params)
+        if container_roles:
+            bind_theme(container, **container_roles)
         
         # 创建卡片
         card = ft.Card(
@@ -134,8 +307,137 @@ class Card:
             expand=expand,
         )
         
+        if hover:
+            _HoverEffect(
+                card, container, on_hover, themed_bgcolor, elevation, shadow_color,
+                hover_elevation, hover_bgcolor, hover_scale, lightweight=False,
+            )
         return card
 
+    @staticmethod
+    def create_lightweight(
+        content,
+        title=None,
+        actions=None,
+        expand=False,
+        width=None,
+        height=None,
+        elevation=1,
+        border_radius=8,
+        padding=16,
+        margin=8,
+        bgcolor=None,
+        outlined=False,
+        image_src=None,
+        image_src_base64=None,
+        image_fit=ft.ImageFit.CONTAIN,
+        image_repeat=ft.ImageRepeat.NO_REPEAT,
+        shadow_color=None,
+        animate=None,
+        url=None,
+        url_target=None,
+        on_click=None,
+        on_long_press=None,
+        on_hover=None,
+        hover_elevation=None,
+        hover_bgcolor=None,
+        hover_scale=None,
+        event_interval=None
+    ):
+        """
+        创建一个轻量卡片，参数与 Card.create 相同
+        
+        适合一次显示成百上千张卡片的场景，按实际用到的功能收缩控件结构:
+        - 不使用 ft.Card，由一个 ft.Container 同时承担外边距、背景、圆角、边框、
+          点击事件和内边距，阴影高度用 BoxShadow 近似
+        - 没有操作按钮时不创建 Column：字符串标题和字符串内容合并为一个带
+          TextSpan 的文本控件
+        - 只有需要操作按钮时才创建 Column 和 Row
+        
+        simple_card 由 3 个控件减少为 2 个，titled_card 由 5 个减少为 3 个。
+        悬停时的阴影高度通过替换 BoxShadow 实现，由 animate 在客户端过渡。
+        
+        Returns:
+            ft.Container: 配置好的卡片组件
+        """
+        if event_interval is not None:
+            on_hover = _coalesced(on_hover, event_interval)
+            on_long_press = _coalesced(on_long_press, event_interval)
+        hover = hover_elevation is not None or hover_bgcolor is not None or hover_scale is not None
+        if hover and animate is None:
+            animate = _HOVER_ANIMATION
+
+        colors = get_theme_colors()
+        themed_bgcolor = bgcolor is None
+        if themed_bgcolor:
+            bgcolor = colors.surface
+        
+        if isinstance(content, str):
+            content = ft.Text(content)
+        
+        if title and not actions and isinstance(title, str) and isinstance(content, ft.Text) \
+                and not content.spans and isinstance(content.value, str) and content.style is None:
+            # 标题与内容合并为一个文本控件，内容作为换行后的 TextSpan
+            card_content = ft.Text(
+                title,
+                size=20,
+                weight=ft.FontWeight.BOLD,
+                color=colors.text_primary,
+                spans=[ft.TextSpan("\n" + content.value, _CONTENT_SPAN_STYLE)],
+            )
+            bind_theme(card_content, color="text_primary")
+        elif title or actions:
+            title_widget = None
+            if title:
+                if isinstance(title, str):
+                    title_widget = ft.Text(title, size=20, weight=ft.FontWeight.BOLD, color=colors.text_primary)
+                    bind_theme(title_widget, color="text_primary")
+                else:
+                    title_widget = title
+            actions_row = ft.Row(actions, alignment=ft.MainAxisAlignment.END) if actions else None
+            card_content = ft.Column(
+                controls=[control for control in [title_widget, content, actions_row] if control is not None],
+                spacing=8,
+                expand=True,
+            )
+        else:
+            card_content = content
+        
+        container_roles = {}
+        if themed_bgcolor:
+            container_roles["bgcolor"] = "surface"
+        border = None
+        if outlined:
+            border = _outline_border(colors.text_secondary)
+            container_roles["border"] = ("text_secondary", _outline_border)
+        
+        container = ft.Container(
+            content=card_content,
+            padding=padding,
+            margin=margin,
+            width=width,
+            height=height,
+            bgcolor=bgcolor,
+            border=border,
+            border_radius=border_radius,
+            shadow=_elevation_shadow(elevation, shadow_color),
+            animate=animate,
+            url=url,
+            url_target=url_target,
+            on_click=on_click,
+            on_long_press=on_long_press,
+            on_hover=on_hover,
+            expand=expand or None,
+        )
+        if container_roles:
+            bind_theme(container, **container_roles)
+        if hover:
+            _HoverEffect(
+                container, container, on_hover, themed_bgcolor, elevation, shadow_color,
+                hover_elevation, hover_bgcolor, hover_scale, lightweight=True,
+            )
+        return container
+
 
 def simple_card(
     content,
@@ -144,7 +446,8 @@ def simple_card(
     height=None,
     elevation=1,
     padding=16,
-    margin=8
+    margin=8,
+    lightweight=False
 ):
     """
     创建一个简单的卡片
@@ -157,6 +460,7 @@ def simple_card(
         elevation: 阴影高度
         padding: 内边距
         margin: 外边距
+        lightweight: 是否使用轻量模式（更少的嵌套控件），参见 Card.create_lightweight
         
     Returns:
         ft.Card: 配置好的卡片组件
@@ -168,7 +472,8 @@ def simple_card(
         height=height,
         elevation=elevation,
         padding=padding,
-        margin=margin
+        margin=margin,
+        lightweight=lightweight
     )
 
 
@@ -181,7 +486,8 @@ def titled_card(
     height=None,
     elevation=1,
     padding=16,
-    margin=8
+    margin=8,
+    lightweight=False
 ):
     """
     创建一个带标题的卡片
@@ -196,6 +502,7 @@ def titled_card(
         elevation: 阴影高度
         padding: 内边距
         margin: 外边距
+        lightweight: 是否使用轻量模式（更少的嵌套控件），参见 Card.create_lightweight
         
     Returns:
         ft.Card: 配置好的卡片组件
@@ -209,7 +516,8 @@ def titled_card(
         height=height,
         elevation=elevation,
         padding=padding,
-        margin=margin
+        margin=margin,
+        lightweight=lightweight
     )
 
 
@@ -224,7 +532,10 @@ def image_card(
     elevation=1,
     padding=16,
     margin=8,
-    image_fit=ft.ImageFit.COVER
+    image_fit=ft.ImageFit.COVER,
+    lightweight=False,
+    thumbnail=False,
+    lazy=False
 ):
     """
     创建一个带图片的卡片
@@ -241,17 +552,27 @@ def image_card(
         padding: 内边距
         margin: 外边距
         image_fit: 图片适应模式
+        lightweight: 是否使用轻量模式（更少的嵌套控件），参见 Card.create_lightweight
+        thumbnail: 本地图片是否按 width / image_height 生成缩略图（在后台线程中缩放并缓存，
+            需要 Pillow），参见 thumbnail_image
+        lazy: 是否延迟加载图片：先显示固定高度的主题化占位，接近可见区域时才加载，
+            需要放在 scrollable_page(..., lazy_images=True) 中，参见 lazy_image
         
     Returns:
         ft.Card: 配置好的卡片组件
     """
     # 创建图片控件
-    image = ft.Image(
-        src=image_src,
-        height=image_height,
-        fit=image_fit,
-        width=width
-    )
+    if lazy:
+        image = lazy_image(image_src, height=image_height, width=width, fit=image_fit, thumbnail=thumbnail)
+    elif thumbnail:
+        image = thumbnail_image(image_src, width=width, height=image_height, fit=image_fit)
+    else:
+        image = ft.Image(
+            src=image_src,
+            height=image_height,
+            fit=image_fit,
+            width=width
+        )
     
     # 组织内容
     if content or title or actions:
@@ -261,7 +582,8 @@ def image_card(
         if title:
             if isinstance(title, str):
                 colors = get_theme_colors()
-                title = ft.Text(title, size=20, weight=ft.FontWeight.BOLD, color=colors["text_primary"])
+                title = ft.Text(title, size=20, weight=ft.FontWeight.BOLD, color=colors.text_primary)
+                bind_theme(title, color="text_primary")
             content_controls.append(title)
             
         if content:
@@ -290,7 +612,8 @@ def image_card(
         width=width,
         elevation=elevation,
         padding=0,  # 图片卡片通常不需要内边距
-        margin=margin
+        margin=margin,
+        lightweight=lightweight
     )
 
 
@@ -303,7 +626,8 @@ def outlined_card(
     height=None,
     elevation=0,
     padding=16,
-    margin=8
+    margin=8,
+    lightweight=False
 ):
     """
     创建一个带边框的卡片（无阴影）
@@ -318,6 +642,7 @@ def outlined_card(
         elevation: 阴影高度 (默认为0)
         padding: 内边距
         margin: 外边距
+        lightweight: 是否使用轻量模式（更少的嵌套控件），参见 Card.create_lightweight
         
     Returns:
         ft.Card: 配置好的卡片组件
@@ -332,7 +657,8 @@ def outlined_card(
         elevation=elevation,
         padding=padding,
         margin=margin,
-        outlined=True
+        outlined=True,
+        lightweight=lightweight
     )
 
 
@@ -346,7 +672,8 @@ def clickable_card(
     height=None,
     elevation=1,
     padding=16,
-    margin=8
+    margin=8,
+    lightweight=False
 ):
     """
     创建一个可点击的卡片
@@ -362,6 +689,7 @@ def clickable_card(
         elevation: 阴影高度
         padding: 内边距
         margin: 外边距
+        lightweight: 是否使用轻量模式（更少的嵌套控件），参见 Card.create_lightweight
         
     Returns:
         ft.Card: 配置好的卡片组件
@@ -376,5 +704,612 @@ def clickable_card(
         elevation=elevation,
         padding=padding,
         margin=margin,
-        on_click=on_click
-    )
\ No newline at end of file
+        on_click=on_click,
+        lightweight=lightweight
+    )
+
+# 编译模板时填入插槽的占位文本
+_SLOT_MARK = "\x00base_components_slot:{}\x00"
+
+# 可以在复制出的卡片之间共享的不可变值
+_IMMUTABLE_TYPES = (str, bytes, int, float, bool, type(None), enum.Enum)
+_PLAIN_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _is_shared_value(value):
+    """复制控件时可以直接共享的字段值：不可变值和回调函数"""
+    return isinstance(value, _IMMUTABLE_TYPES) or (callable(value) and not isinstance(value, ft.Control))
+
+
+def _copy_value(value):
+    """逐层复制样式对象（Flet 的样式类都是 dataclass），比 copy.deepcopy 快得多"""
+    cls = type(value)
+    if cls in _PLAIN_TYPES or _is_shared_value(value):
+        return value
+    if cls is list:
+        return [item if type(item) in _PLAIN_TYPES else _copy_value(item) for item in value]
+    if cls is dict:
+        return {key: item if type(item) in _PLAIN_TYPES else _copy_value(item) for key, item in value.items()}
+    if hasattr(cls, "__dataclass_fields__") and hasattr(value, "__dict__"):
+        copied = cls.__new__(cls)
+        copied.__dict__ = {
+            name: item if type(item) in _PLAIN_TYPES else _copy_value(item)
+            for name, item in value.__dict__.items()
+        }
+        return copied
+    return copy.deepcopy(value)
+
+
+class _ClonePlan:
+    """原型树中一个控件的复制计划：哪些字段需要递归复制、哪些属性是插槽"""
+
+    __slots__ = ("node", "children", "lists", "handlers", "values", "wrapped", "slots", "bindings")
+
+    def __init__(self, node, marks):
+        self.node = node
+        self.children = []
+        self.lists = []
+        self.handlers = []
+        self.values = []
+        self.slots = []
+        registry = get_theme_manager().registry
+        fields = vars(node)
+        for name, value in fields.items():
+            if name in ("_Control__page", "parent", "_Control__attrs", "_Control__event_handlers",
+                        "_Control__previous_children"):
+                continue
+            if isinstance(value, ft.Control):
+                self.children.append((name, _ClonePlan(value, marks)))
+            elif isinstance(value, list) and any(isinstance(item, ft.Control) for item in value):
+                self.lists.append((name, [
+                    _ClonePlan(item, marks) if isinstance(item, ft.Control) else None for item in value
+                ]))
+            elif isinstance(value, EventHandler):
+                self.handlers.append(name)
+            elif not _is_shared_value(value):
+                # 样式、边框、内边距等可变对象每张卡片各复制一份：按钮的 before_update
+                # 会直接修改自己的 style，共享同一个对象会让卡片之间互相影响
+                self.values.append((name, registry.bindings_of(value)))
+
+        # get_handler() 返回的包装函数引用原 EventHandler，复制后需要重新生成
+        self.wrapped = []
+        for event, handler in node._Control__event_handlers.items():
+            if is_handler_wrapper(handler):
+                wrapped = handler.__closure__[0].cell_contents if handler.__closure__ else None
+                for name in self.handlers:
+                    if fields[name] is wrapped:
+                        self.wrapped.append((event, name))
+
+        for attr, (value, _) in node._Control__attrs.items():
+            if not isinstance(value, str):
+                continue
+            for slot, mark in marks.items():
+                if mark in value:
+                    prefix, suffix = value.split(mark, 1)
+                    self.slots.append((slot, attr, prefix, suffix))
+
+        self.bindings = get_theme_manager().registry.bindings_of(node)
+
+    def stamp(self, values):
+        node = self.node
+        cls = type(node)
+        clone = cls.__new__(cls)
+        state = node.__dict__.copy()
+        state["_Control__attrs"] = state["_Control__attrs"].copy()
+        state["_Control__event_handlers"] = handlers = state["_Control__event_handlers"].copy()
+        state["_Control__previous_children"] = []
+        state["_Control__page"] = None
+        state["_Control__uid"] = None
+        state["parent"] = None
+        for name, plan in self.children:
+            state[name] = plan.stamp(values)
+        for name, plans in self.lists:
+            state[name] = [
+                _copy_value(item) if plan is None else plan.stamp(values)
+                for item, plan in zip(state[name], plans)
+            ]
+        copied_values = []
+        for name, bindings in self.values:
+            state[name] = copied = _copy_value(state[name])
+            if bindings:
+                copied_values.append((copied, bindings))
+        for name in self.handlers:
+            handler = state[name]
+            state[name] = copied = EventHandler.__new__(EventHandler)
+            copied.__dict__ = handler.__dict__.copy()
+        for event, name in self.wrapped:
+            handlers[event] = state[name].get_handler()
+        clone.__dict__ = state
+
+        for slot, attr, prefix, suffix in self.slots:
+            setattr(clone, attr, prefix + values[slot] + suffix)
+        if self.bindings:
+            bind_theme(clone, **self.bindings)
+        for copied, bindings in copied_values:
+            bind_theme(copied, owner=clone, **bindings)
+        return clone
+
+
+# 比较控件树时忽略的字段：会话状态、事件处理函数和已经单独比较的属性表
+_TREE_SKIP_FIELDS = frozenset((
+    "_Control__page", "parent", "_Control__uid", "_Control__previous_children",
+    "_Control__attrs", "_Control__event_handlers",
+))
+
+
+def _same_tree(a, b):
+    """两棵控件树的结构、属性和已登记事件是否一致（不比较事件处理函数本身）"""
+    if type(a) is not type(b):
+        return False
+    if {k: v for k, (v, _) in a._Control__attrs.items()} != {k: v for k, (v, _) in b._Control__attrs.items()}:
+        return False
+    if a._Control__event_handlers.keys() != b._Control__event_handlers.keys():
+        return False
+    fields_a, fields_b = vars(a), vars(b)
+    if fields_a.keys() != fields_b.keys():
+        return False
+    for name, value in fields_a.items():
+        other = fields_b[name]
+        if name in _TREE_SKIP_FIELDS or isinstance(value, EventHandler):
+            continue
+        if isinstance(value, ft.Control):
+            if not _same_tree(value, other):
+                return False
+        elif isinstance(value, list) and any(isinstance(item, ft.Control) for item in value):
+            if not isinstance(other, list) or len(value) != len(other):
+                return False
+            for item, other_item in zip(value, other):
+                if isinstance(item, ft.Control):
+                    if not _same_tree(item, other_item):
+                        return False
+                elif item != other_item:
+                    return False
+        elif callable(value) and not isinstance(value, type):
+            # 每次构建都会新建的回调（例如悬停效果、主题绑定函数）只比较类型
+            if type(value) is not type(other):
+                return False
+        elif value != other:
+            return False
+    registry = get_theme_manager().registry
+    return (registry.bindings_of(a) or {}).keys() == (registry.bindings_of(b) or {}).keys()
+
+
+def _shares_state(a, b):
+    """两张复制出的卡片之间是否共享可变对象（属性表、列表、样式等），共享时修改一张会影响另一张"""
+    fields_a, fields_b = vars(a), vars(b)
+    for name, value in fields_a.items():
+        if name in ("_Control__page", "parent"):
+            continue
+        other = fields_b.get(name)
+        if isinstance(value, ft.Control):
+            if isinstance(other, ft.Control) and _shares_state(value, other):
+                return True
+            continue
+        if _is_shared_value(value):
+            continue
+        if value is other:
+            return True
+        if isinstance(value, list) and isinstance(other, list):
+            for item, other_item in zip(value, other):
+                if isinstance(item, ft.Control):
+                    if isinstance(other_item, ft.Control) and _shares_state(item, other_item):
+                        return True
+                elif not _is_shared_value(item) and item is other_item:
+                    return True
+    return False
+
+
+class CardTemplate:
+    """卡片模板：结构和样式只编译一次，之后按模板复制卡片
+    
+    创建模板时用 Card.create（或 Card.create_lightweight）构建一张原型卡片，
+    标题和内容位置填入占位文本并记录为插槽。stamp() 直接复制原型的控件树，
+    只填入标题、内容文本和事件处理函数，跳过 Card.create 中的参数处理、
+    分支判断和各控件构造函数。
+    
+    原型的主题绑定会复制到每张卡片上，切换主题时与 Card.create 创建的卡片
+    一样就地更新；原型本身也登记在主题中，之后复制的卡片使用当前主题的颜色。
+    操作按钮等固定控件在每张卡片中各有一份副本，但共享同一个事件处理函数。
+    
+    image=True 时按 image_card 的结构构建原型，图片地址也是插槽。
+    
+    复制依赖 Flet 控件的内部字段（属性表和事件表），样式、边框等可变对象每张
+    卡片各复制一份。创建模板时会用复制的卡片与 Card.create 直接创建的卡片比较，
+    并检查两张复制的卡片之间没有共享的可变对象；任一检查失败时（例如 Flet 版本的
+    内部结构发生变化）stamp() 退回为逐张调用 Card.create，结果正确但没有复制带来的加速。
+    """
+    
+    def __init__(
+        self,
+        title=True,
+        actions=None,
+        expand=False,
+        width=None,
+        height=None,
+        elevation=1,
+        border_radius=8,
+        padding=16,
+        margin=8,
+        bgcolor=None,
+        outlined=False,
+        shadow_color=None,
+        animate=None,
+        lightweight=False,
+        image=False,
+        image_height=150,
+        image_fit=ft.ImageFit.COVER
+    ):
+        """
+        Args:
+            title: 是否带标题插槽
+            actions: 操作按钮列表 (可选)，每张卡片复制一份
+            lightweight: 是否使用轻量模式，参见 Card.create_lightweight
+            image: 是否带图片插槽（按 image_card 构建，此时 height、border_radius、padding、
+                bgcolor、outlined、shadow_color、animate 不适用）
+            image_height: 图片高度
+            image_fit: 图片适应模式
+            其他参数: 参见 Card.create
+        """
+        def build(content, title=None, image=None):
+            if image is not None:
+                return image_card(
+                    image,
+                    content=content,
+                    title=title,
+                    actions=actions,
+                    image_height=image_height,
+                    expand=expand,
+                    width=width,
+                    elevation=elevation,
+                    margin=margin,
+                    image_fit=image_fit,
+                    lightweight=lightweight,
+                )
+            return Card.create(
+                content,
+                title=title,
+                actions=actions,
+                expand=expand,
+                width=width,
+                height=height,
+                elevation=elevation,
+                border_radius=border_radius,
+                padding=padding,
+                margin=margin,
+                bgcolor=bgcolor,
+                outlined=outlined,
+                shadow_color=shadow_color,
+                animate=animate,
+                lightweight=lightweight,
+            )
+
+        marks = {"content": _SLOT_MARK.format("content")}
+        if title:
+            marks["title"] = _SLOT_MARK.format("title")
+        if image:
+            marks["image"] = _SLOT_MARK.format("image")
+        self._build = build
+        self.prototype = build(marks["content"], marks.get("title"), marks.get("image"))
+        self.has_title = bool(title)
+        self.has_image = bool(image)
+        self._plan = _ClonePlan(self.prototype, marks)
+        # 自检：用示例值复制两张卡片，与 Card.create 直接创建的卡片比较结构和属性，
+        # 并确认两张卡片之间没有共享的可变对象
+        sample = {slot: f"{slot} sample" for slot in marks}
+        first = self._plan.stamp(sample)
+        if _shares_state(first, self._plan.stamp(sample)) or not _same_tree(
+            first,
+            build(sample["content"], sample.get("title"), sample.get("image")),
+        ):
+            self._plan = None
+        # 事件处理函数设置在承载背景和点击区域的容器上（ft.Card 的 content）
+        self._handler_path = ("content",) if isinstance(self.prototype, ft.Card) else ()
+    
+    @property
+    def cloning(self):
+        """是否通过复制原型创建卡片，为 False 时 stamp() 逐张调用 Card.create"""
+        return self._plan is not None
+    
+    def stamp(self, content, title=None, on_click=None, on_long_press=None, on_hover=None, data=None, image=None):
+        """
+        按模板创建一张卡片
+        
+        Args:
+            content: 内容文本
+            title: 标题文本（模板带标题插槽时使用）
+            on_click: 点击事件处理函数
+            on_long_press: 长按事件处理函数
+            on_hover: 悬停事件处理函数
+            data: 附加到卡片上的数据，同时保存在承载事件的控件上，事件中通过 e.control.data 读取
+            image: 图片地址（模板带图片插槽时使用）
+            
+        Returns:
+            ft.Card: 与 Card.create 结构相同的卡片（轻量模式下为 ft.Container）
+        """
+        if title is not None and not self.has_title:
+            raise ValueError("模板没有标题插槽")
+        if image is not None and not self.has_image:
+            raise ValueError("模板没有图片插槽")
+        values = {
+            "content": content,
+            "title": title if title is not None else "",
+            "image": image if image is not None else "",
+        }
+        if self._plan is not None:
+            card = self._plan.stamp(values)
+        else:
+            card = self._build(
+                content,
+                values["title"] if self.has_title else None,
+                values["image"] if self.has_image else None,
+            )
+        
+        host = card
+        for name in self._handler_path:
+            host = getattr(host, name)
+        if on_click is not None:
+            host.on_click = on_click
+        if on_long_press is not None:
+            host.on_long_press = on_long_press
+        if on_hover is not None:
+            host.on_hover = on_hover
+        if data is not None:
+            # 事件处理函数设置在 host 上，事件中 e.control 是 host，两处都保存数据
+            card.data = data
+            host.data = data
+        return card
+    
+    def stamp_many(self, contents, titles=None):
+        """
+        按模板批量创建卡片
+        
+        Args:
+            contents: 内容文本序列
+            titles: 标题文本序列（可选），与 contents 等长
+            
+        Returns:
+            list: 卡片列表
+        """
+        if titles is None:
+            return [self.stamp(content) for content in contents]
+        return [self.stamp(content, title) for content, title in zip(contents, titles)]
+
+
+def card_template(title=True, actions=None, elevation=1, padding=16, margin=8, lightweight=False, **kwargs):
+    """
+    创建卡片模板的便捷函数
+    
+    Args:
+        title: 是否带标题插槽
+        actions: 操作按钮列表 (可选)
+        elevation: 阴影高度
+        padding: 内边距
+        margin: 外边距
+        lightweight: 是否使用轻量模式（更少的嵌套控件）
+        **kwargs: 其他参数，参见 CardTemplate
+        
+    Returns:
+        CardTemplate: 卡片模板，调用 template.stamp(content, title) 创建卡片
+    """
+    return CardTemplate(
+        title=title,
+        actions=actions,
+        elevation=elevation,
+        padding=padding,
+        margin=margin,
+        lightweight=lightweight,
+        **kwargs
+    )
+
+
+# 记录批量数据中各列使用的字段名
+_BULK_FIELDS = ("title", "body", "image", "id")
+
+
+def _bulk_columns(titles, bodies, images, ids, records):
+    """把按列或按行传入的数据整理为 (列名 -> 列) 映射和行数
+
+    records 可以是按行的字典列表，也可以是按列的映射（dict 或 pandas.DataFrame
+    等支持 keys() 和下标访问的对象），字段名为 title、body、image、id。
+    """
+    columns = {"title": titles, "body": bodies, "image": images, "id": ids}
+    if records is not None:
+        if hasattr(records, "keys"):
+            available = set(records.keys())
+            for field in _BULK_FIELDS:
+                if columns[field] is None and field in available:
+                    columns[field] = records[field]
+        else:
+            records = list(records)
+            for field in _BULK_FIELDS:
+                if columns[field] is None and any(field in record for record in records):
+                    columns[field] = [record.get(field) for record in records]
+
+    lengths = {field: len(column) for field, column in columns.items() if column is not None}
+    if not lengths:
+        return columns, 0
+    if len(set(lengths.values())) > 1:
+        raise ValueError(f"各列的长度不一致: {lengths}")
+    # NumPy 数组和 pandas 列按下标访问较慢，统一转换为列表
+    columns = {field: list(column) if column is not None else None for field, column in columns.items()}
+    return columns, next(iter(lengths.values()))
+
+
+def _missing(value):
+    # None 以及 pandas / NumPy 表示缺失值的 NaN；标题和图片地址为空字符串时也视为缺失
+    return value is None or value == "" or (isinstance(value, float) and value != value)
+
+
+def _text(value):
+    return value if isinstance(value, str) else str(value)
+
+
+def _bulk_templates(template, lightweight, style):
+    """返回按行选择模板的函数
+
+    缺少标题或图片的行使用不带对应插槽的模板变体，不生成空的标题或图片控件；
+    变体按需创建并缓存。传入了 template 时只能使用它自己的插槽，不匹配时抛出 ValueError。
+    """
+    if template is not None:
+        def pick(index, has_title, has_image):
+            if (has_title, has_image) != (template.has_title, template.has_image):
+                raise ValueError(
+                    f"第 {index} 行的标题/图片与模板的插槽不一致"
+                    f"（行: {has_title}/{has_image}，模板: {template.has_title}/{template.has_image}）"
+                )
+            return template
+        return pick
+
+    variants = {}
+
+    def pick(index, has_title, has_image):
+        key = (has_title, has_image)
+        variant = variants.get(key)
+        if variant is None:
+            # 共享的样式只解析一次：同一种结构的卡片按同一个模板复制
+            variant = variants[key] = CardTemplate(
+                title=has_title,
+                image=has_image,
+                lightweight=lightweight,
+                **style
+            )
+        return variant
+    return pick
+
+
+def _bulk_chunks(columns, count, pick, chunk_size, chunk_growth, on_click):
+    """分块生成卡片列表，第一块为 chunk_size 张，之后每块按 chunk_growth 倍增长"""
+    titles = columns["title"]
+    bodies = columns["body"]
+    images = columns["image"]
+    ids = columns["id"]
+    if bodies is None and count:
+        raise ValueError("缺少内容列（bodies 或 records 中的 body 字段）")
+    start = 0
+    size = max(1, int(chunk_size))
+    while start < count:
+        end = min(start + size, count)
+        chunk = []
+        for index in range(start, end):
+            body = bodies[index]
+            if body is None or (isinstance(body, float) and body != body):
+                raise ValueError(f"第 {index} 行缺少内容")
+            title = titles[index] if titles is not None else None
+            image = images[index] if images is not None else None
+            has_title = not _missing(title)
+            has_image = not _missing(image)
+            chunk.append(pick(index, has_title, has_image).stamp(
+                _text(body),
+                _text(title) if has_title else None,
+                on_click=on_click,
+                data=ids[index] if ids is not None else None,
+                image=_text(image) if has_image else None,
+            ))
+        yield chunk
+        start = end
+        size = max(size, int(size * chunk_growth))
+
+
+def _bulk_setup(titles, bodies, images, ids, records, template, lightweight, style):
+    columns, count = _bulk_columns(titles, bodies, images, ids, records)
+    return columns, count, _bulk_templates(template, lightweight, style)
+
+
+def _append_chunk(target, chunk):
+    target.controls.extend(chunk)
+    page = target if isinstance(target, ft.Page) else target.page
+    if page is not None:
+        target.update()
+    # scrollable_page(..., lazy_images=True) 的列布局：只登记新卡片中的延迟图片
+    loader = getattr(target, "lazy_loader", None)
+    if loader is not None:
+        loader.refresh(chunk)
+
+
+def bulk_cards(
+    titles=None,
+    bodies=None,
+    images=None,
+    ids=None,
+    records=None,
+    target=None,
+    chunk_size=200,
+    chunk_growth=4,
+    on_click=None,
+    template=None,
+    lightweight=False,
+    **style
+):
+    """
+    按列批量创建卡片
+    
+    所有卡片共享同一套样式：样式参数只解析一次，编译为 CardTemplate 后逐张复制，
+    不再为每张卡片调用 simple_card / titled_card。指定 target 时卡片分块追加到容器，
+    每块发送一次更新，前面的卡片在整批创建完成之前就会显示出来。
+    
+    容器的每次 update() 都会遍历其中已有的全部控件，因此块的大小从 chunk_size
+    开始按 chunk_growth 倍增长：第一块很快显示，更新次数和总耗时只随卡片数
+    线性增长。chunk_growth=1 时每块大小固定。
+    
+    某一行缺少标题或图片（None、NaN 或空字符串）时，这一行的卡片不带标题或图片，
+    而不是显示空的控件；缺少内容时抛出 ValueError。
+    
+    Args:
+        titles: 标题列（可选）
+        bodies: 内容列
+        images: 图片地址列（可选），指定时按 image_card 的结构创建
+        ids: 标识列（可选），保存到卡片的 data 属性，事件中通过 e.control.data 读取
+        records: 按行的字典列表，或按列的映射（dict、pandas.DataFrame 等），
+            字段名为 title、body、image、id；与单独传入的列同时使用时以单独传入的列为准
+        target: 追加卡片的容器（带 controls 列表，例如 ft.Column、ft.ListView 或 ft.Page）
+        chunk_size: 第一块的卡片数量
+        chunk_growth: 之后每块相对前一块的增长倍数
+        on_click: 点击事件处理函数（所有卡片共享）
+        template: 使用已有的 CardTemplate，此时忽略样式参数；各行的标题和图片
+            必须与模板的插槽一致，否则抛出 ValueError
+        lightweight: 是否使用轻量模式（更少的嵌套控件）
+        **style: 其他样式参数，参见 CardTemplate
+        
+    Returns:
+        list: 创建的卡片列表
+    """
+    columns, count, pick = _bulk_setup(titles, bodies, images, ids, records, template, lightweight, style)
+    cards = []
+    for chunk in _bulk_chunks(columns, count, pick, chunk_size, chunk_growth, on_click):
+        cards.extend(chunk)
+        if target is not None:
+            _append_chunk(target, chunk)
+    return cards
+
+
+async def bulk_cards_async(
+    titles=None,
+    bodies=None,
+    images=None,
+    ids=None,
+    records=None,
+    target=None,
+    chunk_size=200,
+    chunk_growth=4,
+    on_click=None,
+    template=None,
+    lightweight=False,
+    **style
+):
+    """
+    bulk_cards 的异步版本，参数相同
+    
+    每追加一块卡片后让出事件循环，适合在异步事件处理函数或 page.run_task 中使用，
+    创建大批卡片期间页面仍能处理其他事件。
+    
+    Returns:
+        list: 创建的卡片列表
+    """
+    columns, count, pick = _bulk_setup(titles, bodies, images, ids, records, template, lightweight, style)
+    cards = []
+    for chunk in _bulk_chunks(columns, count, pick, chunk_size, chunk_growth, on_click):
+        cards.extend(chunk)
+        if target is not None:
+            _append_chunk(target, chunk)
+        await asyncio.sleep(0)
+    return cards
@@ -0,0 +1,379 @@
+# BaseComponents/colorEngine.py
+from functools import lru_cache
+from types import MappingProxyType
+
+from .themeManager import ThemePalette, THEME_ROLES
+
+__all__ = [
+    "TONES", "CONTRAST_PAIRS", "MIN_CONTRAST",
+    "parse_colors", "format_colors", "rgb_to_hsl", "hsl_to_rgb", "rgb_to_oklch", "oklch_to_rgb",
+    "relative_luminance", "contrast_ratio", "blend_colors", "readable_text_color",
+    "tonal_palette", "palette_contrast", "palettes_from_seed",
+]
+
+# numpy 在第一次使用颜色引擎时才导入（导入需要几十毫秒），参见 _require_numpy
+np = None
+
+
+# Material 风格色调板的默认色调（0 为黑，100 为白）
+TONES = (0, 4, 6, 10, 12, 20, 30, 40, 50, 60, 70, 80, 90, 95, 98, 99, 100)
+
+# 调色板中需要满足对比度要求的 (前景角色, 背景角色)
+CONTRAST_PAIRS = (
+    ("on_primary", "primary"),
+    ("on_secondary", "secondary"),
+    ("text_primary", "background"),
+    ("text_primary", "surface"),
+    ("text_secondary", "surface"),
+)
+
+# WCAG AA 正文文本的最低对比度
+MIN_CONTRAST = 4.5
+
+
+def _require_numpy():
+    """导入 numpy 并构建 OKLab 转换矩阵，只在第一次调用时执行"""
+    global np, _LINEAR_TO_LMS, _LMS_TO_OKLAB, _OKLAB_TO_LMS, _LMS_TO_LINEAR
+    if np is not None:
+        return
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("颜色引擎需要 numpy，请先安装: pip install numpy") from None
+    _LINEAR_TO_LMS = numpy.array(_LINEAR_TO_LMS_VALUES)
+    _LMS_TO_OKLAB = numpy.array(_LMS_TO_OKLAB_VALUES)
+    _OKLAB_TO_LMS = numpy.array(_OKLAB_TO_LMS_VALUES)
+    _LMS_TO_LINEAR = numpy.array(_LMS_TO_LINEAR_VALUES)
+    # 最后才设置 np，其他线程看到 np 时矩阵已经就绪
+    np = numpy
+
+
+def parse_colors(colors):
+    """批量解析十六进制颜色
+
+    Args:
+        colors: 颜色字符串或其列表，支持 "#RGB"、"#RRGGBB" 和 "#AARRGGBB"（忽略透明度）
+
+    Returns:
+        numpy.ndarray: 形状为 (n, 3) 的 sRGB 数组，取值范围 0-1
+    """
+    _require_numpy()
+    if isinstance(colors, str):
+        colors = [colors]
+    cleaned = []
+    for color in colors:
+        value = str(color).lstrip("#")
+        if len(value) == 3:
+            value = "".join(ch * 2 for ch in value)
+        elif len(value) == 8:
+            value = value[2:]
+        if len(value) != 6:
+            raise ValueError(f"无法解析的颜色: {color}")
+        cleaned.append(value)
+    packed = np.fromiter((int(value, 16) for value in cleaned), dtype=np.uint32, count=len(cleaned))
+    channels = np.stack([(packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF], axis=-1)
+    return channels.astype(np.float64) / 255.0
+
+
+def format_colors(rgb):
+    """把 sRGB 数组格式化为 "#RRGGBB" 字符串列表"""
+    _require_numpy()
+    channels = np.clip(np.rint(np.asarray(rgb, dtype=np.float64) * 255.0), 0, 255).astype(np.uint32)
+    channels = channels.reshape(-1, 3)
+    packed = (channels[:, 0] << 16) | (channels[:, 1] << 8) | channels[:, 2]
+    return [f"#{value:06X}" for value in packed.tolist()]
+
+
+def _as_rgb(colors):
+    """颜色字符串（列表）或 sRGB 数组统一转换为 (n, 3) 数组"""
+    if isinstance(colors, str) or (isinstance(colors, (list, tuple)) and colors and isinstance(colors[0], str)):
+        return parse_colors(colors)
+    return np.asarray(colors, dtype=np.float64).reshape(-1, 3)
+
+
+def rgb_to_hsl(rgb):
+    """sRGB 转 HSL，色相单位为度，饱和度和亮度取值 0-1"""
+    _require_numpy()
+    rgb = _as_rgb(rgb)
+    high = rgb.max(axis=-1)
+    low = rgb.min(axis=-1)
+    delta = high - low
+    lightness = (high + low) / 2.0
+    denominator = 1.0 - np.abs(2.0 * lightness - 1.0)
+    saturation = np.divide(delta, denominator, out=np.zeros_like(delta), where=denominator > 1e-12)
+
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    safe_delta = np.where(delta > 1e-12, delta, 1.0)
+    hue = np.select(
+        [delta <= 1e-12, high == r, high == g],
+        [0.0, ((g - b) / safe_delta) % 6.0, (b - r) / safe_delta + 2.0],
+        default=(r - g) / safe_delta + 4.0,
+    )
+    return np.stack([hue * 60.0, saturation, lightness], axis=-1)
+
+
+def hsl_to_rgb(hsl):
+    """HSL 转 sRGB"""
+    _require_numpy()
+    hsl = np.asarray(hsl, dtype=np.float64).reshape(-1, 3)
+    hue, saturation, lightness = hsl[:, 0] % 360.0, hsl[:, 1], hsl[:, 2]
+    chroma = (1.0 - np.abs(2.0 * lightness - 1.0)) * saturation
+    k = (np.array([0.0, 8.0, 4.0]) + hue[:, None] / 30.0) % 12.0
+    amount = chroma[:, None] / 2.0
+    return lightness[:, None] - amount * np.clip(np.minimum(k - 3.0, 9.0 - k), -1.0, 1.0)
+
+
+def _srgb_to_linear(rgb):
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def _linear_to_srgb(linear):
+    linear = np.clip(linear, 0.0, 1.0)
+    return np.where(linear <= 0.0031308, linear * 12.92, 1.055 * linear ** (1.0 / 2.4) - 0.055)
+
+
+# OKLab 转换矩阵，numpy 数组在 _require_numpy 中构建
+_LINEAR_TO_LMS_VALUES = (
+    (0.4122214708, 0.5363325363, 0.0514459929),
+    (0.2119034982, 0.6806995451, 0.1073969566),
+    (0.0883024619, 0.2817188376, 0.6299787005),
+)
+
+_LMS_TO_OKLAB_VALUES = (
+    (0.2104542553, 0.7936177850, -0.0040720468),
+    (1.9779984951, -2.4285922050, 0.4505937099),
+    (0.0259040371, 0.7827717662, -0.8086757660),
+)
+
+_OKLAB_TO_LMS_VALUES = (
+    (1.0, 0.3963377774, 0.2158037573),
+    (1.0, -0.1055613458, -0.0638541728),
+    (1.0, -0.0894841775, -1.2914855480),
+)
+
+_LMS_TO_LINEAR_VALUES = (
+    (4.0767416621, -3.3077115913, 0.2309699292),
+    (-1.2684380046, 2.6097574011, -0.3413193965),
+    (-0.0041960863, -0.7034186147, 1.7076147010),
+)
+
+_LINEAR_TO_LMS = _LMS_TO_OKLAB = _OKLAB_TO_LMS = _LMS_TO_LINEAR = None
+
+
+def _oklch_to_linear(lch):
+    """OKLCH 转线性 sRGB（不裁剪，用于色域判断）"""
+    lightness, chroma, hue = lch[:, 0], lch[:, 1], np.radians(lch[:, 2])
+    lab = np.stack([lightness, chroma * np.cos(hue), chroma * np.sin(hue)], axis=-1)
+    lms = (lab @ _OKLAB_TO_LMS.T) ** 3
+    return lms @ _LMS_TO_LINEAR.T
+
+
+def rgb_to_oklch(rgb):
+    """sRGB 转 OKLCH，返回 (L 0-1, C, 色相度数)"""
+    _require_numpy()
+    linear = _srgb_to_linear(_as_rgb(rgb))
+    lms = np.cbrt(linear @ _LINEAR_TO_LMS.T)
+    lab = lms @ _LMS_TO_OKLAB.T
+    chroma = np.hypot(lab[:, 1], lab[:, 2])
+    hue = np.degrees(np.arctan2(lab[:, 2], lab[:, 1])) % 360.0
+    return np.stack([lab[:, 0], chroma, hue], axis=-1)
+
+
+def oklch_to_rgb(lch):
+    """OKLCH 转 sRGB，超出色域的分量会被裁剪"""
+    _require_numpy()
+    lch = np.asarray(lch, dtype=np.float64).reshape(-1, 3)
+    return _linear_to_srgb(_oklch_to_linear(lch))
+
+
+def relative_luminance(rgb):
+    """WCAG 相对亮度"""
+    _require_numpy()
+    linear = _srgb_to_linear(_as_rgb(rgb))
+    return linear @ np.array([0.2126, 0.7152, 0.0722])
+
+
+def contrast_ratio(foreground, background):
+    """批量计算 WCAG 对比度，前景与背景按 NumPy 广播规则配对
+
+    Args:
+        foreground: 颜色字符串（列表）或 sRGB 数组
+        background: 颜色字符串（列表）或 sRGB 数组
+
+    Returns:
+        numpy.ndarray: 对比度，取值 1-21
+    """
+    _require_numpy()
+    fg = relative_luminance(foreground)
+    bg = relative_luminance(background)
+    lighter = np.maximum(fg, bg)
+    darker = np.minimum(fg, bg)
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+def blend_colors(base, overlay, amount):
+    """在 OKLab 空间中混合两组颜色，常用于悬停、禁用等派生色
+
+    Args:
+        base: 基础颜色
+        overlay: 叠加颜色
+        amount: 叠加比例 0-1，可以是数组
+
+    Returns:
+        list: "#RRGGBB" 字符串列表
+    """
+    _require_numpy()
+    lms_base = np.cbrt(_srgb_to_linear(_as_rgb(base)) @ _LINEAR_TO_LMS.T)
+    lms_overlay = np.cbrt(_srgb_to_linear(_as_rgb(overlay)) @ _LINEAR_TO_LMS.T)
+    amount = np.asarray(amount, dtype=np.float64).reshape(-1, 1)
+    lms = (lms_base * (1.0 - amount) + lms_overlay * amount) ** 3
+    return format_colors(_linear_to_srgb(lms @ _LMS_TO_LINEAR.T))
+
+
+def readable_text_color(backgrounds, candidates=("#FFFFFF", "#000000")):
+    """为每个背景色挑选对比度最高的文本颜色"""
+    _require_numpy()
+    ratios = contrast_ratio(_as_rgb(candidates)[:, None, :], _as_rgb(backgrounds)[None, :, :])
+    best = np.argmax(ratios.reshape(len(candidates), -1), axis=0)
+    return [candidates[index] for index in best.tolist()]
+
+
+def _tone_to_oklab_lightness(tones):
+    """把 CIE L* 色调换算为灰色在 OKLab 中的亮度，使色调差对应稳定的对比度"""
+    tones = np.asarray(tones, dtype=np.float64)
+    f = (tones + 16.0) / 116.0
+    luminance = np.where(tones > 8.0, f ** 3, tones / 903.2962962)
+    return np.cbrt(luminance)
+
+
+def _gamut_map(lightness, chroma, hue, steps=24):
+    """在保持亮度和色相的前提下，二分查找色域内的最大色度"""
+    low = np.zeros_like(chroma)
+    high = np.array(chroma, dtype=np.float64)
+    for _ in range(steps):
+        middle = (low + high) / 2.0
+        linear = _oklch_to_linear(np.stack([lightness, middle, hue], axis=-1))
+        inside = np.all((linear >= -1e-6) & (linear <= 1.0 + 1e-6), axis=-1)
+        low = np.where(inside, middle, low)
+        high = np.where(inside, high, middle)
+    return low
+
+
+def _tonal_palettes(seeds, tones):
+    """批量生成多条色调板，seeds 为 (n, 3) 的 OKLCH 数组"""
+    tones = np.asarray(tones, dtype=np.float64)
+    count = len(seeds)
+    lightness = np.tile(_tone_to_oklab_lightness(tones), count)
+    chroma = np.repeat(seeds[:, 1], len(tones))
+    hue = np.repeat(seeds[:, 2], len(tones))
+    chroma = _gamut_map(lightness, chroma, hue)
+    hexes = format_colors(oklch_to_rgb(np.stack([lightness, chroma, hue], axis=-1)))
+    return [
+        MappingProxyType(dict(zip(tones.astype(int).tolist(), hexes[i * len(tones):(i + 1) * len(tones)])))
+        for i in range(count)
+    ]
+
+
+@lru_cache(maxsize=256)
+def _normalize_seed(seed):
+    """把种子颜色统一成 "#RRGGBB"，使 "#abc" 与 "#AABBCC" 共用同一份缓存"""
+    return format_colors(parse_colors(seed))[0]
+
+
+@lru_cache(maxsize=64)
+def _cached_tonal_palette(seed, tones, chroma_scale, hue_shift):
+    lch = rgb_to_oklch(seed)
+    lch[:, 1] *= chroma_scale
+    lch[:, 2] = (lch[:, 2] + hue_shift) % 360.0
+    return _tonal_palettes(lch, tones)[0]
+
+
+def tonal_palette(seed, tones=TONES, chroma_scale=1.0, hue_shift=0.0):
+    """由种子颜色生成 Material 风格的色调板（结果按参数缓存）
+
+    Args:
+        seed: 种子颜色，例如 "#2196F3"
+        tones: 需要生成的色调，0 为黑，100 为白
+        chroma_scale: 色度缩放系数
+        hue_shift: 色相偏移（度）
+
+    Returns:
+        Mapping: 色调到 "#RRGGBB" 的只读映射
+    """
+    _require_numpy()
+    return _cached_tonal_palette(_normalize_seed(seed), tuple(tones), float(chroma_scale), float(hue_shift))
+
+
+def palette_contrast(palette, pairs=CONTRAST_PAIRS):
+    """一次性计算调色板中各组前景/背景的对比度
+
+    Returns:
+        dict: {(前景角色, 背景角色): 对比度}
+    """
+    _require_numpy()
+    ratios = contrast_ratio(
+        [palette[foreground] for foreground, _ in pairs],
+        [palette[background] for _, background in pairs],
+    )
+    return dict(zip(pairs, ratios.tolist()))
+
+
+def _ensure_contrast(roles, min_contrast):
+    """对比度不足的前景角色改用黑白中对比度更高的颜色"""
+    ratios = palette_contrast(roles)
+    for (foreground, background), ratio in ratios.items():
+        if ratio < min_contrast and foreground.startswith("on_"):
+            roles[foreground] = readable_text_color([roles[background]])[0]
+    return roles
+
+
+@lru_cache(maxsize=32)
+def _cached_palettes_from_seed(seed, min_contrast):
+    seed_lch = rgb_to_oklch(seed)[0]
+    # 主色、次要色（同色相、低色度）、中性色、中性变体色四条色调板一次生成
+    seeds = np.array([
+        seed_lch,
+        [seed_lch[0], seed_lch[1] / 3.0, seed_lch[2]],
+        [seed_lch[0], min(seed_lch[1], 0.012), seed_lch[2]],
+        [seed_lch[0], min(seed_lch[1], 0.03), seed_lch[2]],
+    ])
+    primary, secondary, neutral, neutral_variant = _tonal_palettes(seeds, TONES)
+
+    light = _ensure_contrast({
+        "background": neutral[98],
+        "surface": neutral[100],
+        "primary": primary[40],
+        "on_primary": primary[100],
+        "secondary": secondary[40],
+        "on_secondary": secondary[100],
+        "text_primary": neutral[10],
+        "text_secondary": neutral_variant[30],
+    }, min_contrast)
+    dark = _ensure_contrast({
+        "background": neutral[6],
+        "surface": neutral[12],
+        "primary": primary[80],
+        "on_primary": primary[20],
+        "secondary": secondary[80],
+        "on_secondary": secondary[20],
+        "text_primary": neutral[90],
+        "text_secondary": neutral_variant[80],
+    }, min_contrast)
+    return MappingProxyType({
+        "light": ThemePalette(**{role: light[role] for role in THEME_ROLES}),
+        "dark": ThemePalette(**{role: dark[role] for role in THEME_ROLES}),
+    })
+
+
+def palettes_from_seed(seed, min_contrast=MIN_CONTRAST):
+    """由一个品牌色生成完整的浅色与深色调色板（结果按种子缓存）
+
+    Args:
+        seed: 品牌色，例如 "#6750A4"
+        min_contrast: on_primary 等前景色相对背景的最低对比度
+
+    Returns:
+        Mapping: {"light": ThemePalette, "dark": ThemePalette}
+    """
+    _require_numpy()
+    return _cached_palettes_from_seed(_normalize_seed(seed), float(min_contrast))
@@ -0,0 +1,444 @@
+# BaseComponents/eventScheduler.py
+import asyncio
+import contextvars
+import threading
+import time
+import traceback
+
+from .themeManager import ThemeRegistry, _current_session_page
+
+# 后台线程空闲这么久（秒）之后退出，下次有请求时重新启动，
+# 因此不再使用的调度器不会留下常驻线程
+_IDLE_TIMEOUT = 1.0
+
+
+class FrameScheduler:
+    """帧节流调度器
+
+    把任意线程或 asyncio 任务中的多次 request() 合并为每个帧间隔最多一次
+    回调。回调在调度器自己的后台线程中执行，适合把高频数据变化合并为
+    一次 update() 发送给客户端。
+
+    回调在创建调度器时的上下文中执行，因此能看到创建时所在的 Flet 页面
+    会话（例如 get_theme_manager() 返回该会话的主题管理器）。后台线程
+    空闲一段时间后退出，有新的请求时再启动。
+    """
+
+    def __init__(self, callback, interval=1 / 30, name="frame-scheduler"):
+        """
+        Args:
+            callback: 每帧执行一次的无参回调
+            interval: 两次回调之间的最短间隔（秒）
+            name: 后台线程名称
+        """
+        self.callback = callback
+        self.interval = interval
+        self.name = name
+        self._condition = threading.Condition()
+        self._pending = False
+        self._closed = False
+        self._thread = None
+        self._last_run = 0.0
+        self._context = contextvars.copy_context()
+
+    def request(self):
+        """请求在下一帧执行回调，同一帧内的多次请求只执行一次"""
+        with self._condition:
+            if self._closed or self._pending:
+                return
+            self._pending = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            else:
+                self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    if not self._condition.wait(_IDLE_TIMEOUT) and not self._pending:
+                        self._thread = None
+                        return
+                if self._closed:
+                    return
+                # 距离上次回调不足一个帧间隔时先等待，期间的请求都会并入这一帧
+                delay = self._last_run + self.interval - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    if self._closed:
+                        return
+                self._pending = False
+                self._last_run = time.monotonic()
+            try:
+                self._context.run(self.callback)
+            except Exception:
+                traceback.print_exc()
+
+    def close(self):
+        """停止调度器，尚未执行的请求会被丢弃"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+
+class Debouncer:
+    """防抖调度器
+
+    连续的 call() 只在最后一次调用之后安静 delay 秒才执行一次回调，参数取
+    最后一次调用的参数。适合窗口拖动、输入框输入等短时间内连续触发、
+    只关心最终状态的事件。
+
+    与 FrameScheduler 相同，回调在调度器自己的后台线程中、创建时的上下文里执行，
+    后台线程空闲一段时间后退出。
+    """
+
+    def __init__(self, callback, delay=0.15, max_wait=None, name="debouncer"):
+        """
+        Args:
+            callback: 回调函数，参数为最后一次 call() 的参数
+            delay: 最后一次调用之后需要等待的安静时间（秒）
+            max_wait: 连续调用时两次回调之间的最长间隔（秒），为 None 时不限制
+            name: 后台线程名称
+        """
+        self.callback = callback
+        self.delay = delay
+        self.max_wait = max_wait
+        self.name = name
+        self._condition = threading.Condition()
+        self._args = None
+        self._deadline = None
+        self._first_call = None
+        self._closed = False
+        self._thread = None
+        self._context = contextvars.copy_context()
+
+    @property
+    def pending(self):
+        """是否有尚未执行的调用"""
+        return self._deadline is not None
+
+    def call(self, *args, **kwargs):
+        """登记一次调用，重新开始计算安静时间"""
+        with self._condition:
+            if self._closed:
+                return
+            now = time.monotonic()
+            if self._deadline is None:
+                self._first_call = now
+            self._args = (args, kwargs)
+            self._deadline = now + self.delay
+            if self.max_wait is not None:
+                self._deadline = min(self._deadline, self._first_call + self.max_wait)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            else:
+                self._condition.notify()
+
+    def _take(self):
+        args, kwargs = self._args
+        self._args = None
+        self._deadline = None
+        return args, kwargs
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._deadline is None:
+                        if not self._condition.wait(_IDLE_TIMEOUT) and self._deadline is None:
+                            self._thread = None
+                            return
+                        continue
+                    delay = self._deadline - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._condition.wait(delay)
+                if self._closed:
+                    return
+                args, kwargs = self._take()
+            try:
+                self._context.run(self.callback, *args, **kwargs)
+            except Exception:
+                traceback.print_exc()
+
+    def flush(self):
+        """立即在当前线程执行尚未执行的调用
+
+        Returns:
+            bool: 是否执行了回调
+        """
+        with self._condition:
+            if self._deadline is None:
+                return False
+            args, kwargs = self._take()
+        self.callback(*args, **kwargs)
+        return True
+
+    def cancel(self):
+        """丢弃尚未执行的调用"""
+        with self._condition:
+            self._args = None
+            self._deadline = None
+
+    def close(self):
+        """停止调度器，尚未执行的调用会被丢弃"""
+        with self._condition:
+            self._closed = True
+            self._args = None
+            self._deadline = None
+            self._condition.notify()
+
+
+class Throttler:
+    """节流调度器
+
+    每个间隔内最多执行一次回调，参数取间隔内最后一次 call() 的参数。
+    与 Debouncer 不同，连续调用期间也会按间隔持续执行，适合悬停、拖动等
+    需要跟随状态变化、但不需要处理每一个事件的场景。
+
+    回调在调度器自己的后台线程中、创建时的上下文里执行。
+    """
+
+    def __init__(self, callback, interval=0.1, name="throttler"):
+        """
+        Args:
+            callback: 回调函数，参数为间隔内最后一次 call() 的参数
+            interval: 两次回调之间的最短间隔（秒）
+            name: 后台线程名称
+        """
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._args = None
+        self._scheduler = FrameScheduler(self._run, interval, name)
+
+    @property
+    def interval(self):
+        return self._scheduler.interval
+
+    def call(self, *args, **kwargs):
+        """登记一次调用，距离上次回调不足一个间隔时与之后的调用合并"""
+        with self._lock:
+            self._args = (args, kwargs)
+        self._scheduler.request()
+
+    def _run(self):
+        with self._lock:
+            pending = self._args
+            self._args = None
+        if pending is not None:
+            args, kwargs = pending
+            self.callback(*args, **kwargs)
+
+    def cancel(self):
+        """丢弃尚未执行的调用"""
+        with self._lock:
+            self._args = None
+
+    def close(self):
+        """停止调度器，尚未执行的调用会被丢弃"""
+        with self._lock:
+            self._args = None
+        self._scheduler.close()
+
+
+class UpdateBatcher:
+    """控件更新合并器
+
+    mark() 登记属性已修改、需要发送给客户端的控件，每个间隔按页面合并为
+    一次 page.update(*controls)：同一控件被多次登记只更新一次，祖先也在
+    待更新列表中的控件由祖先的更新一并发送。
+    """
+
+    def __init__(self, interval=1 / 30, name="update-batcher"):
+        """
+        Args:
+            interval: 两次批量更新之间的最短间隔（秒）
+            name: 后台线程名称
+        """
+        self._lock = threading.Lock()
+        self._controls = {}
+        self.update_count = 0
+        self._scheduler = FrameScheduler(self.flush, interval, name)
+
+    def mark(self, *controls):
+        """登记需要更新的控件，在下一个间隔发送"""
+        with self._lock:
+            for control in controls:
+                self._controls[id(control)] = control
+        self._scheduler.request()
+
+    def flush(self):
+        """立即发送所有已登记的更新"""
+        with self._lock:
+            controls = list(self._controls.values())
+            self._controls.clear()
+        if controls:
+            self.update_count += 1
+            ThemeRegistry.update_controls(controls)
+
+    def close(self):
+        """停止合并器，尚未发送的更新会被丢弃"""
+        with self._lock:
+            self._controls.clear()
+        self._scheduler.close()
+
+
+class _EventCoalescer:
+    """按间隔合并事件的共享调度器，同一会话中使用相同间隔的处理函数共用一个后台线程"""
+
+    def __init__(self, interval):
+        self._lock = threading.Lock()
+        self._latest = {}
+        self._scheduler = FrameScheduler(self._deliver, interval, name="coalesced-events")
+
+    def submit(self, handler, e):
+        with self._lock:
+            self._latest[(id(handler), id(e.control), e.name)] = (handler, e)
+        self._scheduler.request()
+
+    def _deliver(self):
+        with self._lock:
+            events = list(self._latest.values())
+            self._latest.clear()
+        for handler, event in events:
+            try:
+                handler(event)
+            except Exception:
+                traceback.print_exc()
+
+
+# 页面上保存会话级共享调度器的属性名
+_SESSION_SCHEDULERS_ATTR = "_base_components_schedulers"
+# 不在任何页面会话中时使用的共享调度器
+_global_schedulers = {}
+_schedulers_lock = threading.Lock()
+
+
+def _session_scheduler(key, factory):
+    """获取当前页面会话的共享调度器，不存在时调用 factory 创建
+
+    调度器的回调在创建时的上下文中执行，多个会话共用一个调度器会让所有回调
+    看到第一个会话的页面，因此每个会话各有一份，保存在页面上，随页面一起回收。
+    不在任何会话中时使用模块级的一份。
+    """
+    page = _current_session_page()
+    with _schedulers_lock:
+        if page is None:
+            schedulers = _global_schedulers
+        else:
+            schedulers = getattr(page, _SESSION_SCHEDULERS_ATTR, None)
+            if schedulers is None:
+                schedulers = {}
+                setattr(page, _SESSION_SCHEDULERS_ATTR, schedulers)
+        scheduler = schedulers.get(key)
+        if scheduler is None:
+            scheduler = schedulers[key] = factory()
+        return scheduler
+
+
+def _get_coalescer(interval):
+    return _session_scheduler(("coalesced-events", interval), lambda: _EventCoalescer(interval))
+
+
+def coalesce_events(handler, interval=0.1):
+    """把事件处理函数包装为按控件合并的节流版本
+
+    每个间隔内，同一控件的同一事件只把最后一次交给 handler（例如悬停时
+    快速进出只处理最终状态），不同控件的事件互不影响。相同间隔的所有包装
+    函数（每个页面会话一份）共用一个后台线程，handler 在该线程中、包装函数
+    所属会话的上下文里执行；包装函数本身不持有线程，
+    可以随控件一起被回收。
+
+    Args:
+        handler: 事件处理函数，参数为事件对象
+        interval: 两次处理之间的最短间隔（秒）
+
+    Returns:
+        function: 可以直接赋值给 on_hover、on_long_press 等属性的处理函数
+    """
+    coalescer = _get_coalescer(interval)
+
+    def on_event(e):
+        coalescer.submit(handler, e)
+
+    return on_event
+
+
+class LatestTaskRunner:
+    """只保留最新一次调用的异步任务运行器
+
+    每次 run() 都会取消仍在进行的上一次调用，并在页面的事件循环中开始新的调用；
+    调用完成时只有最新一次的结果会交给 on_result，较早开始但较晚完成的结果
+    被丢弃。适合搜索、校验等输入变化时需要重新计算、只关心最终结果的场景。
+
+    可以在任意线程中调用 run()，同步和异步的 Flet 应用都适用。
+    """
+
+    def __init__(self):
+        self.started = 0
+        self.completed = 0
+        self.cancelled = 0
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._future = None
+
+    @property
+    def running(self):
+        """是否有正在进行的调用"""
+        future = self._future
+        return future is not None and not future.done()
+
+    def run(self, page, function, *args, on_result=None):
+        """取消上一次调用，在页面的事件循环中开始新的调用
+
+        Args:
+            page: ft.Page 实例
+            function: 异步函数，或同步函数（在线程池中执行，结果同样只保留最新一次）
+            *args: 调用参数
+            on_result: 结果回调，参数为函数的返回值，只对最新一次调用执行
+
+        Returns:
+            concurrent.futures.Future: 本次调用的任务
+        """
+        with self._lock:
+            self._sequence += 1
+            sequence = self._sequence
+            previous = self._future
+            if previous is not None and previous.cancel():
+                self.cancelled += 1
+            self.started += 1
+            self._future = future = page.run_task(self._call, sequence, function, args, on_result)
+        return future
+
+    async def _call(self, sequence, function, args, on_result):
+        try:
+            if asyncio.iscoroutinefunction(function):
+                result = await function(*args)
+            else:
+                result = await asyncio.to_thread(function, *args)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            traceback.print_exc()
+            return None
+        self.completed += 1
+        if sequence != self._sequence:
+            # 同步函数无法被取消，过期的结果在这里丢弃
+            return None
+        if on_result is not None:
+            try:
+                on_result(result)
+            except Exception:
+                traceback.print_exc()
+        return result
+
+    def cancel(self):
+        """取消正在进行的调用，之后完成的结果都会被丢弃"""
+        with self._lock:
+            self._sequence += 1
+            future = self._future
+            self._future = None
+            if future is not None and future.cancel():
+                self.cancelled += 1
@@ -0,0 +1,269 @@
+# BaseComponents/gridComponents.py
+import threading
+from collections import OrderedDict
+
+import flet as ft
+
+from .eventScheduler import Debouncer
+from .layoutComponents import BREAKPOINTS, breakpoint_for
+from .virtualComponents import VirtualListView
+
+# 与 main.py 中 ResponsiveRow 的 col={"xs": 12, "sm": 6, "md": 4} 相同的列数，大屏再增加一列
+DEFAULT_GRID_COLUMNS = {"xs": 1, "sm": 2, "md": 3, "xl": 4}
+
+
+class VirtualCardGrid:
+    """虚拟化卡片网格
+
+    按断点计算列数，把卡片分组为行，交给 VirtualListView 只创建可见区域附近的行。
+    行控件在滚动时被复用，行内的卡片:
+    - 提供 card_binder 时，行被复用后原有的卡片直接重新绑定到新数据项，多余的
+      卡片放入容量为 pool_size 的回收池，需要时从池中取出
+    - 未提供 card_binder 时，最近构建的 pool_size 张卡片按数据项缓存，
+      滚动回来时直接复用
+
+    指定 page 时监听 page.on_resized（经过防抖），列数变化后重新分组并发送一次更新。
+    """
+
+    def __init__(
+        self,
+        card_builder,
+        items=None,
+        item_count=None,
+        card_binder=None,
+        columns=None,
+        row_height=180,
+        spacing=10,
+        run_spacing=10,
+        page=None,
+        width=None,
+        breakpoints=BREAKPOINTS,
+        pool_size=256,
+        debounce=0.15,
+        **kwargs
+    ):
+        """
+        Args:
+            card_builder: 创建卡片的函数，参数为数据项（传入 items 时）或索引
+            items: 可索引的数据源（支持 len() 和下标访问）
+            item_count: 卡片数量，未传入 items 时必须指定
+            card_binder: 把已有卡片重新绑定到另一数据项的函数，参数为 (卡片, 数据项或索引)
+            columns: 列数，可以是整数或 断点名称 -> 列数 的映射，默认 DEFAULT_GRID_COLUMNS
+            row_height: 行高（像素）
+            spacing: 同一行中卡片之间的间距
+            run_spacing: 行之间的间距
+            page: ft.Page 实例，指定时按窗口宽度自动调整列数
+            width: 用于计算列数的初始宽度，默认取 page.width
+            breakpoints: 断点名称 -> 最小宽度
+            pool_size: 回收池（或卡片缓存）的容量
+            debounce: 尺寸变化事件的防抖时间（秒）
+            **kwargs: 其他参数，参见 VirtualListView
+        """
+        if items is None and item_count is None:
+            raise ValueError("必须指定 item_count 或 items")
+        self.card_builder = card_builder
+        self.card_binder = card_binder
+        self.items = items
+        self._item_count = item_count
+        self.columns_spec = columns if columns is not None else DEFAULT_GRID_COLUMNS
+        self.breakpoints = dict(breakpoints)
+        self.row_height = row_height
+        self.spacing = spacing
+        self.pool_size = pool_size
+        self.build_count = 0
+
+        self._lock = threading.RLock()
+        self._pool = []
+        self._cards = OrderedDict()
+        self._spacers = []
+        self._page = None
+        self._previous_handler = None
+        self._debouncer = Debouncer(self.set_width, debounce, name="card-grid")
+
+        if width is None and page is not None:
+            width = page.width
+        self.columns = self.columns_for(width or 1200)
+        self.view = VirtualListView(
+            self._build_row,
+            item_count=self._row_count(),
+            item_binder=self._bind_row,
+            estimated_extent=row_height + run_spacing,
+            spacing=run_spacing,
+            **kwargs
+        )
+        self.control = self.view.control
+        if page is not None:
+            self.attach(page)
+
+    @property
+    def item_count(self):
+        """当前卡片数量"""
+        if self.items is not None:
+            return len(self.items)
+        return self._item_count
+
+    def columns_for(self, width):
+        """返回指定宽度下的列数"""
+        spec = self.columns_spec
+        if isinstance(spec, int):
+            return max(1, spec)
+        breakpoint = breakpoint_for(width, self.breakpoints)
+        min_width = self.breakpoints[breakpoint]
+        # 未指定的断点沿用较小断点的列数
+        defined = sorted(spec, key=self.breakpoints.get)
+        columns = spec[defined[0]]
+        for name in defined:
+            if self.breakpoints[name] <= min_width:
+                columns = spec[name]
+        return max(1, columns)
+
+    def _row_count(self):
+        return -(-self.item_count // self.columns)
+
+    def _item(self, index):
+        return self.items[index] if self.items is not None else index
+
+    def _new_card(self, index):
+        card = self.card_builder(self._item(index))
+        if not card.expand:
+            card.expand = 1
+        self.build_count += 1
+        return card
+
+    def _recycle(self, card):
+        if len(self._pool) < self.pool_size:
+            self._pool.append(card)
+
+    def _cached_card(self, index):
+        card = self._cards.get(index)
+        if card is None:
+            card = self._cards[index] = self._new_card(index)
+            if len(self._cards) > self.pool_size:
+                self._cards.popitem(last=False)
+        else:
+            self._cards.move_to_end(index)
+        return card
+
+    def _build_row(self, row_index):
+        row = ft.Row(spacing=self.spacing, vertical_alignment=ft.CrossAxisAlignment.STRETCH)
+        self._bind_row(row, row_index)
+        return row
+
+    def _bind_row(self, row, row_index):
+        """把行绑定到第 row_index 行，行内原有的卡片按顺序重新绑定"""
+        columns = self.columns
+        start = row_index * columns
+        indexes = range(start, min(start + columns, self.item_count))
+        old_cards = [control for control in row.controls if not _is_spacer(control)]
+        spacers = [control for control in row.controls if _is_spacer(control)]
+
+        cards = []
+        if self.card_binder is not None:
+            old_cards.reverse()
+            for index in indexes:
+                if old_cards:
+                    card = old_cards.pop()
+                elif self._pool:
+                    card = self._pool.pop()
+                else:
+                    cards.append(self._new_card(index))
+                    continue
+                self.card_binder(card, self._item(index))
+                cards.append(card)
+            for card in old_cards:
+                self._recycle(card)
+        else:
+            cards = [self._cached_card(index) for index in indexes]
+
+        # 最后一行不满时用占位容器补齐，保持卡片宽度一致
+        missing = columns - len(cards)
+        while len(spacers) < missing:
+            spacers.append(ft.Container(expand=1, data=_SPACER))
+        row.controls = cards + spacers[:missing]
+        row.height = self.row_height
+
+    def set_width(self, width):
+        """按宽度重新计算列数，列数变化时重新分组并发送一次更新
+
+        Returns:
+            bool: 列数是否变化
+        """
+        with self._lock:
+            columns = self.columns_for(width)
+            if columns == self.columns:
+                return False
+            self.columns = columns
+            self.view.refresh(self._row_count())
+            return True
+
+    def refresh(self):
+        """数据变化后重新绑定已创建的卡片"""
+        with self._lock:
+            self._cards.clear()
+            self.view.refresh(self._row_count())
+
+    def set_items(self, items):
+        """替换数据源并刷新"""
+        self.items = items
+        self.refresh()
+
+    def scroll_to_item(self, index, duration=0):
+        """滚动到指定卡片所在的行"""
+        self.view.scroll_to_index(index // self.columns, duration)
+
+    def _on_resized(self, e):
+        self._debouncer.call(e.width)
+        if self._previous_handler is not None:
+            self._previous_handler(e)
+
+    def attach(self, page):
+        """监听页面尺寸变化，页面原有的 on_resized 处理函数仍会被调用"""
+        if self._page is page:
+            return
+        self.detach()
+        self._page = page
+        self._previous_handler = page.on_resized
+        page.on_resized = self._on_resized
+
+    def detach(self):
+        """停止监听页面尺寸变化"""
+        self._debouncer.cancel()
+        page = self._page
+        if page is not None and page.on_resized == self._on_resized:
+            page.on_resized = self._previous_handler
+        self._page = None
+        self._previous_handler = None
+
+
+# 标记补齐最后一行的占位容器
+_SPACER = "base_components_grid_spacer"
+
+
+def _is_spacer(control):
+    return type(control) is ft.Container and control.data == _SPACER
+
+
+def card_grid(card_builder, items=None, item_count=None, card_binder=None, columns=None, row_height=180, **kwargs):
+    """创建虚拟化卡片网格的便捷函数
+
+    Args:
+        card_builder: 创建卡片的函数，参数为数据项（传入 items 时）或索引
+        items: 可索引的数据源
+        item_count: 卡片数量
+        card_binder: 把已有卡片重新绑定到另一数据项的函数，参数为 (卡片, 数据项或索引)
+        columns: 列数，可以是整数或 断点名称 -> 列数 的映射
+        row_height: 行高（像素）
+        **kwargs: 其他参数，参见 VirtualCardGrid
+
+    Returns:
+        VirtualCardGrid: 卡片网格，把 grid.control 添加到页面
+    """
+    return VirtualCardGrid(
+        card_builder,
+        items=items,
+        item_count=item_count,
+        card_binder=card_binder,
+        columns=columns,
+        row_height=row_height,
+        **kwargs
+    )
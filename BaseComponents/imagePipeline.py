@@ -0,0 +1,540 @@
+# BaseComponents/imagePipeline.py
+import asyncio
+import base64
+import hashlib
+import io
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+
+import flet as ft
+
+from .eventScheduler import FrameScheduler
+from .themeManager import bind_theme, get_theme_colors
+
+__all__ = [
+    "PLACEHOLDER_BASE64", "DEFAULT_CACHE_DIR", "is_local_image", "ImageService",
+    "get_image_service", "set_image_service", "thumbnail_image", "lazy_image",
+    "load_lazy_image", "LazyImageLoader",
+]
+
+# 缩略图尚未生成时显示的 1x1 透明 PNG
+PLACEHOLDER_BASE64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+# 默认的缩略图磁盘缓存目录
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "flet_basecomponents", "thumbnails")
+
+
+@lru_cache(maxsize=None)
+def _load_pillow():
+    """第一次生成缩略图时才导入 Pillow（可选依赖），未安装时返回 None"""
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        return None
+    return Image, ImageOps
+
+
+def _require_pillow():
+    """返回 (Image, ImageOps) 模块，未安装 Pillow 时抛出 ImportError"""
+    modules = _load_pillow()
+    if modules is None:
+        raise ImportError("生成缩略图需要 Pillow，请先安装: pip install pillow")
+    return modules
+
+
+def is_local_image(src):
+    """src 是否为本地图片文件（网络地址和 Flet 资源路径不处理）"""
+    return isinstance(src, (str, os.PathLike)) and os.path.isfile(src)
+
+
+class ImageService:
+    """本地图片缩略图服务
+
+    - 在线程池中用 Pillow 解码并缩放图片，不阻塞事件处理
+    - 以文件内容的哈希和目标尺寸为键，缩略图保存在容量受限的磁盘 LRU 缓存中，
+      文件内容不变时即使改名或移动也能命中
+    - base64 编码结果按文件路径、修改时间和目标尺寸保存在内存 LRU 缓存中
+    - 同一缩略图正在生成时，后续请求等待同一个任务
+    """
+
+    def __init__(
+        self,
+        cache_dir=DEFAULT_CACHE_DIR,
+        memory_items=256,
+        disk_bytes=200 * 1024 * 1024,
+        max_workers=4,
+        quality=85,
+        scale=1.0
+    ):
+        """
+        Args:
+            cache_dir: 磁盘缓存目录，为 None 时只使用内存缓存
+            memory_items: 内存中最多缓存的 base64 缩略图数量
+            disk_bytes: 磁盘缓存的最大总字节数
+            max_workers: 解码线程数
+            quality: JPEG 压缩质量
+            scale: 像素密度倍数，例如高分屏使用 2 生成两倍尺寸的缩略图
+        """
+        self.cache_dir = cache_dir
+        self.memory_items = memory_items
+        self.disk_bytes = disk_bytes
+        self.quality = quality
+        self.scale = scale
+        self.generated_count = 0
+
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._hashes = OrderedDict()
+        self._inflight = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-service")
+        self._disk = OrderedDict()
+        self._disk_total = 0
+        if cache_dir is not None:
+            self._scan_disk()
+
+    def _scan_disk(self):
+        """按修改时间从旧到新登记已有的磁盘缓存文件"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, entry.name, stat.st_size))
+        for _, name, size in sorted(entries):
+            self._disk[name] = size
+            self._disk_total += size
+
+    def _content_hash(self, path):
+        """文件内容的哈希，按修改时间和大小缓存，文件未变化时不重新读取"""
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._hashes.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+        content_hash = digest.hexdigest()
+        with self._lock:
+            self._hashes[path] = (signature, content_hash)
+            if len(self._hashes) > 4096:
+                self._hashes.popitem(last=False)
+        return content_hash
+
+    def _target_size(self, width, height):
+        # 只指定一边时另一边不限制，缩放保持原始比例
+        bound = 1 << 16
+        return (
+            int(width * self.scale) if width else bound,
+            int(height * self.scale) if height else bound,
+        )
+
+    def _remember(self, key, encoded):
+        with self._lock:
+            self._memory[key] = encoded
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+
+    def _read_disk(self, name):
+        if self.cache_dir is None:
+            return None
+        with self._lock:
+            if name not in self._disk:
+                return None
+            self._disk.move_to_end(name)
+        path = os.path.join(self.cache_dir, name)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self._disk_total -= self._disk.pop(name, 0)
+            return None
+        return data
+
+    def _write_disk(self, name, data):
+        if self.cache_dir is None:
+            return
+        path = os.path.join(self.cache_dir, name)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            return
+        evicted = []
+        with self._lock:
+            self._disk_total += len(data) - self._disk.pop(name, 0)
+            self._disk[name] = len(data)
+            while self._disk_total > self.disk_bytes and len(self._disk) > 1:
+                old_name, size = self._disk.popitem(last=False)
+                self._disk_total -= size
+                evicted.append(old_name)
+        for old_name in evicted:
+            try:
+                os.remove(os.path.join(self.cache_dir, old_name))
+            except OSError:
+                pass
+
+    def _render(self, path, size):
+        """解码并缩放图片，返回编码后的字节和扩展名"""
+        Image, ImageOps = _require_pillow()
+        with Image.open(path) as image:
+            # JPEG 可以在解码时直接按 1/2、1/4、1/8 缩小，大图的解码开销显著降低
+            image.draft("RGB", size)
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail(size, Image.LANCZOS)
+            output = io.BytesIO()
+            has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+            if has_alpha:
+                image.save(output, "PNG", optimize=True)
+                return output.getvalue(), "png"
+            image.convert("RGB").save(output, "JPEG", quality=self.quality, optimize=True)
+            return output.getvalue(), "jpg"
+
+    def _produce(self, path, width, height, key):
+        try:
+            content_hash = self._content_hash(path)
+            size = self._target_size(width, height)
+            stem = f"{content_hash}_{size[0]}x{size[1]}_{self.quality}"
+            data = None
+            for extension in ("jpg", "png"):
+                data = self._read_disk(f"{stem}.{extension}")
+                if data is not None:
+                    break
+            if data is None:
+                data, extension = self._render(path, size)
+                self._write_disk(f"{stem}.{extension}", data)
+                self.generated_count += 1
+            encoded = base64.b64encode(data).decode("ascii")
+            self._remember(key, encoded)
+            return encoded
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _key(self, path, width, height):
+        stat = os.stat(path)
+        return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, width, height)
+
+    def cached(self, path, width=None, height=None):
+        """只查询内存缓存，命中时返回 base64 字符串，否则返回 None"""
+        key = self._key(path, width, height)
+        with self._lock:
+            encoded = self._memory.get(key)
+            if encoded is not None:
+                self._memory.move_to_end(key)
+            return encoded
+
+    def submit(self, path, width=None, height=None):
+        """在线程池中生成缩略图
+
+        Args:
+            path: 本地图片路径
+            width: 目标宽度（像素），为 None 时按高度等比缩放
+            height: 目标高度（像素），为 None 时按宽度等比缩放
+
+        Returns:
+            concurrent.futures.Future: 结果为缩略图的 base64 字符串
+        """
+        _require_pillow()
+        key = self._key(path, width, height)
+        with self._lock:
+            encoded = self._memory.get(key)
+            if encoded is not None:
+                self._memory.move_to_end(key)
+                future = Future()
+                future.set_result(encoded)
+                return future
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._executor.submit(self._produce, path, width, height, key)
+                self._inflight[key] = future
+            return future
+
+    def thumbnail_base64(self, path, width=None, height=None):
+        """生成缩略图并等待结果，返回 base64 字符串"""
+        return self.cached(path, width, height) or self.submit(path, width, height).result()
+
+    async def thumbnail_base64_async(self, path, width=None, height=None):
+        """在 asyncio 任务中等待缩略图，返回 base64 字符串"""
+        encoded = self.cached(path, width, height)
+        if encoded is not None:
+            return encoded
+        return await asyncio.wrap_future(self.submit(path, width, height))
+
+    def clear(self, disk=False):
+        """清空内存缓存
+
+        Args:
+            disk: 是否同时删除磁盘缓存文件
+        """
+        with self._lock:
+            self._memory.clear()
+            names = list(self._disk) if disk else []
+            if disk:
+                self._disk.clear()
+                self._disk_total = 0
+        for name in names:
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except OSError:
+                pass
+
+    def shutdown(self):
+        """停止解码线程池"""
+        self._executor.shutdown(wait=False)
+
+
+_default_service = None
+_default_service_lock = threading.Lock()
+
+
+def get_image_service():
+    """获取默认的缩略图服务，第一次调用时创建"""
+    global _default_service
+    with _default_service_lock:
+        if _default_service is None:
+            _default_service = ImageService()
+        return _default_service
+
+
+def set_image_service(service):
+    """替换默认的缩略图服务，例如使用其他缓存目录或容量"""
+    global _default_service
+    with _default_service_lock:
+        _default_service = service
+
+
+def _apply_thumbnail(image, src, future):
+    """缩略图生成后替换占位图，失败时退回原图"""
+    try:
+        image.src_base64 = future.result()
+        image.src = None
+    except Exception:
+        image.src_base64 = None
+        image.src = src
+    if image.page is not None:
+        image.update()
+
+
+def thumbnail_image(src, width=None, height=None, service=None, **kwargs):
+    """创建显示本地图片缩略图的 ft.Image
+
+    内存缓存命中时直接使用缩略图；否则先显示透明占位图，缩略图在线程池中
+    生成后替换并更新控件。src 不是本地文件（例如网络地址）或未安装 Pillow 时按原样显示。
+
+    Args:
+        src: 图片路径或地址
+        width: 显示宽度，也是缩略图的目标宽度
+        height: 显示高度，也是缩略图的目标高度
+        service: ImageService 实例，默认使用 get_image_service()
+        **kwargs: 其他 ft.Image 参数
+
+    Returns:
+        ft.Image: 图片控件
+    """
+    if not is_local_image(src) or _load_pillow() is None:
+        # Pillow 是可选依赖，未安装时不生成缩略图
+        return ft.Image(src=src, width=width, height=height, **kwargs)
+    service = service or get_image_service()
+    encoded = service.cached(src, width, height)
+    if encoded is not None:
+        return ft.Image(src_base64=encoded, width=width, height=height, **kwargs)
+
+    image = ft.Image(src_base64=PLACEHOLDER_BASE64, width=width, height=height, **kwargs)
+    service.submit(src, width, height).add_done_callback(
+        lambda future: _apply_thumbnail(image, src, future)
+    )
+    return image
+
+
+# 在占位容器上保存待加载图片参数的属性名
+_LAZY_ATTR = "_base_components_lazy_image"
+
+
+def lazy_image(src, height, width=None, fit=ft.ImageFit.COVER, thumbnail=False, placeholder_role="background"):
+    """创建延迟加载的图片位置
+
+    返回固定高度的主题化占位容器，图片控件在 LazyImageLoader 判断其接近
+    可见区域时才创建并赋值 src。
+
+    Args:
+        src: 图片路径或地址
+        height: 图片高度（占位容器的高度）
+        width: 图片宽度
+        fit: 图片适应模式
+        thumbnail: 加载时是否对本地图片使用缩略图，参见 thumbnail_image
+        placeholder_role: 占位背景使用的颜色角色
+
+    Returns:
+        ft.Container: 占位容器
+    """
+    colors = get_theme_colors()
+    slot = ft.Container(height=height, width=width, bgcolor=getattr(colors, placeholder_role))
+    bind_theme(slot, bgcolor=placeholder_role)
+    setattr(slot, _LAZY_ATTR, (src, width, height, fit, thumbnail))
+    return slot
+
+
+def load_lazy_image(slot):
+    """立即为占位容器创建图片控件（不发送更新）
+
+    Returns:
+        bool: 是否创建了图片，已加载或不是延迟图片时返回 False
+    """
+    spec = getattr(slot, _LAZY_ATTR, None)
+    if spec is None:
+        return False
+    src, width, height, fit, thumbnail = spec
+    setattr(slot, _LAZY_ATTR, None)
+    if thumbnail:
+        slot.content = thumbnail_image(src, width=width, height=height, fit=fit)
+    else:
+        slot.content = ft.Image(src=src, width=width, height=height, fit=fit)
+    return True
+
+
+def _find_lazy_slots(control, found):
+    if getattr(control, _LAZY_ATTR, None) is not None:
+        found.append(control)
+    for child in control._get_children():
+        _find_lazy_slots(child, found)
+    return found
+
+
+class LazyImageLoader:
+    """按滚动位置延迟加载图片
+
+    监听可滚动列布局的 on_scroll，根据滚动偏移估算每个顶层子控件的位置，
+    只为进入可见区域前后 margin 像素范围内的延迟图片（lazy_image）创建
+    图片控件。滚动事件先记录最新位置，由帧调度器每个间隔最多处理一次，
+    同一帧内加载的图片在一次 update() 中发送。
+
+    位置按子控件在列表中的比例估算（滚动范围 x 序号 / 子控件数），
+    子控件高度大致相同时足够准确。
+    """
+
+    def __init__(self, column, margin=600, viewport_height=800, estimated_extent=250, interval=1 / 20):
+        """
+        Args:
+            column: 可滚动的 ft.Column 或 ft.ListView
+            margin: 可见区域前后提前加载的像素范围
+            viewport_height: 收到第一次滚动事件之前假定的可见区域高度
+            estimated_extent: 收到第一次滚动事件之前估计的子控件高度
+            interval: 两次加载之间的最短间隔（秒）
+        """
+        self.column = column
+        self.margin = margin
+        self.viewport_height = viewport_height
+        self.estimated_extent = estimated_extent
+        self.load_count = 0
+        self.update_count = 0
+
+        self._lock = threading.Lock()
+        self._scroll = None
+        self._pending = {}
+        self._previous_handler = column.on_scroll
+        self._scheduler = FrameScheduler(self._flush, interval, name="lazy-images")
+        column.on_scroll = self._on_scroll
+        self.refresh()
+        # 首屏的图片在添加到页面之前直接加载，不需要额外的更新
+        self._load_range(0, viewport_height + margin)
+
+    def refresh(self, controls=None):
+        """登记列布局中的延迟图片，子控件增删后调用
+
+        已经收到过滚动事件时，按最新的滚动位置立即安排一次加载，
+        追加到可见区域附近的图片不需要等到下一次滚动。
+
+        Args:
+            controls: 新追加的顶层子控件，只扫描这些控件；为 None 时重新扫描
+                整个列布局（删除或替换了子控件之后使用）
+        """
+        pending = {}
+        for control in self.column.controls if controls is None else controls:
+            slots = _find_lazy_slots(control, [])
+            if slots:
+                pending[id(control)] = (control, slots)
+        with self._lock:
+            if controls is None:
+                self._pending = pending
+            else:
+                self._pending.update(pending)
+            scrolled = self._scroll is not None
+        if scrolled:
+            self._scheduler.request()
+
+    @property
+    def pending_count(self):
+        """尚未加载的图片数"""
+        return sum(len(slots) for _, slots in self._pending.values())
+
+    def _on_scroll(self, e):
+        with self._lock:
+            self._scroll = (e.pixels, e.max_scroll_extent, e.viewport_dimension)
+        self._scheduler.request()
+        if self._previous_handler is not None:
+            self._previous_handler(e)
+
+    def _load_range(self, top, bottom, extent=None):
+        """加载估计位置在 [top, bottom] 范围内的子控件中的图片，返回加载了图片的子控件"""
+        controls = self.column.controls
+        count = len(controls)
+        if not count:
+            return []
+        if extent is None:
+            extent = self.estimated_extent * count
+        with self._lock:
+            if not self._pending:
+                return []
+            loaded = []
+            for index, control in enumerate(controls):
+                entry = self._pending.get(id(control))
+                if entry is None:
+                    continue
+                start = extent * index / count
+                if start + extent / count < top or start > bottom:
+                    continue
+                del self._pending[id(control)]
+                for slot in entry[1]:
+                    if load_lazy_image(slot):
+                        self.load_count += 1
+                        loaded.append(slot)
+            return loaded
+
+    def _flush(self):
+        with self._lock:
+            scroll = self._scroll
+        if scroll is None:
+            return
+        pixels, max_extent, viewport = scroll
+        if pixels is None or max_extent is None:
+            return
+        viewport = viewport or self.viewport_height
+        loaded = self._load_range(
+            pixels - self.margin,
+            pixels + viewport + self.margin,
+            extent=max_extent + viewport,
+        )
+        page = self.column.page
+        if loaded and page is not None:
+            self.update_count += 1
+            page.update(*loaded)
+
+    def close(self):
+        """停止加载并恢复原来的 on_scroll 处理函数"""
+        self._scheduler.close()
+        if self.column.on_scroll == self._on_scroll:
+            self.column.on_scroll = self._previous_handler
@@ -1,30 +1,122 @@
 # BaseComponents/inputComponents.py
+import asyncio
+import weakref
+
 import flet as ft
-from .themeManager import get_theme_colors
+from .eventScheduler import Debouncer, LatestTaskRunner, Throttler
+from .themeManager import get_theme_colors, bind_theme
+
+
+class _TextChangeDispatcher:
+    """text_field 的 on_change 处理函数：防抖 / 节流后分发处理函数和校验函数
+
+    只以弱引用持有输入框，调度器的后台线程空闲后退出，输入框被丢弃后可以正常回收；
+    输入框已从页面移除时，尚未执行的输入和仍在进行的调用都会被丢弃。
+    """
+
+    def __init__(self, field, on_change, debounce, throttle, validator, on_validated):
+        self._field = weakref.ref(field)
+        self.on_change = on_change
+        self.validator = validator
+        self.on_validated = on_validated
+        self.handler_runner = LatestTaskRunner()
+        self.validator_runner = LatestTaskRunner()
+        if debounce:
+            # 同时指定 throttle 时，连续输入期间最多每 throttle 秒处理一次
+            self.scheduler = Debouncer(self.dispatch, debounce, max_wait=throttle, name="text-field")
+        elif throttle:
+            self.scheduler = Throttler(self.dispatch, throttle, name="text-field")
+        else:
+            self.scheduler = None
 
+    def __call__(self, e):
+        if self.scheduler is None:
+            self.dispatch(e)
+        else:
+            self.scheduler.call(e)
 
-def text_field(label, hint_text=None, on_change=None, width=None):
+    def cancel(self):
+        """丢弃尚未执行的输入，取消仍在进行的处理函数和校验函数"""
+        if self.scheduler is not None:
+            self.scheduler.cancel()
+        self.handler_runner.cancel()
+        self.validator_runner.cancel()
+
+    def dispatch(self, e):
+        field = self._field()
+        page = field.page if field is not None else None
+        if page is None:
+            # 输入框已从页面移除
+            self.cancel()
+            return
+        if self.on_change is not None:
+            if asyncio.iscoroutinefunction(self.on_change):
+                self.handler_runner.run(page, self.on_change, e)
+            else:
+                self.on_change(e)
+        if self.validator is not None:
+            self.validator_runner.run(page, self.validator, field.value, on_result=self.apply)
+
+    def apply(self, result):
+        """应用最新一次校验的结果，只发送一次更新"""
+        field = self._field()
+        if field is None:
+            return
+        if self.on_validated is not None:
+            self.on_validated(result)
+            page = field.page
+            if page is not None:
+                page.update()
+            return
+        field.error_text = result or None
+        if field.page is not None:
+            field.update()
+
+
+def text_field(
+    label,
+    hint_text=None,
+    on_change=None,
+    width=None,
+    debounce=None,
+    throttle=None,
+    validator=None,
+    on_validated=None
+):
     """
     创建一个文本输入框
 
     Args:
         label (str): 输入框标签
         hint_text (str, optional): 提示文本
-        on_change (callable): 内容改变事件处理函数
+        on_change (callable): 内容改变事件处理函数，可以是异步函数：新的输入到达时，
+            仍在进行的上一次调用会被取消
         width (int, optional): 输入框宽度
+        debounce (float, optional): 防抖时间（秒），停止输入这么久之后才处理最后一次输入
+        throttle (float, optional): 节流间隔（秒），连续输入期间最多每隔这么久处理一次；
+            与 debounce 同时指定时作为防抖的最长等待时间
+        validator (callable, optional): 校验函数（同步或异步），参数为输入框的值。
+            新的输入到达时仍在进行的校验会被取消，只有最新一次的结果会被应用：
+            默认把返回值作为 error_text（返回 None 表示通过）并更新输入框
+        on_validated (callable, optional): 自定义结果的应用方式，参数为最新一次校验的结果，
+            可以修改任意控件，之后发送一次页面更新
 
     Returns:
         ft.TextField: 配置好的文本输入框组件
     """
     colors = get_theme_colors()
-    return ft.TextField(
+    field = ft.TextField(
         label=label,
         hint_text=hint_text,
-        on_change=on_change,
         width=width,
-        color=colors["text_primary"],
-        border_color=colors["primary"],
+        color=colors.text_primary,
+        border_color=colors.primary,
     )
+    if debounce or throttle or validator is not None or asyncio.iscoroutinefunction(on_change):
+        field.on_change = _TextChangeDispatcher(field, on_change, debounce, throttle, validator, on_validated)
+    else:
+        field.on_change = on_change
+    return bind_theme(field, color="text_primary", border_color="primary")
 
 
 def dropdown(label, options, on_change=None, width=None):
@@ -41,14 +133,15 @@ def dropdown(label, options, on_change=None, width=None):
         ft.Dropdown: 配置好的下拉选择框组件
     """
     colors = get_theme_colors()
-    return ft.Dropdown(
+    control = ft.Dropdown(
         label=label,
         options=[ft.dropdown.Option(option) for option in options],
         on_change=on_change,
         width=width,
-        color=colors["text_primary"],
-        border_color=colors["primary"],
+        color=colors.text_primary,
+        border_color=colors.primary,
     )
+    return bind_theme(control, color="text_primary", border_color="primary")
 
 
 def checkbox(label, value=False, on_change=None):
@@ -64,9 +157,10 @@ def checkbox(label, value=False, on_change=None):
         ft.Checkbox: 配置好的复选框组件
     """
     colors = get_theme_colors()
-    return ft.Checkbox(
+    control = ft.Checkbox(
         label=label,
         value=value,
         on_change=on_change,
-        fill_color=colors["primary"],
-    )
\ No newline at end of file
+        fill_color=colors.primary,
+    )
+    return bind_theme(control, fill_color="primary")
\ No newline at end of file
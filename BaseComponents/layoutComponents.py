@@ -1,5 +1,11 @@
 # BaseComponents/layoutComponents.py
+import threading
+
 import flet as ft
+from .eventScheduler import Debouncer
+from .imagePipeline import LazyImageLoader
+from .treeOptimizer import flatten_tree
+from .virtualComponents import VirtualListView
 
 
 class ScrollablePage:
@@ -14,6 +20,8 @@ class ScrollablePage:
         spacing=10,
         padding=20,
         auto_scroll=False,
+        flatten=False,
+        lazy_images=False,
         **kwargs
     ):
         """
@@ -27,6 +35,10 @@ class ScrollablePage:
             spacing: 控件间距
             padding: 页面内边距
             auto_scroll: 是否自动滚动到底部
+            flatten: 是否压平内容中多余的包装容器，参见 flatten_tree
+            lazy_images: 是否按滚动位置延迟加载内容中的 lazy_image（例如 image_card(..., lazy=True)），
+                参见 LazyImageLoader。加载器保存在返回控件（以及其中列布局）的 lazy_loader 属性上，
+                创建之后追加的内容需要调用 lazy_loader.refresh(新追加的控件) 登记，不再需要时调用 lazy_loader.close()
             **kwargs: 其他参数
             
         Returns:
@@ -46,16 +58,58 @@ class ScrollablePage:
             auto_scroll=auto_scroll,
             **kwargs
         )
+        if flatten:
+            flatten_tree(scrollable_column)
+        if lazy_images:
+            scrollable_column.lazy_loader = LazyImageLoader(scrollable_column)
         
         # 如果指定了padding，则将其包装在一个容器中
         if padding:
-            return ft.Container(
+            container = ft.Container(
                 content=scrollable_column,
                 padding=padding
             )
+            if lazy_images:
+                container.lazy_loader = scrollable_column.lazy_loader
+            return container
         
         return scrollable_column
 
+    @staticmethod
+    def create_virtual(
+        item_builder,
+        item_count=None,
+        items=None,
+        item_binder=None,
+        item_extent=None,
+        padding=20,
+        **kwargs
+    ):
+        """
+        创建一个虚拟化的可滚动页面布局，只创建可见区域附近的行
+        
+        Args:
+            item_builder: 创建行控件的函数，参数为数据项（传入 items 时）或行索引
+            item_count: 行数
+            items: 可索引的数据源
+            item_binder: 把已有行控件重新绑定到另一行的函数，用于滚动时复用控件
+            item_extent: 固定行高，不指定时按估计行高换算滚动位置
+            padding: 页面内边距
+            **kwargs: 其他参数，参见 VirtualListView
+            
+        Returns:
+            VirtualListView: 虚拟化列表，把 view.control 添加到页面
+        """
+        return VirtualListView(
+            item_builder,
+            item_count=item_count,
+            items=items,
+            item_binder=item_binder,
+            item_extent=item_extent,
+            padding=padding,
+            **kwargs
+        )
+
 
 def scrollable_page(
     content,
@@ -65,6 +119,8 @@ def scrollable_page(
     spacing=10,
     padding=20,
     auto_scroll=False,
+    flatten=False,
+    lazy_images=False,
     **kwargs
 ):
     """
@@ -78,6 +134,8 @@ def scrollable_page(
         spacing: 控件间距
         padding: 页面内边距
         auto_scroll: 是否自动滚动到底部
+        flatten: 是否压平内容中多余的包装容器
+        lazy_images: 是否按滚动位置延迟加载内容中的 lazy_image，加载器保存在返回控件的 lazy_loader 属性上
         **kwargs: 其他参数
         
     Returns:
@@ -91,10 +149,218 @@ def scrollable_page(
         spacing=spacing,
         padding=padding,
         auto_scroll=auto_scroll,
+        flatten=flatten,
+        lazy_images=lazy_images,
+        **kwargs
+    )
+
+
+def virtual_scrollable_page(
+    item_builder,
+    item_count=None,
+    items=None,
+    item_binder=None,
+    item_extent=None,
+    padding=20,
+    **kwargs
+):
+    """
+    创建虚拟化可滚动页面布局的便捷函数，参见 ScrollablePage.create_virtual
+    
+    Returns:
+        VirtualListView: 虚拟化列表，把 view.control 添加到页面
+    """
+    return ScrollablePage.create_virtual(
+        item_builder,
+        item_count=item_count,
+        items=items,
+        item_binder=item_binder,
+        item_extent=item_extent,
+        padding=padding,
         **kwargs
     )
 
 
+# 断点名称 -> 最小宽度（像素），与 Bootstrap 的断点一致
+BREAKPOINTS = {
+    "xs": 0,
+    "sm": 576,
+    "md": 768,
+    "lg": 992,
+    "xl": 1200,
+    "xxl": 1400,
+}
+
+
+def breakpoint_for(width, breakpoints=BREAKPOINTS):
+    """返回宽度所属的断点名称
+
+    Args:
+        width: 宽度（像素）
+        breakpoints: 断点名称 -> 最小宽度
+
+    Returns:
+        str: 最小宽度不超过 width 的最大断点
+    """
+    ordered = sorted(breakpoints.items(), key=lambda item: item[1])
+    name = ordered[0][0]
+    for candidate, min_width in ordered:
+        if width >= min_width:
+            name = candidate
+    return name
+
+
+class BreakpointLayout:
+    """按断点切换布局的响应式容器
+
+    为部分断点提供布局构建函数，未提供的断点使用比它小的最近断点的布局
+    （移动优先），比所有已提供断点都小时使用最小的那个。
+
+    - 窗口尺寸变化事件经过防抖合并，拖动窗口边缘时只在停下后处理最后的宽度
+    - 只有生效的布局发生变化时才替换内容并发送一次更新
+    - 每个布局的控件树只构建一次并按断点缓存，切换回来时直接复用
+    """
+
+    def __init__(
+        self,
+        builders,
+        page=None,
+        width=None,
+        breakpoints=BREAKPOINTS,
+        debounce=0.15,
+        on_change=None,
+        expand=True,
+        alignment=ft.alignment.top_left,
+        **kwargs
+    ):
+        """
+        Args:
+            builders: 断点名称 -> 布局构建函数（无参，返回控件）或控件
+            page: ft.Page 实例，指定时自动监听 page.on_resized
+            width: 初始宽度，默认取 page.width；都不可用时使用最大的已提供断点
+            breakpoints: 断点名称 -> 最小宽度
+            debounce: 尺寸变化事件的防抖时间（秒）
+            on_change: 布局切换后的回调，参数为当前断点名称
+            expand: 是否扩展填充
+            alignment: 对齐方式
+            **kwargs: 其他 ft.Container 参数
+        """
+        unknown = set(builders) - set(breakpoints)
+        if not builders or unknown:
+            raise ValueError(f"builders 必须是非空的 {{断点名称: 布局}} 映射，未知断点: {sorted(unknown)}")
+        self.builders = dict(builders)
+        self.breakpoints = dict(breakpoints)
+        self.on_change = on_change
+        self.breakpoint = None
+        self.layout_key = None
+        self.build_count = 0
+        self.switch_count = 0
+
+        self._cache = {}
+        self._lock = threading.RLock()
+        self._page = None
+        self._previous_handler = None
+        self._debouncer = Debouncer(self.set_width, debounce, name="responsive-layout")
+
+        self.control = ft.Container(expand=expand, alignment=alignment, **kwargs)
+        if width is None and page is not None:
+            width = page.width
+        if width:
+            breakpoint = breakpoint_for(width, self.breakpoints)
+            self._apply(breakpoint, self.layout_for(breakpoint))
+        else:
+            largest = max(self.builders, key=self.breakpoints.get)
+            self._apply(largest, largest)
+        if page is not None:
+            self.attach(page)
+
+    def layout_for(self, breakpoint):
+        """返回断点实际使用的布局所对应的断点名称"""
+        min_width = self.breakpoints[breakpoint]
+        defined = sorted(self.builders, key=self.breakpoints.get)
+        key = defined[0]
+        for candidate in defined:
+            if self.breakpoints[candidate] <= min_width:
+                key = candidate
+        return key
+
+    def _build(self, key):
+        control = self._cache.get(key)
+        if control is None:
+            builder = self.builders[key]
+            control = builder() if callable(builder) else builder
+            self._cache[key] = control
+            self.build_count += 1
+        return control
+
+    def _apply(self, breakpoint, key):
+        self.breakpoint = breakpoint
+        if key == self.layout_key:
+            return False
+        self.layout_key = key
+        self.control.content = self._build(key)
+        return True
+
+    def set_width(self, width):
+        """按宽度选择布局，生效的布局变化时替换内容并发送一次更新
+
+        Args:
+            width: 宽度（像素）
+
+        Returns:
+            bool: 是否切换了布局
+        """
+        with self._lock:
+            breakpoint = breakpoint_for(width, self.breakpoints)
+            if not self._apply(breakpoint, self.layout_for(breakpoint)):
+                return False
+            self.switch_count += 1
+            if self.control.page is not None:
+                self.control.update()
+        if self.on_change is not None:
+            self.on_change(breakpoint)
+        return True
+
+    def _on_resized(self, e):
+        self._debouncer.call(e.width)
+        if self._previous_handler is not None:
+            self._previous_handler(e)
+
+    def attach(self, page):
+        """监听页面尺寸变化，页面原有的 on_resized 处理函数仍会被调用
+
+        Args:
+            page: ft.Page 实例
+        """
+        if self._page is page:
+            return
+        self.detach()
+        self._page = page
+        self._previous_handler = page.on_resized
+        page.on_resized = self._on_resized
+
+    def detach(self):
+        """停止监听页面尺寸变化，并丢弃尚未处理的尺寸变化事件"""
+        self._debouncer.cancel()
+        page = self._page
+        if page is not None and page.on_resized == self._on_resized:
+            page.on_resized = self._previous_handler
+        self._page = None
+        self._previous_handler = None
+
+    def invalidate(self, breakpoint=None):
+        """清除缓存的布局，下次切换到该布局时重新构建
+
+        Args:
+            breakpoint: 要清除的断点名称，为 None 时清除全部（当前显示的布局除外）
+        """
+        with self._lock:
+            keys = [self.layout_for(breakpoint)] if breakpoint is not None else list(self._cache)
+            for key in keys:
+                if key != self.layout_key:
+                    self._cache.pop(key, None)
+
+
 class ResponsiveLayout:
     """响应式布局组件"""
     
@@ -132,6 +398,38 @@ class ResponsiveLayout:
         
         return container
 
+    @staticmethod
+    def create_adaptive(
+        builders,
+        page=None,
+        width=None,
+        debounce=0.15,
+        on_change=None,
+        **kwargs
+    ):
+        """
+        创建一个按断点切换布局的响应式容器
+        
+        Args:
+            builders: 断点名称（xs/sm/md/lg/xl/xxl）-> 布局构建函数或控件
+            page: ft.Page 实例，指定时自动监听 page.on_resized
+            width: 初始宽度，默认取 page.width
+            debounce: 尺寸变化事件的防抖时间（秒）
+            on_change: 布局切换后的回调，参数为当前断点名称
+            **kwargs: 其他参数，参见 BreakpointLayout
+            
+        Returns:
+            BreakpointLayout: 响应式布局，把 layout.control 添加到页面
+        """
+        return BreakpointLayout(
+            builders,
+            page=page,
+            width=width,
+            debounce=debounce,
+            on_change=on_change,
+            **kwargs
+        )
+
 
 def responsive_layout(
     content,
@@ -162,4 +460,21 @@ def responsive_layout(
         expand=expand,
         alignment=alignment,
         **kwargs
+    )
+
+
+def adaptive_layout(builders, page=None, width=None, debounce=0.15, on_change=None, **kwargs):
+    """
+    创建按断点切换布局的响应式容器的便捷函数，参见 ResponsiveLayout.create_adaptive
+    
+    Returns:
+        BreakpointLayout: 响应式布局，把 layout.control 添加到页面
+    """
+    return ResponsiveLayout.create_adaptive(
+        builders,
+        page=page,
+        width=width,
+        debounce=debounce,
+        on_change=on_change,
+        **kwargs
     )
\ No newline at end of file
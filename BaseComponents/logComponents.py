@@ -0,0 +1,187 @@
+# BaseComponents/logComponents.py
+import threading
+from collections import deque
+
+import flet as ft
+
+from .eventScheduler import FrameScheduler
+from .layoutComponents import ScrollablePage
+from .textComponents import BaseText
+
+
+class LogView:
+    """流式日志组件
+
+    在 ScrollablePage 中显示最近 capacity 行日志:
+    - 固定容量的环形缓冲区，超出容量的旧行被淘汰，内存占用有上限
+    - 追加的行先放入待显示队列，每个帧间隔最多发送一次 update()
+    - 被淘汰行的文本控件会被复用来显示新行，不再为每行创建新控件
+    - append / extend / write 可以在任意线程或 asyncio 任务中调用
+    """
+
+    def __init__(
+        self,
+        capacity=500,
+        interval=1 / 30,
+        size=14,
+        color=None,
+        font_family=None,
+        selectable=True,
+        auto_scroll=True,
+        spacing=0,
+        padding=10,
+        **kwargs
+    ):
+        """
+        Args:
+            capacity: 最多保留的行数
+            interval: 两次界面更新之间的最短间隔（秒）
+            size: 字体大小
+            color: 字体颜色，默认使用主题中的主要文本颜色
+            font_family: 字体，例如 "monospace"
+            selectable: 文本是否可选中
+            auto_scroll: 是否自动滚动到底部
+            spacing: 行间距
+            padding: 内边距
+            **kwargs: 传递给 ScrollablePage.create 的其他参数
+        """
+        if capacity < 1:
+            raise ValueError("capacity 必须大于 0")
+        self.capacity = capacity
+        self.size = size
+        self.color = color
+        self.font_family = font_family
+        self.selectable = selectable
+        self.lines = deque(maxlen=capacity)
+        self.flush_count = 0
+
+        self._pending = deque(maxlen=capacity)
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._partial = ""
+        self._scheduler = FrameScheduler(self.flush, interval, name="log-view")
+
+        self.control = ScrollablePage.create(
+            [],
+            spacing=spacing,
+            padding=padding,
+            auto_scroll=auto_scroll,
+            **kwargs
+        )
+        # 有内边距时 ScrollablePage 返回包裹列布局的容器
+        self.column = self.control.content if isinstance(self.control, ft.Container) else self.control
+
+    def append(self, line):
+        """追加一行日志"""
+        line = str(line)
+        with self._pending_lock:
+            self._pending.append(line)
+            self.lines.append(line)
+        self._scheduler.request()
+
+    def extend(self, lines):
+        """追加多行日志"""
+        lines = [str(line) for line in lines]
+        if not lines:
+            return
+        with self._pending_lock:
+            self._pending.extend(lines)
+            self.lines.extend(lines)
+        self._scheduler.request()
+
+    def write(self, text):
+        """按换行符拆分追加文本，可以作为 print(file=...) 或 logging.StreamHandler 的输出流
+
+        Returns:
+            int: 写入的字符数
+        """
+        with self._pending_lock:
+            parts = (self._partial + text).split("\n")
+            self._partial = parts.pop()
+        self.extend(parts)
+        return len(text)
+
+    def clear(self):
+        """清空所有日志行"""
+        with self._pending_lock:
+            self._pending.clear()
+            self.lines.clear()
+            self._partial = ""
+        with self._flush_lock:
+            self.column.controls.clear()
+        self._update()
+
+    def _create_line(self, line):
+        text_control = BaseText.create_text(line, size=self.size, color=self.color)
+        text_control.font_family = self.font_family
+        text_control.selectable = self.selectable
+        return text_control
+
+    def flush(self):
+        """立即把待显示的行应用到控件并发送一次更新（通常由帧调度器调用）"""
+        with self._pending_lock:
+            if not self._pending:
+                return
+            pending = list(self._pending)
+            self._pending.clear()
+
+        with self._flush_lock:
+            controls = self.column.controls
+            # 待显示的行本身超过容量时，前面的行会立刻被淘汰，只需显示最后 capacity 行
+            overflow = len(controls) + len(pending) - self.capacity
+            recycled = []
+            if overflow > 0:
+                recycled = controls[:overflow]
+                del controls[:overflow]
+
+            new_controls = []
+            for line in pending:
+                if recycled:
+                    text_control = recycled.pop()
+                    text_control.value = line
+                else:
+                    text_control = self._create_line(line)
+                new_controls.append(text_control)
+            controls.extend(new_controls)
+            self.flush_count += 1
+            self._update()
+
+            # Flet 把移动到末尾的控件当作先删除再添加，更新后会清空它们的 parent 和 page，
+            # 这里恢复引用，使主题切换等按页面分组的更新仍能找到这些控件
+            page = self.column.page
+            if page is not None:
+                for text_control in new_controls:
+                    text_control.parent = self.column
+                    text_control.page = page
+
+    def _update(self):
+        if self.column.page is not None:
+            self.column.update()
+
+    def close(self):
+        """停止后台更新线程"""
+        self._scheduler.close()
+
+
+def log_view(capacity=500, interval=1 / 30, size=14, color=None, font_family=None, **kwargs):
+    """创建流式日志组件的便捷函数
+
+    Args:
+        capacity: 最多保留的行数
+        interval: 两次界面更新之间的最短间隔（秒）
+        size: 字体大小
+        color: 字体颜色
+        font_family: 字体
+        **kwargs: 其他参数，参见 LogView
+
+    Returns:
+        LogView: 日志组件，把 log.control 添加到页面后调用 log.append(...) 追加日志
+    """
+    return LogView(
+        capacity=capacity,
+        interval=interval,
+        size=size,
+        color=color,
+        font_family=font_family,
+        **kwargs
+    )
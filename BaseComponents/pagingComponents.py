@@ -0,0 +1,295 @@
+# BaseComponents/pagingComponents.py
+import asyncio
+import threading
+import traceback
+from collections import OrderedDict
+
+import flet as ft
+
+from .layoutComponents import ScrollablePage
+
+
+class PagedDataSource:
+    """异步分页数据源
+
+    包装一个异步的分页读取函数:
+    - 同一页正在读取时，后续请求等待同一个读取任务，不会重复访问数据库
+    - 已读取的页放入容量固定的 LRU 缓存，重新进入页面或重置列表时直接复用
+
+    数据源可以被多个 InfiniteScrollPage 共享，但所有读取需要在同一个事件循环中进行。
+    """
+
+    def __init__(self, fetch_page, page_size=20, cache_size=32):
+        """
+        Args:
+            fetch_page: 异步读取函数 async fetch_page(page_index, page_size)，返回该页的数据项列表；
+                返回的数据项少于 page_size 表示没有更多数据
+            page_size: 每页的数据项数量
+            cache_size: 最多缓存的页数，为 0 时不缓存
+        """
+        if not asyncio.iscoroutinefunction(fetch_page):
+            raise TypeError("fetch_page 必须是异步函数（async def）")
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.cache_size = cache_size
+        self.fetch_count = 0
+        self._cache = OrderedDict()
+        self._inflight = {}
+
+    async def get_page(self, page_index):
+        """读取一页数据，优先使用缓存和正在进行的读取
+
+        Args:
+            page_index: 页码，从 0 开始
+
+        Returns:
+            list: 该页的数据项
+        """
+        items = self._cache.get(page_index)
+        if items is not None:
+            self._cache.move_to_end(page_index)
+            return items
+
+        task = self._inflight.get(page_index)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(page_index))
+            self._inflight[page_index] = task
+        # 一个等待者被取消时不影响同一页的其他等待者
+        return await asyncio.shield(task)
+
+    async def _fetch(self, page_index):
+        try:
+            self.fetch_count += 1
+            items = list(await self.fetch_page(page_index, self.page_size))
+        finally:
+            self._inflight.pop(page_index, None)
+        if self.cache_size > 0:
+            self._cache[page_index] = items
+            self._cache.move_to_end(page_index)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return items
+
+    def invalidate(self, page_index=None):
+        """清除缓存的页
+
+        Args:
+            page_index: 要清除的页码，为 None 时清除全部
+        """
+        if page_index is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(page_index, None)
+
+
+class InfiniteScrollPage:
+    """无限滚动页面组件
+
+    基于 ScrollablePage 的列布局和 ft.Column.on_scroll，滚动位置距离底部不足
+    threshold 像素时在页面的事件循环中读取后续页:
+    - 加载进行中时的滚动事件会被忽略，同一页不会被重复读取
+    - 一次加载的所有页（prefetch_pages）读取完成后，新行在一次 update() 中追加
+    - 读取失败时保留已加载的内容，下次滚动到底部时重试
+    """
+
+    def __init__(
+        self,
+        fetch_page,
+        item_builder,
+        page_size=20,
+        threshold=300,
+        prefetch_pages=1,
+        cache_size=32,
+        scroll_interval=100,
+        on_error=None,
+        spacing=10,
+        padding=20,
+        **kwargs
+    ):
+        """
+        Args:
+            fetch_page: 异步读取函数 async fetch_page(page_index, page_size)，也可以传入 PagedDataSource
+            item_builder: 创建行控件的函数，参数为数据项
+            page_size: 每页的数据项数量（传入 PagedDataSource 时忽略）
+            threshold: 距离底部多少像素时开始加载下一批
+            prefetch_pages: 每次加载的页数
+            cache_size: 最多缓存的页数（传入 PagedDataSource 时忽略）
+            scroll_interval: 滚动事件的最短间隔（毫秒）
+            on_error: 读取失败时的回调，参数为异常对象，默认打印异常
+            spacing: 控件间距
+            padding: 页面内边距
+            **kwargs: 传递给 ScrollablePage.create 的其他参数
+        """
+        if isinstance(fetch_page, PagedDataSource):
+            self.source = fetch_page
+        else:
+            self.source = PagedDataSource(fetch_page, page_size, cache_size)
+        self.item_builder = item_builder
+        self.threshold = threshold
+        self.prefetch_pages = max(1, prefetch_pages)
+        self.on_error = on_error
+        self.next_page = 0
+        self.exhausted = False
+        self.error = None
+        self.update_count = 0
+
+        self._loading = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+        self.control = ScrollablePage.create(
+            [],
+            spacing=spacing,
+            padding=padding,
+            on_scroll=self._on_scroll,
+            on_scroll_interval=scroll_interval,
+            **kwargs
+        )
+        # 有内边距时 ScrollablePage 返回包裹列布局的容器
+        self.column = self.control.content if isinstance(self.control, ft.Container) else self.control
+
+    @property
+    def loading(self):
+        """是否有正在进行的加载"""
+        return self._loading is not None
+
+    def _on_scroll(self, e):
+        if self.exhausted or self._loading is not None:
+            return
+        if e.max_scroll_extent is None or e.pixels is None:
+            return
+        if e.max_scroll_extent - e.pixels <= self.threshold:
+            self.start()
+
+    def start(self):
+        """在页面的事件循环中加载下一批数据，控件尚未添加到页面时不执行任何操作
+
+        Returns:
+            concurrent.futures.Future: 加载任务，控件不在页面上时为 None
+        """
+        page = self.column.page
+        if page is None:
+            return None
+        return page.run_task(self.load_more)
+
+    async def load_more(self):
+        """加载下一批数据并追加到列表，加载进行中时等待同一次加载
+
+        控件尚未添加到页面时也可以调用，用于在显示之前预先加载第一批数据。
+
+        Returns:
+            int: 本次追加的行数
+        """
+        with self._lock:
+            task = self._loading
+            if task is None:
+                if self.exhausted:
+                    return 0
+                task = self._loading = asyncio.ensure_future(self._load(self._generation))
+        return await asyncio.shield(task)
+
+    async def _load(self, generation):
+        try:
+            return await self._load_pages(generation)
+        finally:
+            # 任务被取消或构建行时出错也要清除加载标记，否则之后不会再加载
+            with self._lock:
+                self._finish()
+
+    async def _load_pages(self, generation):
+        first = self.next_page
+        indexes = range(first, first + self.prefetch_pages)
+        try:
+            results = await asyncio.gather(*(self.source.get_page(index) for index in indexes))
+        except Exception as error:
+            with self._lock:
+                self._finish()
+            self.error = error
+            if self.on_error is not None:
+                self.on_error(error)
+            else:
+                traceback.print_exc()
+            return 0
+
+        with self._lock:
+            self._finish()
+            if generation != self._generation:
+                # 加载期间列表被重置，丢弃过期的结果
+                return 0
+            items = []
+            for page_items in results:
+                items.extend(page_items)
+                self.next_page += 1
+                if len(page_items) < self.source.page_size:
+                    self.exhausted = True
+                    break
+            self.error = None
+
+        if items:
+            rows = [self.item_builder(item) for item in items]
+            self.column.controls.extend(rows)
+            self._update()
+            # ScrollablePage.create(..., lazy_images=True) 的加载器只需要登记新追加的行
+            loader = getattr(self.column, "lazy_loader", None)
+            if loader is not None:
+                loader.refresh(rows)
+        return len(items)
+
+    def _finish(self):
+        # 重置后可能已经开始了新的加载，只清除属于本任务的标记
+        if self._loading is asyncio.current_task():
+            self._loading = None
+
+    def reset(self, invalidate=False):
+        """清空列表并从第一页重新加载
+
+        Args:
+            invalidate: 是否同时清除数据源的缓存（数据已变化时使用）
+
+        Returns:
+            concurrent.futures.Future: 加载任务，控件不在页面上时为 None
+        """
+        with self._lock:
+            self._generation += 1
+            self._loading = None
+            self.next_page = 0
+            self.exhausted = False
+            self.error = None
+        if invalidate:
+            self.source.invalidate()
+        self.column.controls.clear()
+        loader = getattr(self.column, "lazy_loader", None)
+        if loader is not None:
+            # 丢弃已清除的行中尚未加载的图片
+            loader.refresh()
+        self._update()
+        return self.start()
+
+    def _update(self):
+        if self.column.page is not None:
+            self.update_count += 1
+            self.column.update()
+
+
+def infinite_scroll_page(fetch_page, item_builder, page_size=20, threshold=300, prefetch_pages=1, **kwargs):
+    """创建无限滚动页面的便捷函数
+
+    Args:
+        fetch_page: 异步读取函数 async fetch_page(page_index, page_size)，也可以传入 PagedDataSource
+        item_builder: 创建行控件的函数，参数为数据项
+        page_size: 每页的数据项数量
+        threshold: 距离底部多少像素时开始加载下一批
+        prefetch_pages: 每次加载的页数
+        **kwargs: 其他参数，参见 InfiniteScrollPage
+
+    Returns:
+        InfiniteScrollPage: 无限滚动页面，把 feed.control 添加到页面后调用 feed.start() 加载第一批数据
+    """
+    return InfiniteScrollPage(
+        fetch_page,
+        item_builder,
+        page_size=page_size,
+        threshold=threshold,
+        prefetch_pages=prefetch_pages,
+        **kwargs
+    )
@@ -0,0 +1,316 @@
+# BaseComponents/reconciler.py
+from bisect import bisect_left
+
+import flet as ft
+from flet.core.event_handler import EventHandler
+
+from .themeManager import get_theme_manager
+from .virtualComponents import _reattach
+
+# 控件的内部状态字段，不参与比较和复制
+_INTERNAL_FIELDS = frozenset((
+    "_Control__page",
+    "_Control__attrs",
+    "_Control__previous_children",
+    "_Control__uid",
+    "_Control__event_handlers",
+    "parent",
+))
+
+# "n" 是父控件在序列化时写入的子控件插槽名
+_SKIPPED_ATTRS = frozenset(("n",))
+
+# 在容器上保存协调器的属性名
+_RECONCILER_ATTR = "_base_components_reconciler"
+
+
+class ComponentSpec:
+    """带 key 的组件描述：用 factory(*args, **kwargs) 创建控件"""
+
+    __slots__ = ("key", "factory", "args", "kwargs")
+
+    def __init__(self, key, factory, *args, **kwargs):
+        self.key = key
+        self.factory = factory
+        self.args = args
+        self.kwargs = kwargs
+
+    def build(self):
+        return self.factory(*self.args, **self.kwargs)
+
+    def same_as(self, other):
+        """描述是否与另一个描述完全相同（可以直接复用控件）"""
+        return (
+            self.factory is other.factory
+            and self.args == other.args
+            and self.kwargs == other.kwargs
+        )
+
+    def __repr__(self):
+        return f"ComponentSpec({self.key!r}, {getattr(self.factory, '__name__', self.factory)})"
+
+
+def keyed(key, factory, *args, **kwargs):
+    """创建带 key 的组件描述
+
+    例如 keyed("greeting", body, "你好") 描述 body("你好")，key 在同一个列表中必须唯一。
+    """
+    return ComponentSpec(key, factory, *args, **kwargs)
+
+
+def is_handler_wrapper(handler):
+    """是否为 Flet 内部的事件包装函数
+
+    带事件参数类型的事件（例如 on_hover、on_scroll）在控件上登记的是
+    EventHandler.get_handler() 返回的包装函数，实际处理函数保存在控件的
+    EventHandler 字段中。比较或复制事件处理函数时需要跳过或重新生成这类包装函数。
+    """
+    return getattr(handler, "__qualname__", "") == "EventHandler.get_handler.<locals>.fn"
+
+
+def _same_handler(current, handler):
+    """两个事件处理函数是否等价
+
+    除了相等比较，带 same_as() 方法的处理对象（例如卡片的悬停效果）按配置比较，
+    配置相同时保留页面上原有的处理对象。
+    """
+    if current == handler:
+        return True
+    same_as = getattr(current, "same_as", None)
+    return same_as is not None and type(current) is type(handler) and same_as(handler)
+
+
+def _is_control_list(value):
+    return isinstance(value, list) and value and all(isinstance(item, ft.Control) for item in value)
+
+
+def _patch(old, new):
+    """把 new 的属性复制到 old，子控件按位置递归处理
+
+    Args:
+        old: 页面上现有的控件
+        new: 按新描述创建的控件
+
+    Returns:
+        list: 发生变化的属性名；类型不同无法修补时返回 None
+    """
+    if type(old) is not type(new):
+        return None
+    changed = []
+    registry = get_theme_manager().registry
+    # 复杂属性（样式、边框等）在 before_update 中序列化到 attrs，两边都先序列化再比较
+    old.before_update()
+    new.before_update()
+
+    old_vars = vars(old)
+    for name, value in vars(new).items():
+        if name in _INTERNAL_FIELDS:
+            continue
+        current = old_vars.get(name)
+        if isinstance(value, ft.Control):
+            if isinstance(current, ft.Control) and current is not value:
+                child_changes = _patch(current, value)
+                if child_changes is not None:
+                    changed.extend(child_changes)
+                    continue
+            if current is not value:
+                old_vars[name] = value
+                changed.append(name)
+        elif _is_control_list(value) or _is_control_list(current):
+            current = current or []
+            if value is current:
+                continue
+            if len(value) == len(current):
+                replaced = False
+                for index, (current_child, child) in enumerate(zip(current, value)):
+                    child_changes = _patch(current_child, child)
+                    if child_changes is None:
+                        current[index] = child
+                        replaced = True
+                    else:
+                        changed.extend(child_changes)
+                if replaced:
+                    changed.append(name)
+            else:
+                old_vars[name] = value
+                changed.append(name)
+        elif isinstance(value, EventHandler):
+            if isinstance(current, EventHandler) and current.handler != value.handler:
+                current.handler = value.handler
+                changed.append(name)
+        elif current != value:
+            old_vars[name] = value
+            changed.append(name)
+            if registry.bindings_of(value):
+                # 复制过来的主题化样式对象（例如链接片段的样式）改为更新保留的控件
+                registry.bind(value, owner=old)
+
+    old_handlers = old._Control__event_handlers
+    for event, handler in new._Control__event_handlers.items():
+        if not is_handler_wrapper(handler) and not _same_handler(old_handlers.get(event), handler):
+            old_handlers[event] = handler
+            changed.append(f"on_{event}")
+
+    old_attrs = old._Control__attrs
+    new_attrs = new._Control__attrs
+    for name in old_attrs.keys() | new_attrs.keys():
+        if name in _SKIPPED_ATTRS:
+            continue
+        value = new_attrs[name][0] if name in new_attrs else None
+        if value == "":
+            value = None
+        current = old_attrs[name][0] if name in old_attrs else None
+        if current == "":
+            current = None
+        if current != value:
+            old._set_attr_internal(name, value)
+            changed.append(name)
+
+    # 主题绑定以新描述为准：新描述显式设置的颜色不再随主题切换被覆盖
+    bindings = registry.bindings_of(new)
+    registry.unbind(old)
+    if bindings:
+        registry.bind(old, **bindings)
+    return changed
+
+
+def _prop_names(changed):
+    """把私有字段名（例如 _Text__style）转换为属性名并去重"""
+    return list(dict.fromkeys(name.rsplit("__", 1)[-1] for name in changed))
+
+
+def _longest_increasing(positions):
+    """返回最长递增子序列中的元素集合，不在其中的元素需要移动"""
+    tails = []
+    tail_index = []
+    previous = [-1] * len(positions)
+    for index, position in enumerate(positions):
+        slot = bisect_left(tails, position)
+        if slot == len(tails):
+            tails.append(position)
+            tail_index.append(index)
+        else:
+            tails[slot] = position
+            tail_index[slot] = index
+        previous[index] = tail_index[slot - 1] if slot > 0 else -1
+    result = set()
+    index = tail_index[-1] if tail_index else -1
+    while index != -1:
+        result.add(positions[index])
+        index = previous[index]
+    return result
+
+
+class Reconciler:
+    """带 key 的增量协调器
+
+    保存容器中每个 key 对应的控件和描述。重新渲染时把新的描述列表与现有
+    控件比较:
+    - 描述完全相同的控件原样保留
+    - 同一 key 的描述发生变化时，按新描述创建临时控件并把不同的属性复制到
+      现有控件（prop patch），类型或结构不同的子控件才会被替换
+    - 新出现的 key 插入新控件，消失的 key 移除控件
+    - 保留的控件中，不在旧顺序最长递增子序列中的控件记为移动
+
+    所有修改在一次 update() 中发送，页面上保留的控件和客户端状态（滚动位置、
+    输入内容等）不受影响。
+    """
+
+    def __init__(self, container):
+        """
+        Args:
+            container: 带 controls 列表的容器，例如 ft.Column、ft.ListView 或 ft.Page
+        """
+        self.container = container
+        self._nodes = {}
+
+    def render(self, specs, update=True):
+        """按新的描述列表协调容器中的控件
+
+        第一次渲染时，容器中不是由协调器创建的控件会被移除。
+
+        Args:
+            specs: ComponentSpec 列表（使用 keyed() 创建）
+            update: 是否立即发送更新
+
+        Returns:
+            list: 操作列表，每项为 ("insert", key, index)、("remove", key, None)、
+                ("move", key, index) 或 ("patch", key, [变化的属性名])
+        """
+        keys = [spec.key for spec in specs]
+        if len(set(keys)) != len(keys):
+            raise ValueError("组件描述的 key 必须唯一")
+
+        old_nodes = self._nodes
+        old_order = {key: index for index, key in enumerate(old_nodes)}
+        operations = []
+        nodes = {}
+        controls = []
+        kept_positions = []
+        for index, spec in enumerate(specs):
+            node = old_nodes.get(spec.key)
+            if node is None:
+                control = spec.build()
+                operations.append(("insert", spec.key, index))
+            else:
+                control, old_spec = node
+                if not spec.same_as(old_spec):
+                    changed = _patch(control, spec.build()) if spec.factory is old_spec.factory else None
+                    if changed is None:
+                        # 工厂或控件类型不同，整体替换
+                        operations.append(("remove", spec.key, None))
+                        control = spec.build()
+                        operations.append(("insert", spec.key, index))
+                        node = None
+                    elif changed:
+                        operations.append(("patch", spec.key, _prop_names(changed)))
+                if node is not None:
+                    kept_positions.append(old_order[spec.key])
+            nodes[spec.key] = (control, spec)
+            controls.append(control)
+
+        stable = _longest_increasing(kept_positions)
+        moved = []
+        for index, key in enumerate(keys):
+            if key in old_nodes and old_order[key] not in stable and nodes[key][0] is old_nodes[key][0]:
+                operations.append(("move", key, index))
+                control = nodes[key][0]
+                moved.append((control, control.parent))
+        for key in old_nodes:
+            if key not in nodes:
+                operations.append(("remove", key, None))
+
+        self._nodes = nodes
+        self.container.controls = controls
+        page = self.container if isinstance(self.container, ft.Page) else self.container.page
+        if update and page is not None and operations:
+            self.container.update()
+            # Flet 把移动的控件当作先删除再添加，更新后会清空 parent 和 page，这里恢复引用
+            for control, parent in moved:
+                _reattach(control, parent, page)
+        return operations
+
+    def control(self, key):
+        """返回 key 对应的控件，不存在时返回 None"""
+        node = self._nodes.get(key)
+        return node[0] if node is not None else None
+
+
+def reconcile(container, specs, update=True):
+    """用带 key 的组件描述增量更新容器中的控件，只发送变化的部分
+
+    协调器保存在容器上，同一个容器的多次调用会与上一次的结果比较。
+
+    Args:
+        container: 带 controls 列表的容器，例如 ft.Column、ft.ListView 或 ft.Page
+        specs: ComponentSpec 列表（使用 keyed() 创建）
+        update: 是否立即发送更新
+
+    Returns:
+        list: 操作列表，参见 Reconciler.render
+    """
+    reconciler = getattr(container, _RECONCILER_ATTR, None)
+    if reconciler is None:
+        reconciler = Reconciler(container)
+        setattr(container, _RECONCILER_ATTR, reconciler)
+    return reconciler.render(specs, update)
@@ -1,6 +1,11 @@
 # BaseComponents/textComponents.py
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
 import flet as ft
-from .themeManager import get_theme_colors
+from .themeManager import get_theme_colors, get_theme_manager, bind_theme, styled_text
 
 
 class TextAlign:
@@ -30,7 +35,8 @@ class BaseText:
     """基础文本组件类，支持多种对齐方式"""
 
     @staticmethod
-    def create_text(text, size=16, color=None, align=ft.TextAlign.LEFT, weight=ft.FontWeight.NORMAL):
+    def create_text(text, size=16, color=None, align=ft.TextAlign.LEFT, weight=ft.FontWeight.NORMAL,
+                    color_role="text_primary", shared_style=False):
         """创建基础文本组件
 
         Args:
@@ -39,12 +45,28 @@ class BaseText:
             color: 字体颜色
             align: 对齐方式 (ft.TextAlign.LEFT/CENTER/RIGHT/JUSTIFY)
             weight: 字体粗细
+            color_role: 未指定颜色时使用的主题颜色角色，切换主题时会随之更新
+            shared_style: 未指定颜色时是否改用 styled_text 的共享样式（控件不再携带
+                size/color，客户端主题模式下提升为 theme_style），适合大量文本行
         """
-        # 如果没有指定颜色，则使用主题中的主要文本颜色
+        if color is None and shared_style:
+            # 左对齐与默认对齐一致，无需单独发送
+            if align == ft.TextAlign.LEFT:
+                return styled_text(text, size, color_role, weight)
+            return styled_text(text, size, color_role, weight, text_align=align)
+
+        # 如果没有指定颜色，则使用主题中对应角色的颜色
         if color is None:
             colors = get_theme_colors()
-            color = colors["text_primary"]
-            
+            text_control = ft.Text(
+                value=text,
+                size=size,
+                color=colors[color_role],
+                text_align=align,
+                weight=weight
+            )
+            return bind_theme(text_control, color=color_role)
+
         return ft.Text(
             value=text,
             size=size,
@@ -71,7 +93,14 @@ class Layout:
         # 如果没有指定背景色，则使用主题中的表面颜色
         if bgcolor is None:
             colors = get_theme_colors()
-            bgcolor = colors["surface"]
+            container = ft.Container(
+                content=content,
+                alignment=alignment,
+                expand=expand,
+                bgcolor=colors.surface,
+                **kwargs
+            )
+            return bind_theme(container, bgcolor="surface")
             
         return ft.Container(
             content=content,
@@ -183,61 +212,55 @@ class TextStyle:
     """文本样式类，提供预定义的文本样式"""
 
     @staticmethod
-    def heading(text, level=1, color=None):
+    def heading(text, level=1, color=None, shared_style=False):
         """创建标题文本
 
         Args:
             text: 标题文本
             level: 标题级别 (1-6)
             color: 字体颜色
+            shared_style: 是否使用共享文本样式，参见 BaseText.create_text
         """
-        # 如果没有指定颜色，则使用主题中的主要文本颜色
-        if color is None:
-            colors = get_theme_colors()
-            color = colors["text_primary"]
-            
+        # 未指定颜色时由 create_text 使用主题中的主要文本颜色
         sizes = {1: 32, 2: 28, 3: 24, 4: 20, 5: 16, 6: 14}
         return BaseText.create_text(
             text,
             size=sizes.get(level, 16),
             color=color,
-            weight=ft.FontWeight.BOLD
+            weight=ft.FontWeight.BOLD,
+            shared_style=shared_style
         )
 
     @staticmethod
-    def caption(text, color=None):
+    def caption(text, color=None, shared_style=False):
         """创建说明文字
 
         Args:
             text: 说明文字
             color: 字体颜色
+            shared_style: 是否使用共享文本样式，参见 BaseText.create_text
         """
-        # 如果没有指定颜色，则使用主题中的次要文本颜色
-        if color is None:
-            colors = get_theme_colors()
-            color = colors["text_secondary"]
-            
+        # 未指定颜色时使用主题中的次要文本颜色
         return BaseText.create_text(
             text,
             size=12,
-            color=color
+            color=color,
+            color_role="text_secondary",
+            shared_style=shared_style
         )
 
     @staticmethod
-    def body(text, size=14, color=None):
+    def body(text, size=14, color=None, shared_style=False):
         """创建正文文本
 
         Args:
             text: 正文文本
             size: 字体大小
             color: 字体颜色
+            shared_style: 是否使用共享文本样式，参见 BaseText.create_text
         """
-        # 如果没有指定颜色，则使用主题中的主要文本颜色
-        if color is None:
-            colors = get_theme_colors()
-            color = colors["text_primary"]
-            
-        return BaseText.create_text(text, size=size, color=color)
+        # 未指定颜色时由 create_text 使用主题中的主要文本颜色
+        return BaseText.create_text(text, size=size, color=color, shared_style=shared_style)
 
     @staticmethod
     def link(text, url=None, on_click=None, underline=True):
@@ -250,27 +273,194 @@ class TextStyle:
             underline: 是否显示下划线
         """
         colors = get_theme_colors()
-        
+
         # 根据underline参数决定是否添加下划线
         text_decoration = ft.TextDecoration.UNDERLINE if underline else ft.TextDecoration.NONE
         
-        return ft.Text(
+        span_style = ft.TextStyle(
+            color=colors.primary,
+            decoration=text_decoration
+        )
+        text_control = ft.Text(
             # 不设置value值，避免重复显示
             size=14,
-            color=colors["primary"],
+            color=colors.primary,
             weight=ft.FontWeight.NORMAL,
             spans=[
                 ft.TextSpan(
                     text,
-                    ft.TextStyle(
-                        color=colors["primary"],
-                        decoration=text_decoration
-                    ),
+                    span_style,
                     url=url,
                     on_click=on_click
                 )
             ]
         )
+        bind_theme(span_style, owner=text_control, color="primary")
+        return bind_theme(text_control, color="primary")
+
+
+# 富文本标记: 转义字符、代码、链接、粗体/删除线/斜体标记
+_MARKUP_TOKEN = re.compile(
+    r"\\(?P<escaped>[\\*`~\[\]()])"
+    r"|`(?P<code>[^`]+)`"
+    r"|\[(?P<link_text>[^\]]+)\]\((?P<url>[^)\s]+)\)"
+    r"|(?P<marker>\*\*|~~|\*)"
+)
+_MARKER_FLAGS = {"**": "bold", "~~": "strike", "*": "italic"}
+
+# 已编译的富文本模板缓存: (标记文本, 调色板) -> 片段元组
+_rich_templates = OrderedDict()
+_rich_templates_lock = threading.Lock()
+_RICH_TEMPLATES_SIZE = 1024
+
+
+@lru_cache(maxsize=4096)
+def _parse_markup(markup):
+    """把标记文本解析为 ((文本, 样式标记, 链接), ...) 片段元组，与调色板无关"""
+    tokens = []
+    position = 0
+    for match in _MARKUP_TOKEN.finditer(markup):
+        if match.start() > position:
+            tokens.append(("text", markup[position:match.start()]))
+        kind = match.lastgroup
+        if kind == "escaped":
+            tokens.append(("text", match.group("escaped")))
+        elif kind == "code":
+            tokens.append(("code", match.group("code")))
+        elif kind == "url":
+            tokens.append(("link", match.group("link_text"), match.group("url")))
+        else:
+            tokens.append(("marker", match.group("marker")))
+        position = match.end()
+    if position < len(markup):
+        tokens.append(("text", markup[position:]))
+
+    # 同类标记按出现顺序两两配对，落单的最后一个标记按普通文本处理
+    marker_positions = {}
+    for index, token in enumerate(tokens):
+        if token[0] == "marker":
+            marker_positions.setdefault(token[1], []).append(index)
+    for positions in marker_positions.values():
+        if len(positions) % 2:
+            index = positions[-1]
+            tokens[index] = ("text", tokens[index][1])
+
+    runs = []
+    flags = frozenset()
+    for token in tokens:
+        kind = token[0]
+        if kind == "marker":
+            flags = flags ^ {_MARKER_FLAGS[token[1]]}
+            continue
+        if kind == "text":
+            text, run_flags, url = token[1], flags, None
+        elif kind == "code":
+            text, run_flags, url = token[1], flags | {"code"}, None
+        else:
+            text, run_flags, url = token[1], flags | {"link"}, token[2]
+        if runs and runs[-1][1] == run_flags and runs[-1][2] == url:
+            runs[-1] = (runs[-1][0] + text, run_flags, url)
+        else:
+            runs.append((text, run_flags, url))
+    return tuple(runs)
+
+
+@lru_cache(maxsize=256)
+def _span_style(flags, palette):
+    """由样式标记和调色板构建共享的片段样式，普通文本沿用 ft.Text 的样式"""
+    if not flags:
+        return None
+    decorations = []
+    config = {}
+    if "bold" in flags:
+        config["weight"] = ft.FontWeight.BOLD
+    if "italic" in flags:
+        config["italic"] = True
+    if "strike" in flags:
+        decorations.append(ft.TextDecoration.LINE_THROUGH)
+    if "code" in flags:
+        config["font_family"] = "monospace"
+        config["color"] = palette.secondary
+    if "link" in flags:
+        config["color"] = palette.primary
+        decorations.append(ft.TextDecoration.UNDERLINE)
+    if decorations:
+        decoration = decorations[0]
+        for extra in decorations[1:]:
+            decoration |= extra
+        config["decoration"] = decoration
+    return ft.TextStyle(**config)
+
+
+class RichText:
+    """富文本组件类，把简单的标记文本编译为 ft.Text(spans=[...])
+
+    支持的标记（Markdown 子集）:
+    - **粗体**、*斜体*、~~删除线~~
+    - `代码`
+    - [链接文本](https://example.com)
+    - 反斜杠转义，例如 \\* 表示星号本身
+    """
+
+    @staticmethod
+    def compile(markup, palette=None):
+        """编译标记文本为片段模板，结果按 (标记文本, 调色板) 缓存
+
+        Args:
+            markup: 标记文本
+            palette: ThemePalette，默认为当前会话的调色板
+
+        Returns:
+            tuple: ((文本, 共享的 ft.TextStyle 或 None, 链接), ...)
+        """
+        if palette is None:
+            palette = get_theme_colors()
+        key = (markup, palette)
+        with _rich_templates_lock:
+            template = _rich_templates.get(key)
+            if template is not None:
+                # 命中时移到末尾，按最近使用淘汰
+                _rich_templates.move_to_end(key)
+                return template
+        template = tuple(
+            (text, _span_style(flags, palette), url)
+            for text, flags, url in _parse_markup(markup)
+        )
+        with _rich_templates_lock:
+            _rich_templates[key] = template
+            while len(_rich_templates) > _RICH_TEMPLATES_SIZE:
+                _rich_templates.popitem(last=False)
+        return template
+
+    @staticmethod
+    def create(markup, size=16, color_role="text_primary", weight=ft.FontWeight.NORMAL, on_link_click=None, **kwargs):
+        """创建富文本
+
+        Args:
+            markup: 标记文本
+            size: 字体大小
+            color_role: 普通文本的颜色角色
+            weight: 普通文本的字体粗细
+            on_link_click: 链接点击处理函数，参数为链接地址；不指定时由客户端直接打开链接
+            **kwargs: 其他 ft.Text 参数
+        """
+        manager = get_theme_manager()
+        template = RichText.compile(markup, manager.palette)
+        spans = []
+        for text, style, url in template:
+            if url is not None and on_link_click is not None:
+                spans.append(ft.TextSpan(text, style, on_click=lambda e, url=url: on_link_click(url)))
+            else:
+                spans.append(ft.TextSpan(text, style, url=url))
+        text_control = styled_text(None, size, color_role, weight, spans=spans, **kwargs)
+
+        # 切换主题时只替换各片段的共享样式，片段控件本身保持不变
+        def restyle(palette):
+            for span, (_, style, _) in zip(spans, RichText.compile(markup, palette)):
+                span.style = style
+            return spans
+
+        return bind_theme(text_control, spans=(("primary", "secondary"), restyle))
 
 
 # 便捷函数
@@ -294,21 +484,26 @@ def aligned_text(text, size=16, color=None, align=ft.TextAlign.LEFT, **kwargs):
     return Layout.create_text_block(text, size, color, align, **kwargs)
 
 
-def heading(text, level=1, color=None):
+def heading(text, level=1, color=None, shared_style=False):
     """快速创建标题文本的便捷函数"""
-    return TextStyle.heading(text, level, color)
+    return TextStyle.heading(text, level, color, shared_style)
 
 
-def caption(text, color=None):
+def caption(text, color=None, shared_style=False):
     """快速创建说明文字的便捷函数"""
-    return TextStyle.caption(text, color)
+    return TextStyle.caption(text, color, shared_style)
 
 
-def body(text, size=14, color=None):
+def body(text, size=14, color=None, shared_style=False):
     """快速创建正文文本的便捷函数"""
-    return TextStyle.body(text, size, color)
+    return TextStyle.body(text, size, color, shared_style)
 
 
 def link(text, url=None, on_click=None, underline=True):
     """快速创建链接文本的便捷函数"""
-    return TextStyle.link(text, url, on_click, underline)
\ No newline at end of file
+    return TextStyle.link(text, url, on_click, underline)
+
+
+def rich_text(markup, size=16, on_link_click=None, **kwargs):
+    """快速创建富文本的便捷函数，参见 RichText"""
+    return RichText.create(markup, size=size, on_link_click=on_link_click, **kwargs)
\ No newline at end of file
@@ -0,0 +1,221 @@
+# BaseComponents/themeFiles.py
+import json
+import os
+import re
+import threading
+import traceback
+from types import MappingProxyType
+
+from .themeManager import AppColors, THEME_ROLES, build_theme_palettes, live_theme_managers
+
+# 尝试导入 TOML 解析器：Python 3.11+ 自带 tomllib，旧版本可以安装 tomli
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+
+# 支持 "#RGB"、"#RRGGBB"、"#AARRGGBB" 以及 Flet 颜色名（可带 ",透明度"，例如 "blue,0.5"）
+_COLOR_PATTERN = re.compile(
+    r"^(#([0-9a-fA-F]{3}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})|[a-z][a-z0-9_]*(,(0|1|0?\.\d+|1\.0+))?)$"
+)
+
+# 已解析的主题文件缓存: 绝对路径 -> ((mtime_ns, size), 调色板)
+_file_cache = {}
+_file_cache_lock = threading.Lock()
+
+
+def _parse_file(path):
+    """按扩展名解析 JSON 或 TOML 文件"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".toml":
+        if tomllib is None:
+            raise ImportError("读取 TOML 主题文件需要 Python 3.11+ 或 tomli，请先安装: pip install tomli")
+        with open(path, "rb") as file:
+            return tomllib.load(file)
+    if extension == ".json":
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    raise ValueError(f"不支持的主题文件格式: {path}（仅支持 .json 和 .toml）")
+
+
+def parse_theme_data(data, source="<theme>", base=None):
+    """校验主题数据并转换为调色板
+
+    主题数据是 {主题名称: {颜色角色: 颜色}} 的映射，只需写出需要修改的角色，
+    其余角色取自 base 中的同名主题（没有同名主题时取浅色主题）。
+
+    Args:
+        data: 已解析的主题数据
+        source: 错误信息中显示的数据来源
+        base: 作为默认值的调色板映射，默认为 AppColors 生成的浅色与深色调色板
+
+    Returns:
+        Mapping: {主题名称: ThemePalette} 只读映射
+
+    Raises:
+        ValueError: 数据结构、颜色角色或颜色值不合法
+    """
+    if not isinstance(data, dict) or not data:
+        raise ValueError(f"{source}: 主题文件顶层必须是非空的 {{主题名称: 颜色表}} 映射")
+    base = base or build_theme_palettes(AppColors)
+
+    palettes = {}
+    for theme, roles in data.items():
+        if not isinstance(roles, dict):
+            raise ValueError(f"{source}: 主题 {theme!r} 必须是 {{颜色角色: 颜色}} 映射")
+        unknown = set(roles) - set(THEME_ROLES)
+        if unknown:
+            raise ValueError(
+                f"{source}: 主题 {theme!r} 包含未知的颜色角色 {sorted(unknown)}，可用角色: {', '.join(THEME_ROLES)}"
+            )
+        for role, color in roles.items():
+            if not isinstance(color, str) or not _COLOR_PATTERN.match(color):
+                raise ValueError(f"{source}: 主题 {theme!r} 的 {role} 颜色值不合法: {color!r}")
+        template = base.get(theme, base["light"])
+        palettes[theme] = template.replace(**roles) if roles else template
+    return MappingProxyType(palettes)
+
+
+def read_theme_file(path):
+    """读取并校验 JSON/TOML 主题文件，结果按文件修改时间缓存
+
+    文件未变化（修改时间和大小相同）时直接返回上次解析的结果，不会重新读取文件。
+
+    JSON 示例::
+
+        {"light": {"primary": "#6200EE"}, "dark": {"primary": "#BB86FC"}}
+
+    Args:
+        path: 主题文件路径，扩展名为 .json 或 .toml
+
+    Returns:
+        Mapping: {主题名称: ThemePalette} 只读映射
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _file_cache_lock:
+        cached = _file_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    try:
+        data = _parse_file(path)
+    except (json.JSONDecodeError, UnicodeDecodeError) as error:
+        raise ValueError(f"{path}: 主题文件解析失败: {error}") from error
+    except Exception as error:
+        if tomllib is not None and isinstance(error, tomllib.TOMLDecodeError):
+            raise ValueError(f"{path}: 主题文件解析失败: {error}") from error
+        raise
+    palettes = parse_theme_data(data, source=path)
+    with _file_cache_lock:
+        _file_cache[path] = (signature, palettes)
+    return palettes
+
+
+class ThemeFileWatcher:
+    """主题文件监听器
+
+    在后台线程中轮询主题文件，文件变化后重新加载，只把内容发生变化的主题
+    注册到所有存活的主题管理器（全局管理器和每个页面会话的管理器）。
+    管理器会比较新旧调色板，只有变化的颜色角色会被推送到已登记的控件。
+    文件暂时不合法（例如编辑到一半）时保留当前主题，并通过 on_error 报告。
+    """
+
+    def __init__(self, path, interval=0.5, on_reload=None, on_error=None):
+        """
+        Args:
+            path: 主题文件路径
+            interval: 轮询间隔（秒）
+            on_reload: 重新加载后的回调，参数为发生变化的主题名称集合
+            on_error: 加载失败时的回调，参数为异常对象；为 None 时 check() 直接抛出异常
+        """
+        self.path = os.path.abspath(path)
+        self.interval = interval
+        self.on_reload = on_reload
+        self.on_error = on_error
+        self._palettes = None
+        self._signature = None
+        self._stop = None
+        self._thread = None
+
+    def check(self, update=True):
+        """检查一次文件，发生变化时重新加载
+
+        Args:
+            update: 是否立即把新颜色推送到已添加到页面的主题化控件
+
+        Returns:
+            frozenset: 内容发生变化的主题名称，文件未变化时为空集合
+        """
+        signature = None
+        try:
+            stat = os.stat(self.path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature == self._signature:
+                return frozenset()
+            palettes = read_theme_file(self.path)
+        except Exception as error:
+            # 同一个不合法的文件只报告一次，文件再次变化后才重新加载
+            self._signature = signature
+            if self.on_error is None:
+                raise
+            self.on_error(error)
+            return frozenset()
+
+        self._signature = signature
+        previous = self._palettes or {}
+        changed = {theme: palette for theme, palette in palettes.items() if previous.get(theme) != palette}
+        self._palettes = palettes
+        if changed:
+            for manager in live_theme_managers():
+                manager.register_palettes(changed, update)
+            if self.on_reload is not None:
+                self.on_reload(frozenset(changed))
+        return frozenset(changed)
+
+    def start(self):
+        """先加载一次文件，再在后台线程中开始轮询"""
+        if self._thread is not None:
+            return self
+        self.check()
+        stop = self._stop = threading.Event()
+
+        def run():
+            while not stop.wait(self.interval):
+                try:
+                    self.check()
+                except Exception:
+                    # 未提供 on_error 时打印错误并保留当前主题，继续轮询
+                    traceback.print_exc()
+
+        self._thread = threading.Thread(target=run, name="theme-file-watch", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """停止轮询"""
+        if self._stop is not None:
+            self._stop.set()
+        self._stop = None
+        self._thread = None
+
+
+def watch_theme_file(path, interval=0.5, on_reload=None, on_error=None):
+    """加载主题文件，并在文件变化时把变化的颜色推送到所有会话
+
+    Args:
+        path: 主题文件路径，扩展名为 .json 或 .toml
+        interval: 轮询间隔（秒）
+        on_reload: 重新加载后的回调，参数为发生变化的主题名称集合
+        on_error: 加载失败时的回调，参数为异常对象；为 None 时首次加载失败的异常
+            直接抛出，之后轮询中的失败打印错误堆栈并保留当前主题
+
+    Returns:
+        ThemeFileWatcher: 已启动的监听器，调用 stop() 停止监听
+    """
+    return ThemeFileWatcher(path, interval, on_reload, on_error).start()
@@ -1,15 +1,56 @@
 # BaseComponents/themeManager.py
+import copy
+import threading
+import weakref
+from collections import OrderedDict
+from types import MappingProxyType
+
 import flet as ft
 
-# 尝试导入 darkdetect，如果不可用则提供一个模拟实现
+# Flet 在主函数、线程处理函数和异步处理函数中都会把当前会话的页面写入
+# 这个上下文变量；直接读取它比 ft.context.page 的类属性描述符更快
 try:
-    import darkdetect
+    from flet.core.page import _session_page
 except ImportError:
-    # 模拟 darkdetect 以防未安装
-    class darkdetect:
-        @staticmethod
-        def isDark():
-            return False
+    from contextvars import ContextVar
+
+    _session_page = ContextVar("base_components_session_page", default=None)
+
+_current_session_page = _session_page.get
+
+
+class _DummyDarkdetect:
+    """模拟 darkdetect 以防未安装"""
+
+    @staticmethod
+    def isDark():
+        return False
+
+
+_darkdetect_module = None
+
+
+def _load_darkdetect():
+    """延迟导入 darkdetect，如果不可用则提供一个模拟实现
+
+    在部分桌面环境中导入和检测都会启动子进程，因此推迟到第一次需要时再执行。
+    """
+    global _darkdetect_module
+    if _darkdetect_module is None:
+        try:
+            import darkdetect
+            _darkdetect_module = darkdetect
+        except ImportError:
+            _darkdetect_module = _DummyDarkdetect
+    return _darkdetect_module
+
+
+def _detect_system_theme():
+    """检测系统主题，无法检测时返回浅色主题"""
+    try:
+        return "dark" if _load_darkdetect().isDark() else "light"
+    except:
+        return "light"
 
 
 class AppColors:
@@ -47,80 +88,1109 @@ class AppColors:
     SURFACE = "#FFFFFF"
 
 
+# 主题调色板包含的颜色角色
+THEME_ROLES = (
+    "background",
+    "surface",
+    "primary",
+    "on_primary",
+    "secondary",
+    "on_secondary",
+    "text_primary",
+    "text_secondary",
+)
+
+
+class ThemePalette:
+    """不可变的主题调色板
+
+    每个颜色角色都是一个只读属性，可以通过 ``palette.primary`` 直接读取，
+    同时兼容旧的字典式访问 ``palette["primary"]``。
+    """
+
+    __slots__ = THEME_ROLES
+
+    def __init__(self, **roles):
+        missing = [role for role in THEME_ROLES if role not in roles]
+        if missing:
+            raise ValueError(f"调色板缺少颜色角色: {', '.join(missing)}")
+        unknown = [role for role in roles if role not in THEME_ROLES]
+        if unknown:
+            raise ValueError(f"未知的颜色角色: {', '.join(unknown)}")
+        for role in THEME_ROLES:
+            object.__setattr__(self, role, roles[role])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ThemePalette 是不可变对象")
+
+    def __delattr__(self, name):
+        raise AttributeError("ThemePalette 是不可变对象")
+
+    def __getitem__(self, role):
+        if role not in THEME_ROLES:
+            raise KeyError(role)
+        return getattr(self, role)
+
+    def __contains__(self, role):
+        return role in THEME_ROLES
+
+    def __iter__(self):
+        return iter(THEME_ROLES)
+
+    def __len__(self):
+        return len(THEME_ROLES)
+
+    def __eq__(self, other):
+        if not isinstance(other, ThemePalette):
+            return NotImplemented
+        return all(getattr(self, role) == getattr(other, role) for role in THEME_ROLES)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, role) for role in THEME_ROLES))
+
+    def __repr__(self):
+        values = ", ".join(f"{role}={getattr(self, role)!r}" for role in THEME_ROLES)
+        return f"ThemePalette({values})"
+
+    def get(self, role, default=None):
+        """按角色名获取颜色，角色不存在时返回默认值"""
+        if role not in THEME_ROLES:
+            return default
+        return getattr(self, role)
+
+    def keys(self):
+        return THEME_ROLES
+
+    def values(self):
+        return tuple(getattr(self, role) for role in THEME_ROLES)
+
+    def items(self):
+        return tuple((role, getattr(self, role)) for role in THEME_ROLES)
+
+    def as_dict(self):
+        """转换为普通字典（每次调用都会创建新字典）"""
+        return {role: getattr(self, role) for role in THEME_ROLES}
+
+    def replace(self, **changes):
+        """返回替换了部分颜色角色的新调色板"""
+        roles = self.as_dict()
+        roles.update(changes)
+        return ThemePalette(**roles)
+
+
+def diff_palettes(old, new):
+    """比较两个调色板，返回颜色发生变化的角色
+
+    Args:
+        old: 旧的 ThemePalette（为 None 时视为所有角色都已变化）
+        new: 新的 ThemePalette
+
+    Returns:
+        frozenset: 颜色值不同的角色名集合
+    """
+    if old is None:
+        return frozenset(THEME_ROLES)
+    if old is new:
+        return frozenset()
+    return frozenset(role for role in THEME_ROLES if getattr(old, role) != getattr(new, role))
+
+
+def build_theme_palettes(colors=AppColors):
+    """根据颜色常量构建浅色与深色调色板
+
+    Args:
+        colors: 提供颜色常量的类或实例，默认为 AppColors
+
+    Returns:
+        dict: {"light": ThemePalette, "dark": ThemePalette}
+    """
+    return {
+        "light": ThemePalette(
+            background=colors.BACKGROUND,
+            surface=colors.SURFACE,
+            primary=colors.PRIMARY,
+            on_primary=colors.WHITE,
+            secondary=colors.SECONDARY,
+            on_secondary=colors.WHITE,
+            text_primary=colors.TEXT_PRIMARY,
+            text_secondary=colors.TEXT_SECONDARY,
+        ),
+        "dark": ThemePalette(
+            background=colors.GRAY_900,
+            surface=colors.GRAY_800,
+            primary=colors.PRIMARY,
+            on_primary=colors.WHITE,
+            secondary=colors.SECONDARY,
+            on_secondary=colors.WHITE,
+            text_primary=colors.WHITE,
+            text_secondary=colors.GRAY_300,
+        ),
+    }
+
+
+# 客户端主题模式下使用的语义调色板：颜色角色映射为 Material 配色方案中的
+# 语义颜色名，由 Flutter 客户端根据 page.theme / page.dark_theme 解析
+SEMANTIC_PALETTE = ThemePalette(
+    background=ft.Colors.SURFACE,
+    surface=ft.Colors.SURFACE_CONTAINER_HIGHEST,
+    primary=ft.Colors.PRIMARY,
+    on_primary=ft.Colors.ON_PRIMARY,
+    secondary=ft.Colors.SECONDARY,
+    on_secondary=ft.Colors.ON_SECONDARY,
+    text_primary=ft.Colors.ON_SURFACE,
+    text_secondary=ft.Colors.ON_SURFACE_VARIANT,
+)
+
+
+# 命名文本样式: 名称 -> (字号, 颜色角色, 粗细, Flet 文本主题中的对应字段)
+# 客户端主题模式下这些样式会被编译进 page.theme 的文本主题，文本控件只需引用样式名
+TEXT_STYLES = {
+    "heading1": (32, "text_primary", ft.FontWeight.BOLD, "headline_large"),
+    "heading2": (28, "text_primary", ft.FontWeight.BOLD, "headline_medium"),
+    "heading3": (24, "text_primary", ft.FontWeight.BOLD, "headline_small"),
+    "heading4": (20, "text_primary", ft.FontWeight.BOLD, "title_large"),
+    "heading5": (16, "text_primary", ft.FontWeight.BOLD, "title_medium"),
+    "heading6": (14, "text_primary", ft.FontWeight.BOLD, "title_small"),
+    "body_large": (16, "text_primary", ft.FontWeight.NORMAL, "body_large"),
+    "body": (14, "text_primary", ft.FontWeight.NORMAL, "body_medium"),
+    "caption": (12, "text_secondary", ft.FontWeight.NORMAL, "body_small"),
+}
+
+# (字号, 颜色角色, 粗细) -> 文本主题样式，用于把匹配的文本提升为 theme_style 引用
+_THEME_TEXT_STYLES = {
+    (size, role, weight): ft.TextThemeStyle[field.upper()]
+    for size, role, weight, field in TEXT_STYLES.values()
+}
+
+
+def build_flet_theme(palette):
+    """把调色板编译为 ft.Theme（配色方案与文本主题）
+
+    配色方案中的语义颜色与 SEMANTIC_PALETTE 的映射一一对应，
+    文本主题由 TEXT_STYLES 中的命名文本样式生成。
+
+    Args:
+        palette: 具体颜色值的 ThemePalette
+
+    Returns:
+        ft.Theme: 可赋值给 page.theme 或 page.dark_theme 的主题
+    """
+    return ft.Theme(
+        color_scheme=ft.ColorScheme(
+            primary=palette.primary,
+            on_primary=palette.on_primary,
+            secondary=palette.secondary,
+            on_secondary=palette.on_secondary,
+            surface=palette.background,
+            on_surface=palette.text_primary,
+            # Flutter 中 surfaceContainerHighest 未设置时取 surfaceVariant
+            surface_variant=palette.surface,
+            on_surface_variant=palette.text_secondary,
+        ),
+        text_theme=ft.TextTheme(**{
+            field: ft.TextStyle(size=size, color=palette[role], weight=weight)
+            for size, role, weight, field in TEXT_STYLES.values()
+        }),
+        scaffold_bgcolor=palette.background,
+        card_color=palette.surface,
+    )
+
+
+class _KeyedRef(weakref.ref):
+    """记录登记键的弱引用，回收回调据此移除登记"""
+
+    __slots__ = ("key",)
+
+
+# 已校验的绑定描述缓存（只缓存角色名字符串），工厂函数反复使用相同的描述
+_normalized_specs = {}
+
+
+def _normalize_binding_spec(spec):
+    """把绑定描述规范化为 (角色, 构建函数) 并校验角色名"""
+    if isinstance(spec, str):
+        normalized = (spec, None)
+    else:
+        role, builder = spec
+        normalized = (role, builder)
+    roles = normalized[0]
+    for role in roles if isinstance(roles, tuple) else (roles,):
+        if role not in THEME_ROLES:
+            raise ValueError(f"未知的颜色角色: {role}")
+    # 只缓存纯角色名：带构建函数的描述常常是每个控件各自的闭包，缓存它们既不会
+    # 再次命中，又会让闭包引用的对象一直存活
+    if isinstance(spec, str) and len(_normalized_specs) < 1024:
+        _normalized_specs[spec] = normalized
+    return normalized
+
+
+class ThemeRegistry:
+    """主题控件注册表
+
+    以弱引用记录由组件工厂创建的控件，以及控件的哪些属性取自调色板的
+    哪个颜色角色。切换主题时只修改这些属性，并按页面合并为一次批量更新，
+    开销与主题化属性的数量成正比，而不是与页面大小成正比。
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        # 持有锁期间被回收的对象，等下次持有锁时再移除
+        self._discarded = []
+
+    def __len__(self):
+        return len(self._entries)
+
+    def bind(self, target, owner=None, **props):
+        """登记目标对象的属性与颜色角色的绑定
+
+        Args:
+            target: 被主题化的对象（Flet 控件，或 ft.TextStyle 等样式对象）
+            owner: 目标属性改变后需要更新的控件，默认为 target 本身
+            **props: 属性名到颜色角色的映射。值可以是角色名字符串，
+                也可以是 (角色名, 构建函数) 元组，构建函数接收颜色值并
+                返回属性值，例如 ("text_secondary", lambda c: ft.border.all(1, c))；
+                当属性依赖多个角色时，使用 ((角色名, ...), 构建函数)，
+                构建函数接收整个调色板
+
+        Returns:
+            target: 原样返回目标对象，便于在工厂函数中直接 return
+        """
+        bindings = {}
+        for prop, spec in props.items():
+            normalized = _normalized_specs.get(spec) if isinstance(spec, str) else None
+            if normalized is None:
+                normalized = _normalize_binding_spec(spec)
+            bindings[prop] = normalized
+
+        key = id(target)
+        with self._lock:
+            self._purge()
+            entry = self._entries.get(key)
+            if entry is not None and entry[0]() is target:
+                entry[2].update(bindings)
+                if owner is not None:
+                    entry[1] = weakref.ref(owner)
+                return target
+
+            target_ref = _KeyedRef(target, self._discard)
+            target_ref.key = key
+            owner_ref = weakref.ref(owner) if owner is not None else target_ref
+            self._entries[key] = [target_ref, owner_ref, bindings]
+        return target
+
+    def bindings_of(self, target):
+        """返回目标对象已登记的绑定（规范化后的副本），未登记时返回 None
+
+        返回值可以原样传给 bind，用于让复制出的控件沿用同样的主题绑定。
+        """
+        with self._lock:
+            entry = self._entries.get(id(target))
+            if entry is None or entry[0]() is not target:
+                return None
+            return dict(entry[2])
+
+    def unbind(self, target):
+        """取消目标对象的全部绑定，之后切换主题不再修改它的属性"""
+        with self._lock:
+            key = id(target)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0]() is target:
+                del self._entries[key]
+
+    def _discard(self, ref):
+        """目标对象被回收时移除对应的登记
+
+        垃圾回收可能在本线程持有锁时触发（例如 bind 中分配弱引用），
+        这时不能等待锁，只记下弱引用，由下次持有锁的调用移除
+        """
+        if not self._lock.acquire(blocking=False):
+            self._discarded.append(ref)
+            return
+        try:
+            self._remove(ref)
+            self._purge()
+        finally:
+            self._lock.release()
+
+    def _remove(self, ref):
+        current = self._entries.get(ref.key)
+        if current is not None and current[0] is ref:
+            del self._entries[ref.key]
+
+    def _purge(self):
+        """移除持有锁期间被回收的对象的登记，调用方需持有锁"""
+        while self._discarded:
+            self._remove(self._discarded.pop())
+
+    def apply(self, palette, changed_roles=None):
+        """把调色板应用到所有已登记的对象
+
+        Args:
+            palette: 新的 ThemePalette
+            changed_roles: 需要更新的颜色角色集合，通常由 diff_palettes 得到。
+                为 None 时更新所有角色；只绑定了未变化角色的对象会被跳过
+
+        Returns:
+            list: 属性被修改、需要更新的控件列表（已去重）
+        """
+        if changed_roles is not None and not changed_roles:
+            return []
+        with self._lock:
+            self._purge()
+            entries = list(self._entries.values())
+
+        owners = {}
+        for target_ref, owner_ref, bindings in entries:
+            target = target_ref()
+            if target is None:
+                continue
+            patched = False
+            for prop, (role, builder) in bindings.items():
+                if isinstance(role, tuple):
+                    if changed_roles is not None and changed_roles.isdisjoint(role):
+                        continue
+                    setattr(target, prop, builder(palette))
+                else:
+                    if changed_roles is not None and role not in changed_roles:
+                        continue
+                    color = getattr(palette, role)
+                    setattr(target, prop, color if builder is None else builder(color))
+                patched = True
+            if not patched:
+                continue
+            owner = owner_ref()
+            if owner is not None:
+                owners[id(owner)] = owner
+        return list(owners.values())
+
+    @staticmethod
+    def update_controls(controls):
+        """按页面对控件分组，每个页面只发送一次批量更新
+
+        如果某个控件的祖先也在待更新列表中，则跳过它，因为更新祖先时
+        会一并发送其子树中的改动。尚未添加到页面的控件只修改属性，不发送更新。
+        """
+        pending = {id(control) for control in controls}
+        pages = {}
+        for control in controls:
+            page = control.page
+            if page is None:
+                continue
+            parent = control.parent
+            while parent is not None and id(parent) not in pending:
+                parent = parent.parent
+            if parent is not None:
+                continue
+            pages.setdefault(id(page), (page, []))[1].append(control)
+
+        for page, page_controls in pages.values():
+            page.update(*page_controls)
+
+
+# 所有存活的主题管理器（全局管理器和各页面会话的管理器），供主题文件热重载使用
+_live_managers = weakref.WeakSet()
+_live_managers_lock = threading.Lock()
+
+
+def live_theme_managers():
+    """返回当前所有存活的主题管理器列表"""
+    with _live_managers_lock:
+        return list(_live_managers)
+
+
 class ThemeManager:
-    """主题管理器类"""
+    """主题管理器类
+
+    调色板在创建时预先计算好并缓存，``get_theme_colors`` 只返回缓存的
+    不可变 ThemePalette，不再在每次调用时构建新字典。每次 ``set_theme``
+    都会使 ``version`` 加一，调用方可以据此缓存派生出的样式。
+
+    组件工厂创建的控件会登记到 ``registry`` 中，``set_theme`` 会就地修改
+    这些控件的颜色属性并发送一次批量更新，无需重建整个页面。
+
+    启用客户端主题模式（``enable_client_theming``）后，调色板会被编译为
+    ``page.theme`` 与 ``page.dark_theme``，组件只使用语义颜色名，
+    切换主题只需修改一次 ``page.theme_mode``。
+
+    在 Web 多用户部署中，每个 ft.Page 会话拥有独立的 ThemeManager（参见
+    ``get_theme_manager``），修改主题的方法都持有锁，可以在并发的处理函数中调用。
+
+    未指定主题时，系统主题检测会推迟到第一次读取 ``current_theme`` 或
+    ``palette`` 时才执行，也可以通过 ``detect_in_background`` 提前在后台线程中完成。
+    """
     
-    def __init__(self):
+    def __init__(self, theme=None):
+        self._lock = threading.RLock()
         self.colors = AppColors()
-        # 默认使用系统主题，如果无法检测则使用浅色主题
-        try:
-            self.current_theme = "dark" if darkdetect.isDark() else "light"
-        except:
-            self.current_theme = "light"
+        self.palettes = build_theme_palettes(self.colors)
+        self.registry = ThemeRegistry()
+        self.version = 0
+        self.client_theming = False
+        self._client_page = None
+        self._watch_stop = None
+        self._watch_timer = None
+        self._watch_callback = None
+        self._watch_thread = None
+        self._watch_listening = False
+        with _live_managers_lock:
+            _live_managers.add(self)
+        if theme is not None:
+            self.current_theme = theme
+            self.palette = self.palettes.get(theme, self.palettes["light"])
+
+    def __getattr__(self, name):
+        # 只有实例上还没有该属性时才会调用，即主题尚未确定时
+        if name in ("current_theme", "palette"):
+            self._resolve_theme(_detect_system_theme)
+            return self.__dict__[name]
+        raise AttributeError(name)
+
+    def _resolve_theme(self, detect):
+        """在主题尚未确定时，用检测函数的结果确定初始主题"""
+        if "current_theme" in self.__dict__:
+            return
+        # 检测可能较慢，在锁外执行；主题已被显式设置时丢弃检测结果
+        theme = detect()
+        with self._lock:
+            if "current_theme" not in self.__dict__:
+                self.current_theme = theme
+                self.palette = self.palettes.get(theme, self.palettes["light"])
+
+    def detect_in_background(self):
+        """在后台线程中检测系统主题
+
+        检测完成前如果已经读取或设置了主题，检测结果会被忽略。
+
+        Returns:
+            threading.Thread: 执行检测的后台线程
+        """
+        thread = threading.Thread(
+            target=self._resolve_theme,
+            args=(_detect_system_theme,),
+            name="theme-detect",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def watch_system_theme(self, interval=1.0, debounce=0.3, use_listener=True):
+        """监听系统主题变化，并通过 set_theme 应用到已登记的控件
+
+        优先使用 darkdetect 的 listener，不可用时每隔 interval 秒轮询一次。
+        短时间内的多次变化会在 debounce 秒后合并为一次切换。
+
+        darkdetect.listener 会一直阻塞且无法中断，停止监听后它的回调不再生效；
+        再次调用本方法时如果上一次的 listener 仍在运行，直接复用它，不会再启动新的线程。
+
+        Args:
+            interval: 轮询间隔（秒）
+            debounce: 防抖时间（秒）
+            use_listener: 是否优先使用 darkdetect.listener
+
+        Returns:
+            threading.Thread: 监听线程
+        """
+        self.stop_watching()
+        stop = threading.Event()
+
+        def apply(theme):
+            if not stop.is_set() and theme != self.current_theme:
+                self.set_theme(theme)
+
+        last_seen = [None]
+
+        def on_change(value):
+            if stop.is_set():
+                return
+            theme = "dark" if str(value).lower() == "dark" else "light"
+            # 轮询会重复报告相同的值，只有值变化时才重新开始防抖计时
+            if theme == last_seen[0]:
+                return
+            last_seen[0] = theme
+            with self._lock:
+                if self._watch_timer is not None:
+                    self._watch_timer.cancel()
+                self._watch_timer = threading.Timer(debounce, apply, (theme,))
+                self._watch_timer.daemon = True
+                self._watch_timer.start()
+
+        with self._lock:
+            self._watch_stop = stop
+            self._watch_callback = on_change
+            thread = self._watch_thread
+            if use_listener and thread is not None and thread.is_alive() and self._watch_listening:
+                # 上一次启动的 listener 仍在阻塞运行，只替换回调
+                return thread
+
+        def run():
+            current = threading.current_thread()
+            detector = _load_darkdetect()
+            try:
+                if use_listener and hasattr(detector, "listener"):
+                    try:
+                        detector.listener(self._on_system_theme)
+                        return
+                    except Exception:
+                        pass
+            finally:
+                with self._lock:
+                    if self._watch_thread is current:
+                        self._watch_listening = False
+            # 轮询时使用当前这次监听的停止标志，复用的 listener 失败后也能继续轮询
+            while True:
+                with self._lock:
+                    stop_event = self._watch_stop
+                    if stop_event is None or self._watch_thread is not current:
+                        return
+                if stop_event.wait(interval):
+                    return
+                self._on_system_theme(_detect_system_theme())
+
+        thread = threading.Thread(target=run, name="theme-watch", daemon=True)
+        with self._lock:
+            self._watch_thread = thread
+            # 线程启动前就标记为 listener，紧接着再次调用时复用这个线程
+            self._watch_listening = use_listener
+        thread.start()
+        return thread
+
+    def _on_system_theme(self, value):
+        """把系统主题的变化交给当前的监听回调，停止监听后忽略"""
+        callback = self._watch_callback
+        if callback is not None:
+            callback(value)
+
+    def stop_watching(self):
+        """停止监听系统主题变化"""
+        with self._lock:
+            self._watch_callback = None
+            if self._watch_stop is not None:
+                self._watch_stop.set()
+                self._watch_stop = None
+            if self._watch_timer is not None:
+                self._watch_timer.cancel()
+                self._watch_timer = None
+
+    def new_session(self):
+        """创建继承当前主题与调色板的会话级主题管理器
+
+        新管理器拥有独立的控件注册表和主题状态，调色板是不可变对象，可以直接共享。
+        """
+        with self._lock:
+            manager = ThemeManager(theme=self.current_theme)
+            manager.colors = self.colors
+            manager.palettes = dict(self.palettes)
+            manager.palette = manager.palettes.get(manager.current_theme, manager.palettes["light"])
+        return manager
         
     def get_color(self, color_name):
         """获取指定名称的颜色值"""
         return getattr(self.colors, color_name.upper(), self.colors.PRIMARY)
     
-    def set_theme(self, theme):
-        """设置主题"""
-        self.current_theme = theme
+    def set_theme(self, theme, update=True):
+        """设置主题
+
+        Args:
+            theme: 主题名称 ("light" 或 "dark")
+            update: 是否立即把新颜色推送到已添加到页面的主题化控件
+        """
+        with self._lock:
+            self.current_theme = theme
+            if self.client_theming:
+                self.version += 1
+                self._update_client_page(update)
+                return
+            self._apply_palette(self.palettes.get(theme, self.palettes["light"]), update)
+
+    def enable_client_theming(self, page, update=True):
+        """启用客户端主题模式
+
+        把浅色与深色调色板编译为 page.theme 与 page.dark_theme，之后组件
+        使用语义颜色名，由 Flutter 客户端负责着色。已登记的主题化控件会
+        被一次性切换为语义颜色。
+
+        Args:
+            page: ft.Page 实例
+            update: 是否立即发送更新
+        """
+        with self._lock:
+            self.client_theming = True
+            self._client_page = weakref.ref(page)
+            self._apply_palette(SEMANTIC_PALETTE, update=False)
+            self._update_client_page(update, rebuild_themes=True)
+
+    def disable_client_theming(self, update=True):
+        """关闭客户端主题模式，恢复在服务端写入具体颜色值"""
+        with self._lock:
+            page = self._client_page() if self._client_page else None
+            self.client_theming = False
+            self._client_page = None
+            if page is not None:
+                page.theme = None
+                page.dark_theme = None
+            self._apply_palette(self.palettes.get(self.current_theme, self.palettes["light"]), update)
+            if update and page is not None:
+                page.update()
+
+    def build_flet_themes(self):
+        """把浅色与深色调色板编译为 (page.theme, page.dark_theme)"""
+        return build_flet_theme(self.palettes["light"]), build_flet_theme(self.palettes["dark"])
+
+    def _update_client_page(self, update, rebuild_themes=False):
+        """把当前主题模式（以及需要时重新编译的主题）写入页面"""
+        page = self._client_page() if self._client_page else None
+        if page is None:
+            return
+        if rebuild_themes:
+            page.theme, page.dark_theme = self.build_flet_themes()
+        page.theme_mode = ft.ThemeMode.DARK if self.current_theme == "dark" else ft.ThemeMode.LIGHT
+        if update:
+            page.update()
+
+    def register_palette(self, theme, palette, update=True):
+        """注册或替换指定主题的调色板
+
+        如果替换的是当前主题，只有颜色发生变化的角色会被推送到控件。
+
+        Args:
+            theme: 主题名称
+            palette: ThemePalette 实例
+            update: 替换当前主题时是否立即发送更新
+        """
+        with self._lock:
+            self.palettes[theme] = palette
+            if self.client_theming:
+                self.version += 1
+                self._update_client_page(update, rebuild_themes=True)
+            elif theme == self.current_theme:
+                self._apply_palette(palette, update)
+
+    def update_palette(self, theme=None, update=True, **roles):
+        """修改指定主题中的部分颜色角色，例如微调品牌色
+
+        Args:
+            theme: 主题名称，默认为当前主题
+            update: 修改的是当前主题时是否立即发送更新
+            **roles: 要替换的颜色角色，例如 primary="#6200EE"
+        """
+        with self._lock:
+            theme = theme or self.current_theme
+            base = self.palettes.get(theme, self.palettes["light"])
+            self.register_palette(theme, base.replace(**roles), update)
+
+    def use_seed_color(self, seed, update=True):
+        """由一个品牌色生成并注册浅色与深色调色板（需要 numpy）
+
+        Args:
+            seed: 品牌色，例如 "#6750A4"
+            update: 是否立即把新颜色推送到已添加到页面的主题化控件
+        """
+        # 延迟导入，colorEngine 依赖本模块中的 ThemePalette
+        from .colorEngine import palettes_from_seed
+
+        self.register_palettes(palettes_from_seed(seed), update)
+
+    def register_palettes(self, palettes, update=True):
+        """一次注册多个主题的调色板，当前主题只推送发生变化的角色
+
+        Args:
+            palettes: {主题名称: ThemePalette} 映射
+            update: 是否立即把新颜色推送到已添加到页面的主题化控件
+        """
+        with self._lock:
+            self.palettes.update(palettes)
+            if self.client_theming:
+                self.version += 1
+                self._update_client_page(update, rebuild_themes=True)
+            elif "current_theme" in self.__dict__:
+                self._apply_palette(self.palettes.get(self.current_theme, self.palettes["light"]), update)
+
+    def load_theme_file(self, path, update=True):
+        """从 JSON/TOML 主题文件加载调色板，参见 themeFiles.read_theme_file
+
+        Args:
+            path: 主题文件路径
+            update: 是否立即把新颜色推送到已添加到页面的主题化控件
+        """
+        # 延迟导入，themeFiles 依赖本模块
+        from .themeFiles import read_theme_file
+
+        self.register_palettes(read_theme_file(path), update)
+
+    def _apply_palette(self, palette, update):
+        """切换到新调色板，只把变化的角色应用到已登记的控件"""
+        # 主题尚未确定时不需要触发检测，此时也不会有已登记的控件
+        changed_roles = diff_palettes(self.__dict__.get("palette"), palette)
+        self.palette = palette
+        self.version += 1
+        controls = self.registry.apply(palette, changed_roles)
+        if update:
+            self.registry.update_controls(controls)
         
     def get_theme_colors(self):
-        """获取当前主题的颜色配置"""
-        if self.current_theme == "dark":
-            return {
-                "background": self.colors.GRAY_900,
-                "surface": self.colors.GRAY_800,
-                "primary": self.colors.PRIMARY,
-                "on_primary": self.colors.WHITE,
-                "secondary": self.colors.SECONDARY,
-                "on_secondary": self.colors.WHITE,
-                "text_primary": self.colors.WHITE,
-                "text_secondary": self.colors.GRAY_300,
-            }
-        else:  # light theme
-            return {
-                "background": self.colors.BACKGROUND,
-                "surface": self.colors.SURFACE,
-                "primary": self.colors.PRIMARY,
-                "on_primary": self.colors.WHITE,
-                "secondary": self.colors.SECONDARY,
-                "on_secondary": self.colors.WHITE,
-                "text_primary": self.colors.TEXT_PRIMARY,
-                "text_secondary": self.colors.TEXT_SECONDARY,
-            }
+        """获取当前主题的颜色配置
+
+        Returns:
+            ThemePalette: 当前主题的不可变调色板
+        """
+        return self.palette
 
 
 # 全局主题管理器实例
+# 在页面会话之外（例如导入时或脚本中）使用；每个页面会话首次使用主题时
+# 会以它的当前状态为模板创建自己的管理器
 theme_manager = ThemeManager()
 
+# 会话级主题管理器保存在页面对象上的属性名
+_SESSION_ATTR = "_base_components_theme_manager"
+_session_lock = threading.Lock()
+
+
+def _attach_session_manager(page):
+    """为页面创建并绑定会话级主题管理器"""
+    with _session_lock:
+        manager = getattr(page, _SESSION_ATTR, None)
+        if manager is None:
+            manager = theme_manager.new_session()
+            setattr(page, _SESSION_ATTR, manager)
+    return manager
+
+
+def get_theme_manager(page=None):
+    """获取当前会话的主题管理器
+
+    Args:
+        page: ft.Page 实例，默认为 Flet 当前处理函数所属的页面
+
+    Returns:
+        ThemeManager: 页面会话的主题管理器；不在任何会话中时返回全局 theme_manager
+    """
+    if page is None:
+        page = _current_session_page()
+        if page is None:
+            return theme_manager
+    return getattr(page, _SESSION_ATTR, None) or _attach_session_manager(page)
+
 
 def get_theme_colors():
     """获取当前主题颜色配置"""
-    return theme_manager.get_theme_colors()
+    page = _current_session_page()
+    if page is None:
+        return theme_manager.palette
+    return (getattr(page, _SESSION_ATTR, None) or _attach_session_manager(page)).palette
+
+
+def theme_version():
+    """获取当前主题版本号，每次切换主题都会递增"""
+    return get_theme_manager().version
+
+
+def enable_client_theming(page, update=True):
+    """启用客户端主题模式，参见 ThemeManager.enable_client_theming"""
+    get_theme_manager(page).enable_client_theming(page, update)
+
+
+def disable_client_theming(update=True):
+    """关闭客户端主题模式，参见 ThemeManager.disable_client_theming"""
+    get_theme_manager().disable_client_theming(update)
+
+
+def register_palette(theme, palette, update=True):
+    """注册或替换指定主题的调色板，参见 ThemeManager.register_palette"""
+    get_theme_manager().register_palette(theme, palette, update)
+
+
+def update_palette(theme=None, update=True, **roles):
+    """修改指定主题中的部分颜色角色，参见 ThemeManager.update_palette"""
+    get_theme_manager().update_palette(theme, update, **roles)
+
+
+def use_seed_color(seed, update=True):
+    """由品牌色生成当前会话的浅色与深色调色板，参见 ThemeManager.use_seed_color"""
+    get_theme_manager().use_seed_color(seed, update)
+
+
+def load_theme_file(path, update=True):
+    """从 JSON/TOML 主题文件加载当前会话的调色板，参见 ThemeManager.load_theme_file"""
+    get_theme_manager().load_theme_file(path, update)
+
+
+def bind_theme(target, owner=None, **props):
+    """把控件属性登记为随主题切换而更新，参见 ThemeRegistry.bind"""
+    return get_theme_manager().registry.bind(target, owner, **props)
 
 
 def get_color(color_name):
     """获取指定颜色"""
-    return theme_manager.get_color(color_name)
+    return get_theme_manager().get_color(color_name)
 
 
-def switch_theme(theme):
-    """切换主题"""
-    theme_manager.set_theme(theme)
+def switch_theme(theme, update=True):
+    """切换主题
+
+    只影响当前页面会话；已登记的主题化控件会就地更新颜色，并发送一次批量更新。
+    """
+    get_theme_manager().set_theme(theme, update)
 
 
 def auto_detect_theme():
     """自动检测系统主题"""
-    try:
-        theme = "dark" if darkdetect.isDark() else "light"
-        theme_manager.set_theme(theme)
-        return theme
-    except:
-        # 如果无法检测系统主题，默认使用浅色主题
-        theme_manager.set_theme("light")
-        return "light"
+    manager = get_theme_manager()
+    # 如果无法检测系统主题，默认使用浅色主题
+    theme = _detect_system_theme()
+    manager.set_theme(theme)
+    return theme
+
+
+def detect_theme_in_background():
+    """在后台线程中检测系统主题，参见 ThemeManager.detect_in_background"""
+    return get_theme_manager().detect_in_background()
+
+
+def watch_system_theme(interval=1.0, debounce=0.3, use_listener=True):
+    """监听系统主题变化并自动切换，参见 ThemeManager.watch_system_theme"""
+    return get_theme_manager().watch_system_theme(interval, debounce, use_listener)
+
+
+def stop_watching_system_theme():
+    """停止监听系统主题变化"""
+    get_theme_manager().stop_watching()
+
+
+def _outline_border(color):
+    """根据颜色构建 1 像素的描边"""
+    return ft.border.all(1, color)
+
+
+# 主题化组件的预设：颜色以 (角色名 或 固定颜色) 表示，构建样式表时再解析
+_BUTTON_PRESETS = {
+    "primary": ("on_primary", "primary"),
+    "secondary": ("on_secondary", "secondary"),
+    "success": ("white", AppColors.SUCCESS),
+    "warning": ("black", AppColors.WARNING),
+    "error": ("white", AppColors.ERROR),
+}
+
+_TEXT_PRESETS = {
+    "heading": (24, "text_primary", ft.FontWeight.BOLD),
+    "body": (16, "text_primary", ft.FontWeight.NORMAL),
+    "caption": (12, "text_secondary", ft.FontWeight.NORMAL),
+    "link": (16, "primary", ft.FontWeight.NORMAL),
+}
+
+_CONTAINER_PRESETS = {
+    "card": {"border_radius": 8, "padding": 16},
+    "surface": {"padding": 16},
+    "outlined": {"border_radius": 4, "padding": 16},
+}
+
+# 与共享样式对象冲突的参数，出现时退回到逐个设置属性
+_BUTTON_STYLE_KWARGS = frozenset(("color", "bgcolor", "elevation", "style"))
+_TEXT_STYLE_KWARGS = frozenset(("size", "color", "weight", "style"))
+
+
+def _preset_color(palette, value):
+    """预设中的角色名解析为调色板颜色，其他值视为固定颜色"""
+    return getattr(palette, value) if value in THEME_ROLES else value
+
+
+class ThemeStyles:
+    """由调色板预先构建的共享样式表
+
+    每个调色板只构建一次，themed_button / themed_text / themed_container
+    直接复用其中的样式对象，不再在每次调用时构建配置表。这些样式对象在
+    多个控件之间共享，请不要修改它们；按钮设置了 color / bgcolor / elevation 时
+    会修改自己的 style，themed_button 创建的按钮此时才换成样式的副本。
+    """
+
+    __slots__ = ("palette", "buttons", "button_colors", "texts", "text_configs", "containers", "_text_pool")
+
+    def __init__(self, palette):
+        self.palette = palette
+        self._text_pool = {}
+        self.button_colors = MappingProxyType({
+            button_type: (_preset_color(palette, color), _preset_color(palette, bgcolor))
+            for button_type, (color, bgcolor) in _BUTTON_PRESETS.items()
+        })
+        self.buttons = MappingProxyType({
+            button_type: ft.ButtonStyle(color=color, bgcolor=bgcolor)
+            for button_type, (color, bgcolor) in self.button_colors.items()
+        })
+        self.text_configs = MappingProxyType({
+            text_type: MappingProxyType({
+                "size": size,
+                "color": _preset_color(palette, color),
+                "weight": weight,
+            })
+            for text_type, (size, color, weight) in _TEXT_PRESETS.items()
+        })
+        self.texts = MappingProxyType({
+            text_type: self.text_style(size, color, weight)
+            for text_type, (size, color, weight) in _TEXT_PRESETS.items()
+        })
+        containers = {}
+        for container_type, preset in _CONTAINER_PRESETS.items():
+            config = dict(preset, bgcolor=palette.surface)
+            if container_type == "outlined":
+                config["border"] = _outline_border(palette.text_secondary)
+            containers[container_type] = MappingProxyType(config)
+        self.containers = MappingProxyType(containers)
+
+    def text_style(self, size, color_role="text_primary", weight=ft.FontWeight.NORMAL):
+        """获取共享的文本样式，相同字号、颜色角色和粗细的文本共用同一个 ft.TextStyle
+
+        Args:
+            size: 字体大小
+            color_role: 颜色角色
+            weight: 字体粗细
+
+        Returns:
+            ft.TextStyle: 共享样式对象，请不要修改
+        """
+        key = (size, color_role, weight)
+        style = self._text_pool.get(key)
+        if style is None:
+            style = self._text_pool.setdefault(
+                key, ft.TextStyle(size=size, color=self.palette[color_role], weight=weight)
+            )
+        return style
+
+
+_styles_cache = OrderedDict()
+_styles_cache_lock = threading.Lock()
+_STYLES_CACHE_SIZE = 16
+_last_styles = None
+
+
+def get_theme_styles(palette=None):
+    """获取调色板对应的共享样式表，每个调色板只构建一次
+
+    Args:
+        palette: ThemePalette，默认为当前会话的调色板
+
+    Returns:
+        ThemeStyles: 共享样式表
+    """
+    global _last_styles
+    if palette is None:
+        palette = get_theme_colors()
+    # 绝大多数调用都命中最近一次使用的样式表，读取单个引用无需加锁
+    entry = _last_styles
+    if entry is not None and entry.palette is palette:
+        return entry
+    key = id(palette)
+    with _styles_cache_lock:
+        entry = _styles_cache.get(key)
+        if entry is not None and entry.palette is palette:
+            # 命中时移到末尾，按最近使用淘汰
+            _styles_cache.move_to_end(key)
+            _last_styles = entry
+            return entry
+    styles = ThemeStyles(palette)
+    with _styles_cache_lock:
+        entry = _styles_cache.get(key)
+        if entry is not None and entry.palette is palette:
+            # 其他线程已经构建了同一调色板的样式表，沿用它以保持样式对象共享
+            _last_styles = entry
+            return entry
+        _styles_cache[key] = styles
+        _last_styles = styles
+        while len(_styles_cache) > _STYLES_CACHE_SIZE:
+            _styles_cache.popitem(last=False)
+    return styles
+
+
+class _ThemedButton(ft.ElevatedButton):
+    """使用共享主题样式的按钮
+
+    Flet 按钮在 before_update 中会把 color / bgcolor / elevation 写入自己的 style，
+    因此只有设置了这些属性时才把共享样式换成副本（写时复制），其余按钮直接
+    共享调色板的样式对象。
+    """
+
+    @property
+    def shared_style(self):
+        return self._shared_style
+
+    @shared_style.setter
+    def shared_style(self, style):
+        self._shared_style = style
+        self.style = style
+
+    def before_update(self):
+        if self.style is self._shared_style and (
+            self.color is not None or self.bgcolor is not None or self.elevation is not None
+        ):
+            self.style = copy.copy(self._shared_style)
+        super().before_update()
+
+
+def _shared_style_binding(table, style_type, roles):
+    """构建随调色板切换共享样式的绑定"""
+    return roles, lambda palette: getattr(get_theme_styles(palette), table)[style_type]
+
+
+_BUTTON_STYLE_BINDINGS = {
+    button_type: _shared_style_binding("buttons", button_type, (color, bgcolor))
+    for button_type, (color, bgcolor) in _BUTTON_PRESETS.items()
+    if color in THEME_ROLES
+}
+
+
+_text_style_bindings = {}
+
+
+def _text_style_binding(size, color_role, weight):
+    """获取随调色板切换共享文本样式的绑定，相同的样式复用同一个绑定描述"""
+    key = (size, color_role, weight)
+    binding = _text_style_bindings.get(key)
+    if binding is None:
+        binding = _text_style_bindings.setdefault(
+            key, ((color_role,), lambda palette: get_theme_styles(palette).text_style(size, color_role, weight))
+        )
+    return binding
+
+
+def text_style(name):
+    """获取当前调色板下命名文本样式（参见 TEXT_STYLES）的共享 ft.TextStyle
+
+    Args:
+        name: 样式名称，例如 "heading1"、"body"、"caption"
+
+    Returns:
+        ft.TextStyle: 共享样式对象，请不要修改
+    """
+    size, color_role, weight, _ = TEXT_STYLES[name]
+    return get_theme_styles().text_style(size, color_role, weight)
+
+
+def styled_text(value, size=16, color_role="text_primary", weight=ft.FontWeight.NORMAL, **kwargs):
+    """创建使用共享样式的主题化文本
+
+    文本控件只携带文本内容和样式引用：普通模式下引用按调色板共享的
+    ft.TextStyle；客户端主题模式下，与 TEXT_STYLES 匹配的样式直接引用
+    page.theme 中的文本主题（theme_style），不再逐个控件发送字号、颜色和粗细。
+
+    Args:
+        value: 文本内容
+        size: 字体大小
+        color_role: 颜色角色，切换主题时会随之更新
+        weight: 字体粗细
+        **kwargs: 其他 ft.Text 参数
+
+    Returns:
+        ft.Text: 已登记到主题注册表的文本控件
+    """
+    manager = get_theme_manager()
+    theme_style = _THEME_TEXT_STYLES.get((size, color_role, weight)) if manager.client_theming else None
+    if theme_style is not None:
+        text_control = ft.Text(value, theme_style=theme_style, **kwargs)
+    else:
+        styles = get_theme_styles(manager.palette)
+        text_control = ft.Text(value, style=styles.text_style(size, color_role, weight), **kwargs)
+    # 提升为 theme_style 的文本也登记绑定，关闭客户端主题模式时会换回具体颜色的共享样式
+    return manager.registry.bind(text_control, style=_text_style_binding(size, color_role, weight))
 
 
 # 主题相关的便捷函数
@@ -133,85 +1203,69 @@ def themed_button(text, on_click=None, button_type="primary", **kwargs):
         button_type: 按钮类型 ("primary", "secondary", "success", "warning", "error")
         **kwargs: 其他参数
     """
-    colors = get_theme_colors()
-    
-    button_configs = {
-        "primary": {
-            "color": colors["on_primary"],
-            "bgcolor": colors["primary"]
-        },
-        "secondary": {
-            "color": colors["on_secondary"],
-            "bgcolor": colors["secondary"]
-        },
-        "success": {
-            "color": "white",
-            "bgcolor": AppColors.SUCCESS
-        },
-        "warning": {
-            "color": "black",
-            "bgcolor": AppColors.WARNING
-        },
-        "error": {
-            "color": "white",
-            "bgcolor": AppColors.ERROR
-        }
-    }
+    styles = get_theme_styles()
+    if button_type not in _BUTTON_PRESETS:
+        button_type = "primary"
+    binding = _BUTTON_STYLE_BINDINGS.get(button_type)
     
-    config = button_configs.get(button_type, button_configs["primary"])
+    if _BUTTON_STYLE_KWARGS.isdisjoint(kwargs):
+        button = _ThemedButton(
+            text=text,
+            on_click=on_click,
+            **kwargs
+        )
+        button.shared_style = styles.buttons[button_type]
+        if binding:
+            bind_theme(button, shared_style=binding)
+        return button
     
-    return ft.ElevatedButton(
+    # 自定义了颜色或样式时，不能修改共享样式，改为逐个设置属性
+    color, bgcolor = styles.button_colors[button_type]
+    kwargs.setdefault("color", color)
+    kwargs.setdefault("bgcolor", bgcolor)
+    button = ft.ElevatedButton(
         text=text,
         on_click=on_click,
-        color=config["color"],
-        bgcolor=config["bgcolor"],
         **kwargs
     )
+    color_role, bgcolor_role = _BUTTON_PRESETS[button_type]
+    roles = {}
+    if color_role in THEME_ROLES and kwargs["color"] is color:
+        roles["color"] = color_role
+    if bgcolor_role in THEME_ROLES and kwargs["bgcolor"] is bgcolor:
+        roles["bgcolor"] = bgcolor_role
+    if roles:
+        bind_theme(button, **roles)
+    return button
 
 
-def themed_text(text, text_type="body", **kwargs):
+def themed_text(text, text_type="body", shared_style=False, **kwargs):
     """创建主题化文本
     
     Args:
         text: 文本内容
         text_type: 文本类型 ("heading", "body", "caption", "link")
+        shared_style: 是否改用 styled_text 的共享样式（控件不再携带 size/color/weight），
+            覆盖了字号、颜色等参数时不适用
         **kwargs: 其他参数
     """
-    colors = get_theme_colors()
+    if text_type not in _TEXT_PRESETS:
+        text_type = "body"
     
-    text_configs = {
-        "heading": {
-            "size": 24,
-            "color": colors["text_primary"],
-            "weight": ft.FontWeight.BOLD
-        },
-        "body": {
-            "size": 16,
-            "color": colors["text_primary"],
-            "weight": ft.FontWeight.NORMAL
-        },
-        "caption": {
-            "size": 12,
-            "color": colors["text_secondary"],
-            "weight": ft.FontWeight.NORMAL
-        },
-        "link": {
-            "size": 16,
-            "color": colors["primary"],
-            "weight": ft.FontWeight.NORMAL
-        }
-    }
+    if shared_style and _TEXT_STYLE_KWARGS.isdisjoint(kwargs):
+        size, color_role, weight = _TEXT_PRESETS[text_type]
+        return styled_text(text, size, color_role, weight, **kwargs)
     
-    config = text_configs.get(text_type, text_configs["body"])
-    
-    # 合并传入的参数
-    for key, value in kwargs.items():
-        config[key] = value
-    
-    return ft.Text(
+    # 合并到预设配置的副本中，不修改共享配置
+    config = dict(get_theme_styles().text_configs[text_type])
+    config.update(kwargs)
+    text_control = ft.Text(
         text,
         **config
     )
+    if "color" not in kwargs:
+        bind_theme(text_control, color=_TEXT_PRESETS[text_type][1])
+    return text_control
 
 
 def themed_container(content, container_type="card", **kwargs):
@@ -222,34 +1276,25 @@ def themed_container(content, container_type="card", **kwargs):
         container_type: 容器类型 ("card", "surface", "outlined")
         **kwargs: 其他参数
     """
-    colors = get_theme_colors()
-    
-    container_configs = {
-        "card": {
-            "bgcolor": colors["surface"],
-            "border_radius": 8,
-            "padding": 16,
-            "elevation": 2
-        },
-        "surface": {
-            "bgcolor": colors["surface"],
-            "padding": 16
-        },
-        "outlined": {
-            "bgcolor": colors["surface"],
-            "border": ft.border.all(1, colors["text_secondary"]),
-            "border_radius": 4,
-            "padding": 16
-        }
-    }
-    
-    config = container_configs.get(container_type, container_configs["card"])
+    styles = get_theme_styles()
+    if container_type not in _CONTAINER_PRESETS:
+        container_type = "card"
+    config = styles.containers[container_type]
     
     # 合并传入的参数
-    for key, value in kwargs.items():
-        config[key] = value
+    if kwargs:
+        config = dict(config)
+        config.update(kwargs)
     
-    return ft.Container(
+    container = ft.Container(
         content=content,
         **config
-    )
\ No newline at end of file
+    )
+    container_roles = {}
+    if "bgcolor" not in kwargs:
+        container_roles["bgcolor"] = "surface"
+    if container_type == "outlined" and "border" not in kwargs:
+        container_roles["border"] = ("text_secondary", _outline_border)
+    if container_roles:
+        bind_theme(container, **container_roles)
+    return container
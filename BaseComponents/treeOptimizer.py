@@ -0,0 +1,169 @@
+# BaseComponents/treeOptimizer.py
+import flet as ft
+
+# 包装容器允许携带的属性，其余属性（内边距、尺寸、边框、事件等）都会影响布局或交互
+_NEUTRAL_FIELDS = frozenset((
+    "_Container__content",
+    "_Container__alignment",
+    "_Container__bgcolor",
+    "_Control__expand",
+))
+
+# 控件的内部状态字段，不参与比较
+_INTERNAL_FIELDS = frozenset((
+    "_Control__page",
+    "_Control__attrs",
+    "_Control__previous_children",
+    "_Control__uid",
+    "_Control__event_handlers",
+    "_Container__on_tap_down",
+    "parent",
+))
+
+# "n" 是父控件在序列化时写入的子控件插槽名
+_NEUTRAL_ATTRS = frozenset(("expand", "bgcolor", "n"))
+
+_EVENT_PROPS = ("on_click", "on_long_press", "on_hover", "on_tap_down", "on_animation_end")
+
+# 对齐方式的水平分量 -> 等效的文本对齐方式
+_TEXT_ALIGNS = {-1: ft.TextAlign.LEFT, 0: ft.TextAlign.CENTER, 1: ft.TextAlign.RIGHT}
+
+_container_defaults = None
+
+
+def _defaults():
+    global _container_defaults
+    if _container_defaults is None:
+        _container_defaults = vars(ft.Container())
+    return _container_defaults
+
+
+def _is_transparent(color):
+    return color is not None and str(getattr(color, "value", color)).lower() == "transparent"
+
+
+def _has_events(container):
+    return any(getattr(container, prop) is not None for prop in _EVENT_PROPS)
+
+
+def _is_neutral(container):
+    """容器除内容、对齐、扩展和透明背景外没有设置任何属性，只起包装作用"""
+    if type(container) is not ft.Container or container.content is None:
+        return False
+    if container.bgcolor is not None and not _is_transparent(container.bgcolor):
+        return False
+    defaults = _defaults()
+    for name, value in vars(container).items():
+        if name in _NEUTRAL_FIELDS or name in _INTERNAL_FIELDS:
+            continue
+        if value != defaults.get(name):
+            return False
+    for name in container._Control__attrs:
+        if name not in _NEUTRAL_ATTRS:
+            return False
+    return not _has_events(container)
+
+
+def _stretches_children(parent, container):
+    """父布局是否在交叉轴上撑满子控件，且容器的垂直对齐不会产生可见差异"""
+    if isinstance(parent, ft.ListView):
+        # 纵向列表在水平方向撑满子控件，垂直方向按内容收缩
+        return not parent.horizontal
+    if isinstance(parent, ft.Column):
+        if parent.horizontal_alignment != ft.CrossAxisAlignment.STRETCH:
+            return False
+        # 不扩展时高度按内容收缩；扩展时只有顶部对齐与文本的默认位置一致
+        return not container.expand or container.alignment.y == -1
+    return False
+
+
+def _collapse_text_wrapper(container, parent):
+    """把包装文本的对齐容器替换为文本自身的 text_align，不等效时返回 None"""
+    text = container.content
+    if not isinstance(text, ft.Text) or container.alignment is None or parent is None:
+        return None
+    text_align = _TEXT_ALIGNS.get(container.alignment.x)
+    if text_align is None or text.text_align not in (None, text_align):
+        return None
+    if not _stretches_children(parent, container):
+        return None
+    text.text_align = text_align
+    if isinstance(parent, ft.Column) and container.expand and not text.expand:
+        text.expand = container.expand
+    return text
+
+
+def _optimize(control, parent, replaceable=True):
+    """优化以 control 为根的子树
+
+    Args:
+        control: 子树的根控件
+        parent: control 的父控件
+        replaceable: control 本身能否被替换
+
+    Returns:
+        tuple: (替换 control 的控件, 删除的控件数)
+    """
+    removed = 0
+    content = getattr(control, "content", None)
+    if isinstance(content, ft.Control):
+        new_content, count = _optimize(content, control)
+        removed += count
+        if new_content is not content:
+            control.content = new_content
+    controls = getattr(control, "controls", None)
+    if isinstance(controls, list):
+        for index, child in enumerate(controls):
+            if isinstance(child, ft.Control):
+                new_child, count = _optimize(child, control)
+                removed += count
+                if new_child is not child:
+                    controls[index] = new_child
+
+    if type(control) is not ft.Container:
+        return control, removed
+
+    # 没有事件处理时，透明背景与不设置背景等效
+    if _is_transparent(control.bgcolor) and not _has_events(control):
+        control.bgcolor = None
+
+    # 合并嵌套的单子容器：内层只有对齐属性时，由外层容器承担对齐
+    while _is_neutral(control.content):
+        inner = control.content
+        if inner.alignment is not None:
+            control.alignment = inner.alignment
+        control.content = inner.content
+        removed += 1
+
+    if replaceable and _is_neutral(control):
+        # 不带任何属性的容器与其内容等效，扩展属性转移到内容上
+        if control.alignment is None and control.bgcolor is None:
+            content = control.content
+            if control.expand and not content.expand:
+                content.expand = control.expand
+            return content, removed + 1
+        text = _collapse_text_wrapper(control, parent)
+        if text is not None:
+            return text, removed + 1
+    return control, removed
+
+
+def flatten_tree(root):
+    """压平 BaseComponents 生成的控件树，返回删除的控件数
+
+    只应用保守的等效规则，不改变显示效果:
+    - 没有事件处理的容器上的透明背景视为未设置
+    - 嵌套的单子容器中，只带对齐属性的内层容器并入外层容器
+    - 不带任何属性的包装容器替换为其内容
+    - 在水平撑满子控件的纵向列表（ListView，或 horizontal_alignment 为 STRETCH
+      的 Column）中，包装文本的对齐容器替换为文本自身的 text_align
+
+    根控件本身不会被替换，请在添加到页面之前调用。
+
+    Args:
+        root: 控件树的根控件
+
+    Returns:
+        int: 删除的控件数
+    """
+    return _optimize(root, None, replaceable=False)[1]
@@ -0,0 +1,233 @@
+# BaseComponents/virtualComponents.py
+import threading
+
+import flet as ft
+
+
+def _reattach(control, parent, page):
+    """恢复被 Flet 清空的 parent 和 page，子控件中引用完好的子树不再遍历"""
+    control.parent = parent
+    control.page = page
+    for child in control._get_children():
+        if child.page is None:
+            _reattach(child, control, page)
+
+
+class VirtualListView:
+    """虚拟化列表组件
+
+    基于 ft.ListView，只创建可见区域及前后预取范围内的行，其余行用上下两个
+    占位容器撑出滚动高度。滚动时根据行高计算新的可见范围，移出范围的行
+    控件通过 item_binder 重新绑定到新进入范围的行，而不是创建新控件。
+    无论总行数多少，页面上的控件数量和首次加载的开销都保持不变。
+
+    行高可以是固定值（item_extent，行控件未设置高度时会被设为该值），
+    也可以是估计值（estimated_extent，占位高度和滚动位置按估计值换算）。
+    """
+
+    def __init__(
+        self,
+        item_builder,
+        item_count=None,
+        items=None,
+        item_binder=None,
+        item_extent=None,
+        estimated_extent=48,
+        prefetch=10,
+        viewport_height=600,
+        scroll_interval=50,
+        **kwargs
+    ):
+        """
+        Args:
+            item_builder: 创建行控件的函数，参数为数据项（传入 items 时）或行索引
+            item_count: 行数，未传入 items 时必须指定
+            items: 可索引的数据源（支持 len() 和下标访问）
+            item_binder: 把已有行控件重新绑定到另一行的函数，参数为 (控件, 数据项或行索引)；
+                不指定时滚动会为新进入范围的行创建新控件
+            item_extent: 固定行高
+            estimated_extent: 未指定固定行高时使用的估计行高
+            prefetch: 可见区域前后各预取的行数
+            viewport_height: 收到第一次滚动事件之前假定的可见区域高度
+            scroll_interval: 滚动事件的最短间隔（毫秒）
+            **kwargs: 其他 ft.ListView 参数
+        """
+        if items is None and item_count is None:
+            raise ValueError("必须指定 item_count 或 items")
+        self.item_builder = item_builder
+        self.item_binder = item_binder
+        self.items = items
+        self._item_count = item_count
+        self.item_extent = item_extent
+        self.extent = item_extent or estimated_extent
+        self.prefetch = prefetch
+        self.viewport_height = viewport_height
+        self.offset = 0
+
+        self._lock = threading.RLock()
+        self._first = 0
+        self._last = 0
+        self._window = []
+        self._pool = []
+        self._top = ft.Container(height=0)
+        self._bottom = ft.Container(height=0)
+
+        self.list_view = ft.ListView(
+            controls=[self._top, self._bottom],
+            on_scroll=self._on_scroll,
+            on_scroll_interval=scroll_interval,
+            **kwargs
+        )
+        self.control = self.list_view
+        self._render(*self._target_range(), update=False)
+
+    @property
+    def item_count(self):
+        """当前行数"""
+        if self.items is not None:
+            return len(self.items)
+        return self._item_count
+
+    @item_count.setter
+    def item_count(self, count):
+        with self._lock:
+            self._item_count = count
+            self._render(*self._target_range())
+
+    def _item(self, index):
+        return self.items[index] if self.items is not None else index
+
+    def _visible_range(self):
+        """由滚动位置计算可见的行范围 [first, last)"""
+        count = self.item_count
+        first = min(int(self.offset // self.extent), max(count - 1, 0))
+        last = min(count, first + int(self.viewport_height // self.extent) + 1)
+        return first, last
+
+    def _target_range(self):
+        """可见范围加上前后预取的行，即应当创建的行范围 [first, last)"""
+        first, last = self._visible_range()
+        return max(0, first - self.prefetch), min(self.item_count, last + self.prefetch)
+
+    def _needs_render(self):
+        """可见区域离已创建范围的边缘不足半个预取范围时才需要重新渲染"""
+        count = self.item_count
+        if self._last > count:
+            return True
+        first, last = self._visible_range()
+        margin = self.prefetch // 2
+        if self._first > 0 and first - margin < self._first:
+            return True
+        return self._last < count and last + margin > self._last
+
+    def _new_control(self, index):
+        control = self.item_builder(self._item(index))
+        if self.item_extent is not None and getattr(control, "height", 0) is None:
+            control.height = self.item_extent
+        return control
+
+    def _render(self, first, last, update=True, rebind=False):
+        """把已创建的行调整为 [first, last)，并发送一次更新"""
+        with self._lock:
+            kept = {}
+            free = []
+            for index, control in enumerate(self._window, self._first):
+                if first <= index < last and not rebind:
+                    kept[index] = control
+                else:
+                    free.append(control)
+            # 移出范围的控件按原顺序复用，跳转到不重叠的位置时控件顺序不变，只发送属性更新
+            free.extend(self._pool)
+            free.reverse()
+            if self.item_binder is None:
+                free = []
+
+            window = []
+            reused = []
+            for index in range(first, last):
+                control = kept.get(index)
+                if control is None:
+                    if free:
+                        control = free.pop()
+                        self.item_binder(control, self._item(index))
+                        reused.append(control)
+                    else:
+                        control = self._new_control(index)
+                window.append(control)
+            self._pool = free
+
+            self._first, self._last, self._window = first, last, window
+            self._top.height = first * self.extent
+            self._bottom.height = (self.item_count - last) * self.extent
+            self.list_view.controls = [self._top, *window, self._bottom]
+
+            page = self.list_view.page
+            if update and page is not None:
+                self.list_view.update()
+                # Flet 把移动位置的控件当作先删除再添加，更新后会清空 parent 和 page，这里恢复引用
+                for control in reused:
+                    _reattach(control, self.list_view, page)
+
+    def _on_scroll(self, e):
+        self.update_viewport(e.pixels, e.viewport_dimension)
+
+    def update_viewport(self, offset, viewport_height=None):
+        """根据滚动位置更新已创建的行，通常由滚动事件调用
+
+        Args:
+            offset: 滚动偏移（像素）
+            viewport_height: 可见区域高度（像素）
+        """
+        with self._lock:
+            self.offset = max(0, offset)
+            if viewport_height:
+                self.viewport_height = viewport_height
+            if self._needs_render():
+                self._render(*self._target_range())
+
+    def refresh(self, item_count=None):
+        """数据变化后重新绑定（或重新创建）已创建的行
+
+        Args:
+            item_count: 新的行数，为 None 时保持不变
+        """
+        with self._lock:
+            if item_count is not None:
+                self._item_count = item_count
+            self._render(*self._target_range(), rebind=True)
+
+    def scroll_to_index(self, index, duration=0):
+        """滚动到指定行
+
+        Args:
+            index: 行索引
+            duration: 滚动动画时长（毫秒）
+        """
+        offset = max(0, min(index, self.item_count - 1)) * self.extent
+        self.update_viewport(offset)
+        if self.list_view.page is not None:
+            self.list_view.scroll_to(offset=offset, duration=duration)
+
+
+def virtual_list(item_builder, item_count=None, items=None, item_binder=None, item_extent=None, **kwargs):
+    """创建虚拟化列表的便捷函数
+
+    Args:
+        item_builder: 创建行控件的函数，参数为数据项（传入 items 时）或行索引
+        item_count: 行数
+        items: 可索引的数据源
+        item_binder: 把已有行控件重新绑定到另一行的函数，参数为 (控件, 数据项或行索引)
+        item_extent: 固定行高
+        **kwargs: 其他参数，参见 VirtualListView
+
+    Returns:
+        VirtualListView: 虚拟化列表，把 view.control 添加到页面
+    """
+    return VirtualListView(
+        item_builder,
+        item_count=item_count,
+        items=items,
+        item_binder=item_binder,
+        item_extent=item_extent,
+        **kwargs
+    )
@@ -0,0 +1,113 @@
+# benchmarks/bench_bulk_cards.py
+"""批量卡片基准测试
+
+按列准备 CARDS 条记录（标题、内容、标识），比较:
+- 逐条调用 titled_card 并一次性添加到列布局
+- bulk_cards 按列批量创建，按固定的 CHUNK 张一块追加到列布局（chunk_growth=1）
+- bulk_cards 第一块 CHUNK 张，之后每块大小变为 4 倍（默认的 chunk_growth=4）
+
+报告第一批卡片发送到页面之前经过的时间（页面开始可交互的时间）、更新次数和总耗时。
+页面使用模拟连接，不需要启动 Flet 客户端。
+
+运行方式:
+    python benchmarks/bench_bulk_cards.py
+"""
+import asyncio
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flet as ft
+from flet.core.protocol import PageCommandsBatchResponsePayload
+from flet.core.pubsub.pubsub_hub import PubSubHub
+
+from BaseComponents import bulk_cards, titled_card
+
+CARDS = 5000
+CHUNK = 250
+
+
+class TimingConnection:
+    """记录每批命令发送时间的模拟连接"""
+
+    def __init__(self):
+        self.pubsubhub = PubSubHub()
+        self.sent = []
+        self._ids = itertools.count(1)
+
+    def send_commands(self, session_id, commands):
+        self.sent.append(time.perf_counter())
+        results = []
+        for command in commands:
+            if command.name == "add":
+                results.append(" ".join(f"_{next(self._ids)}" for _ in command.commands))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    def send_command(self, session_id, command):
+        return self.send_commands(session_id, [command])
+
+
+def on_click(e):
+    pass
+
+
+def make_column():
+    connection = TimingConnection()
+    page = ft.Page(connection, "bench", asyncio.new_event_loop())
+    column = ft.Column()
+    page.add(column)
+    connection.sent.clear()
+    return column, connection
+
+
+def run_loop(titles, bodies, ids):
+    column, connection = make_column()
+    start = time.perf_counter()
+    cards = []
+    for title, body, card_id in zip(titles, bodies, ids):
+        card = titled_card(title, body)
+        card.content.on_click = on_click
+        card.data = card_id
+        cards.append(card)
+    column.controls.extend(cards)
+    column.update()
+    return connection.sent[0] - start, len(connection.sent), time.perf_counter() - start
+
+
+def run_bulk(titles, bodies, ids, growth):
+    column, connection = make_column()
+    start = time.perf_counter()
+    bulk_cards(
+        titles=titles,
+        bodies=bodies,
+        ids=ids,
+        target=column,
+        chunk_size=CHUNK,
+        chunk_growth=growth,
+        on_click=on_click,
+    )
+    return connection.sent[0] - start, len(connection.sent), time.perf_counter() - start
+
+
+def main():
+    titles = [f"标题 {i}" for i in range(CARDS)]
+    bodies = [f"卡片内容 {i}" for i in range(CARDS)]
+    ids = list(range(CARDS))
+
+    print(f"{CARDS} 张卡片，分块大小 {CHUNK}\n")
+    print(f"{'方式':<24} {'首批显示':>10} {'更新次数':>8} {'总耗时':>10}")
+    runs = (
+        ("逐条 titled_card", run_loop),
+        ("bulk_cards 固定分块", lambda *columns: run_bulk(*columns, growth=1)),
+        ("bulk_cards 递增分块", lambda *columns: run_bulk(*columns, growth=4)),
+    )
+    for label, run in runs:
+        first, updates, total = run(titles, bodies, ids)
+        print(f"{label:<24} {first * 1000:>8.1f}ms {updates:>8} {total * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
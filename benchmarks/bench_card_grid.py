@@ -0,0 +1,79 @@
+# benchmarks/bench_card_grid.py
+"""虚拟化卡片网格基准测试
+
+比较 main.py 中的写法（每张 simple_card 包在 ft.Column(col=...) 中放入
+ft.ResponsiveRow，所有卡片都会创建）与 card_grid（只创建可见行，卡片通过
+card_binder 复用）在不同卡片数量下的首次构建耗时、控件数量和序列化字节数，
+并模拟滚动统计新建的卡片数。
+
+运行方式:
+    python benchmarks/bench_card_grid.py
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flet as ft
+
+from BaseComponents import card_grid, simple_card
+
+SIZES = (1000, 10000)
+ROW_HEIGHT = 120
+
+
+def bind_card(card, item):
+    card.content.content.value = item
+
+
+def count_controls(control):
+    return 1 + sum(count_controls(child) for child in control._get_children())
+
+
+def payload_bytes(control):
+    return sum(len(json.dumps(command.attrs, ensure_ascii=False).encode("utf-8"))
+               for command in control._build_add_commands())
+
+
+def responsive_row(items):
+    return ft.ResponsiveRow([
+        ft.Column([simple_card(item)], col={"xs": 12, "sm": 6, "md": 4})
+        for item in items
+    ])
+
+
+def measure(build):
+    start = time.perf_counter()
+    control = build()
+    size = payload_bytes(control)
+    return (time.perf_counter() - start) * 1000, count_controls(control), size
+
+
+def main():
+    print(f"{'卡片数':>8} {'布局':<14} {'构建+序列化':>12} {'控件数':>10} {'字节数':>12}")
+    for size in SIZES:
+        items = [f"商品 {i}" for i in range(size)]
+        cases = (
+            ("ResponsiveRow", lambda: responsive_row(items)),
+            ("card_grid", lambda: card_grid(
+                simple_card, items=items, card_binder=bind_card, width=1000, row_height=ROW_HEIGHT).control),
+        )
+        for label, build in cases:
+            elapsed, controls, payload = measure(build)
+            print(f"{size:>8} {label:<14} {elapsed:>10.1f}ms {controls:>10,} {payload:>12,}")
+
+    grid = card_grid(simple_card, items=items, card_binder=bind_card, width=1000, row_height=ROW_HEIGHT)
+    built = grid.build_count
+    rows = grid.view.item_count
+    start = time.perf_counter()
+    for offset in range(0, rows * (ROW_HEIGHT + 10), ROW_HEIGHT // 2):
+        grid.view.update_viewport(offset, 800)
+    elapsed = time.perf_counter() - start
+    print(f"\n模拟从头滚动到尾 ({rows:,} 行): 耗时 {elapsed * 1000:.0f} ms, "
+          f"新建卡片 {grid.build_count - built} 张（首屏 {built} 张）")
+
+
+if __name__ == "__main__":
+    main()
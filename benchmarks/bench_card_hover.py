@@ -0,0 +1,106 @@
+# benchmarks/bench_card_hover.py
+"""卡片悬停效果基准测试
+
+在 CARDS 张卡片的网格上模拟鼠标快速扫过：每轮依次进入、离开每张卡片，
+共 ROUNDS 轮。比较:
+- 手写 on_hover：每个事件修改阴影和背景后调用 card.update()
+- Card.create(hover_elevation=..., hover_bgcolor=...)：修改按帧合并为批量更新
+
+报告发送给客户端的批次数和字节数。页面使用模拟连接，不需要启动 Flet 客户端。
+
+运行方式:
+    python benchmarks/bench_card_hover.py
+"""
+import asyncio
+import itertools
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flet as ft
+from flet.core.control_event import ControlEvent
+from flet.core.protocol import PageCommandsBatchResponsePayload
+from flet.core.pubsub.pubsub_hub import PubSubHub
+
+from BaseComponents import Card
+
+CARDS = 200
+ROUNDS = 10
+# 鼠标经过一张卡片（进入到离开）的时间
+EVENT_GAP = 0.002
+
+
+class CountingConnection:
+    """统计发送批次和字节数的模拟连接"""
+
+    def __init__(self):
+        self.pubsubhub = PubSubHub()
+        self.batches = 0
+        self.bytes = 0
+        self._ids = itertools.count(1)
+
+    def send_commands(self, session_id, commands):
+        self.batches += 1
+        results = []
+        for command in commands:
+            self.bytes += len(json.dumps(
+                [command.name, command.attrs, [child.attrs for child in command.commands], command.values]
+            ))
+            if command.name == "add":
+                results.append(" ".join(f"_{next(self._ids)}" for _ in command.commands))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    def send_command(self, session_id, command):
+        return self.send_commands(session_id, [command])
+
+
+def manual_card(i):
+    card = Card.create(f"卡片内容 {i}", title=f"标题 {i}")
+
+    def on_hover(e):
+        hovered = e.data == "true"
+        card.elevation = 6 if hovered else 1
+        card.content.bgcolor = "#EEEEEE" if hovered else "#FFFFFF"
+        card.update()
+
+    card.content.on_hover = on_hover
+    return card
+
+
+def effect_card(i):
+    return Card.create(f"卡片内容 {i}", title=f"标题 {i}", hover_elevation=6, hover_bgcolor="#EEEEEE")
+
+
+def sweep(factory):
+    connection = CountingConnection()
+    page = ft.Page(connection, "bench", asyncio.new_event_loop())
+    cards = [factory(i) for i in range(CARDS)]
+    page.add(*cards)
+    connection.batches = connection.bytes = 0
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for card in cards:
+            container = card.content
+            for data in ("true", "false"):
+                container.on_hover(ControlEvent(container.uid, "hover", data, container, page))
+            time.sleep(EVENT_GAP)
+    # 等待最后一帧发送
+    time.sleep(0.1)
+    return connection.batches, connection.bytes, time.perf_counter() - start
+
+
+def main():
+    events = CARDS * ROUNDS * 2
+    print(f"{CARDS} 张卡片，{ROUNDS} 轮扫过，共 {events} 个悬停事件\n")
+    print(f"{'方式':<20} {'批次':>8} {'字节':>10} {'耗时':>10}")
+    for label, factory in (("手写 on_hover", manual_card), ("hover_* 参数", effect_card)):
+        batches, size, elapsed = sweep(factory)
+        print(f"{label:<20} {batches:>8} {size:>10} {elapsed:>8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
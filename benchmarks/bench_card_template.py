@@ -0,0 +1,68 @@
+# benchmarks/bench_card_template.py
+"""卡片模板基准测试
+
+分别用 Card.create 和 CardTemplate.stamp 创建 CARDS 张带标题、带点击事件的卡片
+（标准模式、轻量模式、带边框），报告每秒创建的卡片数，并检查两种方式
+生成的序列化内容是否一致。
+
+运行方式:
+    python benchmarks/bench_card_template.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BaseComponents import Card, CardTemplate
+
+CARDS = 5000
+ROUNDS = 3
+
+VARIANTS = (
+    ("标准", {}),
+    ("轻量", {"lightweight": True}),
+    ("带边框", {"outlined": True}),
+)
+
+
+def on_click(e):
+    pass
+
+
+def payload(control):
+    return [(command.name, command.attrs) for command in control._build_add_commands()]
+
+
+def best_of(build):
+    best = None
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        build()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    print(f"每种方式创建 {CARDS} 张卡片，取 {ROUNDS} 次中的最短耗时\n")
+    print(f"{'模式':<8} {'Card.create':>14} {'stamp':>14} {'加速':>8} {'内容一致':>8}")
+    for label, options in VARIANTS:
+        template = CardTemplate(**options)
+
+        def create():
+            return [Card.create(f"卡片内容 {i}", title=f"标题 {i}", on_click=on_click, **options)
+                    for i in range(CARDS)]
+
+        def stamp():
+            return [template.stamp(f"卡片内容 {i}", f"标题 {i}", on_click=on_click) for i in range(CARDS)]
+
+        same = payload(create()[7]) == payload(stamp()[7])
+        create_time = best_of(create)
+        stamp_time = best_of(stamp)
+        print(f"{label:<8} {CARDS / create_time:>10.0f} 张/秒 {CARDS / stamp_time:>10.0f} 张/秒 "
+              f"{create_time / stamp_time:>7.1f}x {'是' if same else '否':>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# benchmarks/bench_card_variants.py
+"""卡片轻量模式基准测试
+
+对 simple_card、titled_card、outlined_card、clickable_card 分别以标准模式和
+轻量模式（lightweight=True）创建 CARDS 张卡片，报告每张卡片的控件数、
+序列化字节数和构建耗时。
+
+运行方式:
+    python benchmarks/bench_card_variants.py
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BaseComponents import clickable_card, outlined_card, simple_card, titled_card
+
+CARDS = 2000
+
+
+def on_click(e):
+    pass
+
+
+VARIANTS = (
+    ("simple_card", lambda i, light: simple_card(f"卡片内容 {i}", lightweight=light)),
+    ("titled_card", lambda i, light: titled_card(f"标题 {i}", f"卡片内容 {i}", lightweight=light)),
+    ("outlined_card", lambda i, light: outlined_card(f"卡片内容 {i}", lightweight=light)),
+    ("clickable_card", lambda i, light: clickable_card(f"卡片内容 {i}", on_click, lightweight=light)),
+)
+
+
+def count_controls(control):
+    return 1 + sum(count_controls(child) for child in control._get_children())
+
+
+def payload_bytes(control):
+    return sum(len(json.dumps(command.attrs, ensure_ascii=False).encode("utf-8"))
+               for command in control._build_add_commands())
+
+
+def measure(factory, lightweight):
+    start = time.perf_counter()
+    cards = [factory(i, lightweight) for i in range(CARDS)]
+    elapsed = time.perf_counter() - start
+    controls = sum(count_controls(card) for card in cards) / CARDS
+    size = sum(payload_bytes(card) for card in cards) / CARDS
+    return controls, size, elapsed * 1000
+
+
+def main():
+    print(f"每种卡片创建 {CARDS} 张\n")
+    print(f"{'卡片':<16} {'模式':<6} {'控件/张':>8} {'字节/张':>8} {'构建耗时':>10}")
+    for label, factory in VARIANTS:
+        for mode, lightweight in (("标准", False), ("轻量", True)):
+            controls, size, elapsed = measure(factory, lightweight)
+            print(f"{label:<16} {mode:<6} {controls:>8.1f} {size:>8.0f} {elapsed:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# benchmarks/bench_color_engine.py
+"""颜色引擎基准测试
+
+测量由品牌色生成浅色与深色调色板的冷启动耗时与缓存命中耗时，
+以及批量计算对比度的吞吐量。
+
+运行方式:
+    python benchmarks/bench_color_engine.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from BaseComponents import ThemeManager, contrast_ratio, format_colors, palette_contrast, palettes_from_seed
+
+SEEDS = ["#6750A4", "#2196F3", "#E91E63", "#4CAF50", "#FF9800", "#795548"]
+N = 100000
+
+
+def main():
+    print("由品牌色生成浅色/深色调色板:")
+    for seed in SEEDS:
+        start = time.perf_counter()
+        palettes = palettes_from_seed(seed)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        palettes_from_seed(seed)
+        warm = time.perf_counter() - start
+        worst = min(min(palette_contrast(palette).values()) for palette in palettes.values())
+        print(f"  {seed}  首次 {cold * 1000:6.2f} ms  缓存 {warm * 1e6:6.2f} us  最低对比度 {worst:5.2f}")
+
+    manager = ThemeManager(theme="light")
+    start = time.perf_counter()
+    manager.use_seed_color("#009688")
+    print(f"\nThemeManager.use_seed_color: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    rng = np.random.default_rng(0)
+    foreground = rng.random((N, 3))
+    background = rng.random((N, 3))
+    start = time.perf_counter()
+    contrast_ratio(foreground, background)
+    elapsed = time.perf_counter() - start
+    print(f"批量对比度: {N} 对颜色 {elapsed * 1000:.2f} ms")
+
+    start = time.perf_counter()
+    format_colors(foreground)
+    print(f"批量格式化: {N} 个颜色 {(time.perf_counter() - start) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# benchmarks/bench_image_pipeline.py
+"""图片缩略图服务基准测试
+
+生成 PHOTOS 张 4000x3000 的测试照片，对比 image_card 在 150px 高的图片位置中:
+- 直接使用原图: 客户端需要加载的字节数
+- thumbnail=True: 缩略图的 base64 字节数，以及冷启动（生成缩略图）、
+  内存缓存命中、磁盘缓存命中（新建服务，相当于重启应用）三种情况下的耗时
+
+需要 Pillow: pip install pillow
+
+运行方式:
+    python benchmarks/bench_image_pipeline.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BaseComponents import ImageService
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+PHOTOS = 12
+IMAGE_HEIGHT = 150
+
+
+def make_photos(directory):
+    paths = []
+    for i in range(PHOTOS):
+        path = os.path.join(directory, f"photo_{i}.jpg")
+        # 噪声加渐变，压缩后的大小接近真实照片
+        noise = Image.effect_noise((4000, 3000), 40 + i).convert("RGB")
+        gradient = Image.linear_gradient("L").resize((4000, 3000)).convert("RGB")
+        Image.blend(noise, gradient, 0.5).save(path, quality=92)
+        paths.append(path)
+    return paths
+
+
+def timed(run):
+    start = time.perf_counter()
+    result = run()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    if Image is None:
+        print("需要 Pillow: pip install pillow")
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_photos(directory)
+        cache_dir = os.path.join(directory, "cache")
+        original = sum(os.path.getsize(path) for path in paths)
+
+        service = ImageService(cache_dir=cache_dir)
+        cold, cold_time = timed(lambda: [f.result() for f in [service.submit(p, None, IMAGE_HEIGHT) for p in paths]])
+        _, memory_time = timed(lambda: [service.thumbnail_base64(p, None, IMAGE_HEIGHT) for p in paths])
+        service.shutdown()
+
+        restarted = ImageService(cache_dir=cache_dir)
+        _, disk_time = timed(lambda: [f.result() for f in [restarted.submit(p, None, IMAGE_HEIGHT) for p in paths]])
+        restarted.shutdown()
+
+        thumbnails = sum(len(encoded) for encoded in cold)
+        print(f"{PHOTOS} 张 4000x3000 照片，显示高度 {IMAGE_HEIGHT}px\n")
+        print(f"原图: 客户端加载 {original / 1024 / 1024:,.1f} MB")
+        print(f"缩略图: base64 共 {thumbnails / 1024:,.1f} KB ({original / thumbnails:,.0f} 倍缩小)")
+        print(f"  冷启动生成 {cold_time:,.0f} ms, 内存缓存 {memory_time:,.1f} ms, "
+              f"磁盘缓存（重启后）{disk_time:,.1f} ms, 重启后重新生成 {restarted.generated_count} 张")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+# benchmarks/bench_infinite_scroll.py
+"""无限滚动加载基准测试
+
+模拟每页读取耗时 FETCH_DELAY 秒的本地数据库，用户每次滚动到底部时在一次
+读取期间连续触发 EVENTS_PER_BURST 个滚动事件，对比:
+- 旧写法: 每个滚动事件都用 page.run_task 读取"下一页"并单独 update()
+- InfiniteScrollPage: 加载中忽略滚动事件，同一页只读取一次，每批一次 update()
+
+最后重置列表（相当于重新进入页面）并重新加载相同的页数，统计缓存命中后
+的耗时。使用只统计消息的连接代替真实客户端。
+
+运行方式:
+    python benchmarks/bench_infinite_scroll.py
+"""
+import asyncio
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flet as ft
+from flet.core.protocol import PageCommandsBatchResponsePayload
+from flet.core.pubsub.pubsub_hub import PubSubHub
+
+from BaseComponents import body, infinite_scroll_page, scrollable_page
+
+PAGE_SIZE = 25
+BURSTS = 20
+EVENTS_PER_BURST = 8
+FETCH_DELAY = 0.02
+
+
+class CountingConnection:
+    """只统计消息数和字节数的连接，为添加的控件分配 id"""
+
+    def __init__(self):
+        self.pubsubhub = PubSubHub()
+        self.messages = 0
+        self.bytes = 0
+        self._ids = itertools.count(1)
+
+    def send_commands(self, session_id, commands):
+        self.messages += 1
+        results = []
+        for command in commands:
+            self.bytes += len(json.dumps(
+                [command.name, command.values, command.attrs, [inner.attrs for inner in command.commands]],
+                ensure_ascii=False,
+            ).encode("utf-8"))
+            if command.name == "add":
+                results.append(" ".join(f"_{next(self._ids)}" for _ in command.commands))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    def send_command(self, session_id, command):
+        return self.send_commands(session_id, [command])
+
+
+class ScrollEvent:
+    def __init__(self, pixels, max_scroll_extent):
+        self.pixels = pixels
+        self.max_scroll_extent = max_scroll_extent
+
+
+def new_page():
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    connection = CountingConnection()
+    return ft.Page(connection, "bench", loop), connection, loop
+
+
+def make_fetch(counter):
+    async def fetch_page(page_index, page_size):
+        counter.append(page_index)
+        await asyncio.sleep(FETCH_DELAY)
+        start = page_index * page_size
+        return [f"第 {i} 条记录" for i in range(start, start + page_size)]
+    return fetch_page
+
+
+def wait_idle(loop):
+    """等待事件循环中除自身外的任务全部完成"""
+    async def idle():
+        current = asyncio.current_task()
+        while any(not task.done() for task in asyncio.all_tasks() if task is not current):
+            await asyncio.sleep(0.005)
+    asyncio.run_coroutine_threadsafe(idle(), loop).result()
+
+
+def scroll_bursts(on_scroll, loop):
+    start = time.perf_counter()
+    for _ in range(BURSTS):
+        for _ in range(EVENTS_PER_BURST):
+            on_scroll(ScrollEvent(990, 1000))
+        wait_idle(loop)
+    return time.perf_counter() - start
+
+
+def legacy():
+    page, connection, loop = new_page()
+    fetches = []
+    fetch_page = make_fetch(fetches)
+    content = scrollable_page([])
+    page.add(content)
+    column = content.content
+    state = {"next": 0}
+
+    async def load_next():
+        index = state["next"]
+        items = await fetch_page(index, PAGE_SIZE)
+        state["next"] = max(state["next"], index + 1)
+        column.controls.extend(body(item) for item in items)
+        column.update()
+
+    def on_scroll(e):
+        if e.max_scroll_extent - e.pixels <= 300:
+            page.run_task(load_next)
+
+    messages = connection.messages
+    elapsed = scroll_bursts(on_scroll, loop)
+    scrolled = (elapsed, len(fetches), connection.messages - messages, len(column.controls))
+
+    # 重新进入页面：旧写法没有缓存，所有页重新读取
+    column.controls.clear()
+    state["next"] = 0
+    start = time.perf_counter()
+    for _ in range(BURSTS):
+        asyncio.run_coroutine_threadsafe(load_next(), loop).result()
+    return scrolled, time.perf_counter() - start
+
+
+def infinite():
+    page, connection, loop = new_page()
+    fetches = []
+    feed = infinite_scroll_page(make_fetch(fetches), body, page_size=PAGE_SIZE, cache_size=BURSTS)
+    page.add(feed.control)
+
+    messages = connection.messages
+    elapsed = scroll_bursts(feed._on_scroll, loop)
+    scrolled = (elapsed, len(fetches), connection.messages - messages, len(feed.column.controls))
+
+    feed.reset().result()
+    start = time.perf_counter()
+    for _ in range(BURSTS - 1):
+        asyncio.run_coroutine_threadsafe(feed.load_more(), loop).result()
+    return scrolled, time.perf_counter() - start
+
+
+def main():
+    print(f"{BURSTS} 次滚动到底部，每次 {EVENTS_PER_BURST} 个滚动事件，每页 {PAGE_SIZE} 条，"
+          f"读取耗时 {FETCH_DELAY * 1000:.0f} ms\n")
+    for label, run in (("旧写法（每个事件读取一页）", legacy), ("InfiniteScrollPage", infinite)):
+        (elapsed, fetches, messages, rows), reload = run()
+        print(f"{label}")
+        print(f"  滚动耗时 {elapsed:.2f}s, 读取 {fetches} 次, 更新消息 {messages} 条, 列表 {rows:,} 行")
+        print(f"  重新进入页面加载 {BURSTS} 页: {reload * 1000:.0f} ms\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# benchmarks/bench_lazy_images.py
+"""延迟加载图片基准测试
+
+scrollable_page 中放入 CARDS 张 image_card，对比:
+- 直接加载: 首次添加到页面时所有图片的 src 都已赋值，客户端会同时请求全部图片
+- lazy=True + lazy_images=True: 只有首屏附近的图片有 src，滚动时按位置分批加载
+
+模拟用户以每 16ms 一个滚动事件的速度滚动到 SCROLL_TO 像素，统计首次添加时
+客户端需要请求的图片数、滚动期间的更新消息数和最终加载的图片数。使用只统计
+消息的连接代替真实客户端。
+
+运行方式:
+    python benchmarks/bench_lazy_images.py
+"""
+import asyncio
+import itertools
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flet as ft
+from flet.core.page import _session_page
+from flet.core.protocol import PageCommandsBatchResponsePayload
+from flet.core.pubsub.pubsub_hub import PubSubHub
+
+from BaseComponents import image_card, scrollable_page
+
+CARDS = 500
+CARD_EXTENT = 250
+VIEWPORT = 800
+SCROLL_TO = 20000
+SCROLL_STEP = 40
+
+
+class CountingConnection:
+    """统计消息数、字节数和带 src 的图片数，为添加的控件分配 id"""
+
+    def __init__(self):
+        self.pubsubhub = PubSubHub()
+        self.messages = 0
+        self.bytes = 0
+        self.image_requests = 0
+        self._ids = itertools.count(1)
+
+    def send_commands(self, session_id, commands):
+        self.messages += 1
+        results = []
+        for command in commands:
+            self.bytes += len(json.dumps(
+                [command.name, command.values, command.attrs, [inner.attrs for inner in command.commands]],
+                ensure_ascii=False,
+            ).encode("utf-8"))
+            self.image_requests += sum(1 for inner in command.commands if inner.attrs.get("src"))
+            if command.name == "add":
+                results.append(" ".join(f"_{next(self._ids)}" for _ in command.commands))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    def send_command(self, session_id, command):
+        return self.send_commands(session_id, [command])
+
+
+class ScrollEvent:
+    def __init__(self, pixels):
+        self.pixels = pixels
+        self.max_scroll_extent = CARDS * CARD_EXTENT - VIEWPORT
+        self.viewport_dimension = VIEWPORT
+
+
+def new_page():
+    connection = CountingConnection()
+    page = ft.Page(connection, "bench", asyncio.new_event_loop())
+    _session_page.set(page)
+    return page, connection
+
+
+def run(lazy):
+    page, connection = new_page()
+    cards = [image_card(f"https://example.com/photos/{i}.jpg", title=f"照片 {i}", lazy=lazy) for i in range(CARDS)]
+    content = scrollable_page(cards, lazy_images=lazy)
+    page.add(content)
+    initial = (connection.image_requests, connection.bytes)
+
+    column = content.content
+    messages = connection.messages
+    for pixels in range(0, SCROLL_TO, SCROLL_STEP):
+        if column.on_scroll is not None:
+            column.on_scroll(ScrollEvent(pixels))
+        time.sleep(0.016)
+    time.sleep(0.1)
+    return initial, connection.messages - messages, connection.image_requests
+
+
+def main():
+    print(f"{CARDS} 张 image_card，滚动到 {SCROLL_TO}px（{SCROLL_TO // SCROLL_STEP} 个滚动事件）\n")
+    for label, lazy in (("直接加载", False), ("延迟加载", True)):
+        (initial_images, initial_bytes), messages, images = run(lazy)
+        print(f"{label}")
+        print(f"  首次添加: 请求图片 {initial_images} 张, {initial_bytes / 1024:,.0f} KB")
+        print(f"  滚动期间: 更新消息 {messages} 条, 累计请求图片 {images} 张\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# benchmarks/bench_reconcile.py
+"""增量协调基准测试
+
+页面上有 ITEMS 张带标题的卡片，依次执行以下修改并统计发送的字节数:
+- 修改一张卡片的内容
+- 在开头插入一张卡片
+- 把最后一张卡片移动到开头
+- 删除一张卡片
+
+对比 main.py 中 load_demo_content 的写法（page.controls.clear() 后重新添加
+全部控件）与 reconcile（只发送变化的部分）。使用只统计消息的连接代替真实客户端。
+
+运行方式:
+    python benchmarks/bench_reconcile.py
+"""
+import asyncio
+import itertools
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flet as ft
+from flet.core.page import _session_page
+from flet.core.protocol import PageCommandsBatchResponsePayload
+from flet.core.pubsub.pubsub_hub import PubSubHub
+
+from BaseComponents import keyed, reconcile, titled_card
+
+ITEMS = 300
+
+
+class CountingConnection:
+    """只统计消息数和字节数的连接，为添加的控件分配 id"""
+
+    def __init__(self):
+        self.pubsubhub = PubSubHub()
+        self.messages = 0
+        self.bytes = 0
+        self._ids = itertools.count(1)
+
+    def send_commands(self, session_id, commands):
+        self.messages += 1
+        results = []
+        for command in commands:
+            self.bytes += len(json.dumps(
+                [command.name, command.values, command.attrs, [inner.attrs for inner in command.commands]],
+                ensure_ascii=False,
+            ).encode("utf-8"))
+            if command.name == "add":
+                results.append(" ".join(f"_{next(self._ids)}" for _ in command.commands))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    def send_command(self, session_id, command):
+        return self.send_commands(session_id, [command])
+
+
+def new_page():
+    connection = CountingConnection()
+    page = ft.Page(connection, "bench", asyncio.new_event_loop())
+    _session_page.set(page)
+    return page, connection
+
+
+def edits():
+    """依次返回 (说明, 数据) ，数据为 (key, 内容) 列表"""
+    items = [(i, f"第 {i} 张卡片的内容") for i in range(ITEMS)]
+    yield "初始渲染", list(items)
+    items[ITEMS // 2] = (ITEMS // 2, "修改后的内容")
+    yield "修改一张卡片", list(items)
+    items.insert(0, (ITEMS, "新插入的卡片"))
+    yield "开头插入一张", list(items)
+    items.insert(0, items.pop())
+    yield "末尾移动到开头", list(items)
+    del items[ITEMS // 3]
+    yield "删除一张", list(items)
+
+
+def build(items):
+    return [titled_card(title=f"卡片 {key}", content=text) for key, text in items]
+
+
+def specs(items):
+    return [keyed(key, titled_card, title=f"卡片 {key}", content=text) for key, text in items]
+
+
+def rebuild():
+    page, connection = new_page()
+    results = []
+    for label, items in edits():
+        size = connection.bytes
+        start = time.perf_counter()
+        page.controls.clear()
+        page.add(*build(items))
+        results.append((label, connection.bytes - size, time.perf_counter() - start))
+    return results
+
+
+def incremental():
+    page, connection = new_page()
+    results = []
+    for label, items in edits():
+        size = connection.bytes
+        start = time.perf_counter()
+        operations = reconcile(page, specs(items))
+        kinds = sorted({operation[0] for operation in operations}) if len(operations) < 10 else ["insert"]
+        results.append((f"{label} ({', '.join(kinds) or '-'})", connection.bytes - size, time.perf_counter() - start))
+    return results
+
+
+def main():
+    print(f"{ITEMS} 张 titled_card\n")
+    print(f"{'修改':<28} {'全部重建':>14} {'reconcile':>14} {'重建耗时':>10} {'协调耗时':>10}")
+    for (label, full, full_time), (incremental_label, size, elapsed) in zip(rebuild(), incremental()):
+        print(f"{incremental_label:<28} {full:>12,} B {size:>12,} B {full_time * 1000:>8.1f}ms {elapsed * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+# benchmarks/bench_responsive_layout.py
+"""断点响应式布局基准测试
+
+模拟用户来回拖动窗口边缘 DRAGS 次，每次从 400px 拖到 1500px 再拖回来，
+每 EVENT_INTERVAL 秒触发一次 page.on_resized，对比:
+- 旧写法: 每个尺寸变化事件都重新构建布局并 update()
+- adaptive_layout: 事件经过防抖合并，只在断点变化时切换布局，布局按断点缓存
+
+使用只统计消息的连接代替真实客户端，报告更新消息数、字节数和布局构建次数。
+
+运行方式:
+    python benchmarks/bench_responsive_layout.py
+"""
+import asyncio
+import itertools
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flet as ft
+from flet.core.page import _session_page
+from flet.core.protocol import PageCommandsBatchResponsePayload
+from flet.core.pubsub.pubsub_hub import PubSubHub
+
+from BaseComponents import adaptive_layout, body, heading, responsive_layout
+
+DRAGS = 3
+STEP = 10
+EVENT_INTERVAL = 0.004
+DEBOUNCE = 0.05
+ROWS = 60
+
+
+class CountingConnection:
+    """只统计消息数和字节数的连接，为添加的控件分配 id"""
+
+    def __init__(self):
+        self.pubsubhub = PubSubHub()
+        self.messages = 0
+        self.bytes = 0
+        self._ids = itertools.count(1)
+
+    def send_commands(self, session_id, commands):
+        self.messages += 1
+        results = []
+        for command in commands:
+            self.bytes += len(json.dumps(
+                [command.name, command.values, command.attrs, [inner.attrs for inner in command.commands]],
+                ensure_ascii=False,
+            ).encode("utf-8"))
+            if command.name == "add":
+                results.append(" ".join(f"_{next(self._ids)}" for _ in command.commands))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    def send_command(self, session_id, command):
+        return self.send_commands(session_id, [command])
+
+
+class ResizeEvent:
+    def __init__(self, width):
+        self.width = width
+        self.height = 800
+
+
+def new_page():
+    connection = CountingConnection()
+    page = ft.Page(connection, "bench", asyncio.new_event_loop())
+    _session_page.set(page)
+    return page, connection
+
+
+def build_layout(columns):
+    """按列数构建一个包含 ROWS 个卡片的网格"""
+    rows = []
+    for start in range(0, ROWS, columns):
+        rows.append(ft.Row([
+            ft.Container(body(f"卡片 {i}"), padding=10, expand=True)
+            for i in range(start, min(start + columns, ROWS))
+        ]))
+    return ft.Column([heading(f"{columns} 列布局", level=3), *rows])
+
+
+def columns_for(width):
+    return 1 if width < 768 else 2 if width < 1200 else 3
+
+
+def drag(page):
+    widths = list(range(400, 1500, STEP))
+    events = 0
+    for _ in range(DRAGS):
+        for width in widths + widths[::-1]:
+            page.on_resized(ResizeEvent(width))
+            events += 1
+            time.sleep(EVENT_INTERVAL)
+        time.sleep(DEBOUNCE * 2)  # 每次拖动结束后停顿
+    return events
+
+
+def legacy():
+    page, connection = new_page()
+    layout = responsive_layout(build_layout(3))
+    page.add(layout)
+    builds = 0
+
+    def on_resized(e):
+        nonlocal builds
+        layout.content = build_layout(columns_for(e.width))
+        builds += 1
+        layout.update()
+
+    page.on_resized = on_resized
+    messages, size = connection.messages, connection.bytes
+    events = drag(page)
+    return events, connection.messages - messages, connection.bytes - size, builds
+
+
+def adaptive():
+    page, connection = new_page()
+    layout = adaptive_layout(
+        {
+            "xs": lambda: build_layout(1),
+            "md": lambda: build_layout(2),
+            "xl": lambda: build_layout(3),
+        },
+        page=page,
+        width=1500,
+        debounce=DEBOUNCE,
+    )
+    page.add(layout.control)
+    messages, size = connection.messages, connection.bytes
+    events = drag(page)
+    layout.detach()
+    return events, connection.messages - messages, connection.bytes - size, layout.build_count
+
+
+def main():
+    for label, run in (("旧写法（每个事件重建）", legacy), ("adaptive_layout", adaptive)):
+        start = time.perf_counter()
+        events, messages, size, builds = run()
+        elapsed = time.perf_counter() - start
+        print(f"{label}")
+        print(f"  {events} 个尺寸变化事件: 更新消息 {messages} 条, {size / 1024:,.0f} KB, "
+              f"构建布局 {builds} 次, 耗时 {elapsed:.2f}s\n")
+
+
+if __name__ == "__main__":
+    main()
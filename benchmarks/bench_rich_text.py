@@ -0,0 +1,58 @@
+# benchmarks/bench_rich_text.py
+"""富文本编译缓存基准测试
+
+模拟反复渲染包含 5000 条格式化消息的信息流（消息内容有重复），对比
+每次都重新解析标记文本与复用 (标记文本, 调色板) 缓存的耗时。
+
+运行方式:
+    python benchmarks/bench_rich_text.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BaseComponents import RichText, rich_text
+from BaseComponents import textComponents
+
+MESSAGES = 5000
+UNIQUE = 500
+RENDERS = 3
+
+FEED = [
+    f"**用户{i % UNIQUE}** 提交了 `commit-{i % UNIQUE}`，详情见 [#{i % UNIQUE}](https://example.com/{i % UNIQUE})，"
+    f"状态 *已合并* ~~草稿~~"
+    for i in range(MESSAGES)
+]
+
+
+def clear_caches():
+    textComponents._parse_markup.cache_clear()
+    textComponents._rich_templates.clear()
+
+
+def timed(func, uncached):
+    """执行 RENDERS 次整条信息流；uncached 时每条消息前都清空缓存，相当于每次重新解析"""
+    clear_caches()
+    start = time.perf_counter()
+    for _ in range(RENDERS):
+        for markup in FEED:
+            if uncached:
+                clear_caches()
+            func(markup)
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"渲染 {RENDERS} 次信息流，每次 {MESSAGES} 条消息（{UNIQUE} 种不同内容）\n")
+    for label, func in (("编译标记文本", RichText.compile), ("创建 ft.Text 控件", rich_text)):
+        uncached = timed(func, uncached=True)
+        cached = timed(func, uncached=False)
+        print(f"{label}:")
+        print(f"  每次重新解析 {uncached * 1000:8.1f} ms")
+        print(f"  复用编译缓存 {cached * 1000:8.1f} ms  ({uncached / cached:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# benchmarks/bench_startup.py
+"""启动时间基准测试
+
+在独立的子进程中分别测量:
+- 只导入 flet 的基线耗时
+- 导入 BaseComponents 的耗时（系统主题检测已推迟，不再在导入时执行）
+- 导入后立即检测系统主题的耗时（相当于旧版在导入时同步检测的开销）
+
+运行方式:
+    python benchmarks/bench_startup.py
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 10
+
+CASES = [
+    ("import flet (基线)", "import flet"),
+    ("import BaseComponents (延迟检测)", "import BaseComponents"),
+    (
+        "import BaseComponents + 同步检测 (旧行为)",
+        "import BaseComponents; BaseComponents.theme_manager.current_theme",
+    ),
+    (
+        "import BaseComponents + 后台检测",
+        "import BaseComponents; BaseComponents.detect_theme_in_background()",
+    ),
+]
+
+TIMER = """
+import time
+_start = time.perf_counter()
+{code}
+print(time.perf_counter() - _start)
+"""
+
+
+def measure(code):
+    samples = []
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(code=code)],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def main():
+    try:
+        import darkdetect  # noqa: F401
+    except ImportError:
+        print("提示: 未安装 darkdetect，系统主题检测使用模拟实现，差异会很小\n")
+
+    print(f"每项运行 {RUNS} 次，取中位数\n")
+    for label, code in CASES:
+        print(f"{label:<44} {measure(code) * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
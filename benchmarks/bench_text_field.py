@@ -0,0 +1,140 @@
+# benchmarks/bench_text_field.py
+"""搜索输入框基准测试
+
+模拟以 KEY_INTERVAL 秒的间隔输入 QUERY，每次输入触发一次耗时随机
+（QUERY_LATENCY 范围内）的异步查询，查询结果显示在输入框下方的文本中。比较:
+- 普通 ft.TextField：每次按键都开始一次查询，结果完成后立即应用
+- text_field(debounce=..., validator=..., on_validated=...)：防抖后查询，
+  新的输入到达时取消仍在进行的查询，只应用最新一次的结果
+
+报告开始的查询数、被应用的结果数、发送的更新批次，以及最终显示的结果
+是否对应完整的输入。页面使用模拟连接，事件循环在后台线程中运行。
+
+运行方式:
+    python benchmarks/bench_text_field.py
+"""
+import asyncio
+import itertools
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flet as ft
+from flet.core.control_event import ControlEvent
+from flet.core.protocol import PageCommandsBatchResponsePayload
+from flet.core.pubsub.pubsub_hub import PubSubHub
+
+from BaseComponents import text_field
+
+QUERY = "flet base components"
+KEY_INTERVAL = 0.06
+QUERY_LATENCY = (0.08, 0.6)
+DEBOUNCE = 0.2
+
+
+class CountingConnection:
+    """统计发送批次的模拟连接"""
+
+    def __init__(self):
+        self.pubsubhub = PubSubHub()
+        self.batches = 0
+        self._ids = itertools.count(1)
+
+    def send_commands(self, session_id, commands):
+        self.batches += 1
+        results = []
+        for command in commands:
+            if command.name == "add":
+                results.append(" ".join(f"_{next(self._ids)}" for _ in command.commands))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    def send_command(self, session_id, command):
+        return self.send_commands(session_id, [command])
+
+
+class SearchBackend:
+    def __init__(self, seed):
+        self.random = random.Random(seed)
+        self.queries = 0
+
+    async def search(self, text):
+        self.queries += 1
+        await asyncio.sleep(self.random.uniform(*QUERY_LATENCY))
+        return f"{text!r} 的结果"
+
+
+def start_page():
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    connection = CountingConnection()
+    return ft.Page(connection, "bench", loop), connection, loop
+
+
+def type_query(page, field):
+    for index in range(1, len(QUERY) + 1):
+        field.value = QUERY[:index]
+        # Flet 在线程池中执行同步处理函数，异步处理函数在事件循环中执行
+        handler = field.on_change
+        event = ControlEvent(field.uid, "change", field.value, field, page)
+        if asyncio.iscoroutinefunction(handler):
+            page.run_task(handler, event)
+        else:
+            threading.Thread(target=handler, args=(event,)).start()
+        time.sleep(KEY_INTERVAL)
+    time.sleep(DEBOUNCE + QUERY_LATENCY[1] + 0.2)
+
+
+def run_plain(seed):
+    page, connection, loop = start_page()
+    backend = SearchBackend(seed)
+    applied = []
+    result = ft.Text()
+
+    async def on_change(e):
+        text = await backend.search(e.control.value)
+        applied.append(text)
+        result.value = text
+        result.update()
+
+    field = ft.TextField(label="搜索", on_change=on_change)
+    page.add(field, result)
+    connection.batches = 0
+    type_query(page, field)
+    loop.call_soon_threadsafe(loop.stop)
+    return backend.queries, len(applied), connection.batches, result.value
+
+
+def run_debounced(seed):
+    page, connection, loop = start_page()
+    backend = SearchBackend(seed)
+    applied = []
+    result = ft.Text()
+
+    def show(text):
+        applied.append(text)
+        result.value = text
+
+    field = text_field("搜索", debounce=DEBOUNCE, validator=backend.search, on_validated=show)
+    page.add(field, result)
+    connection.batches = 0
+    type_query(page, field)
+    loop.call_soon_threadsafe(loop.stop)
+    return backend.queries, len(applied), connection.batches, result.value
+
+
+def main():
+    expected = f"{QUERY!r} 的结果"
+    print(f"输入 {len(QUERY)} 个字符，按键间隔 {KEY_INTERVAL * 1000:.0f}ms，"
+          f"查询耗时 {QUERY_LATENCY[0] * 1000:.0f}-{QUERY_LATENCY[1] * 1000:.0f}ms\n")
+    print(f"{'方式':<28} {'查询':>6} {'应用结果':>8} {'更新批次':>8} {'最终结果正确':>12}")
+    for label, run in (("ft.TextField 每次按键", run_plain), (f"text_field 防抖 {DEBOUNCE}s", run_debounced)):
+        queries, applied, batches, final = run(seed=7)
+        print(f"{label:<28} {queries:>6} {applied:>8} {batches:>8} {'是' if final == expected else '否':>12}")
+
+
+if __name__ == "__main__":
+    main()
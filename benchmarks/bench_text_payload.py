@@ -0,0 +1,68 @@
+# benchmarks/bench_text_payload.py
+"""文本行序列化体积基准测试
+
+比较 1000 行文本在三种写法下发送给客户端的序列化字节数:
+- 旧实现: 每个 ft.Text 单独设置字号、颜色、粗细和对齐
+- 共享样式: 控件只携带文本内容和共享 ft.TextStyle 引用
+- 客户端主题: 样式提升到 page.theme 的文本主题，控件只携带 theme_style 名称
+
+运行方式:
+    python benchmarks/bench_text_payload.py
+"""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flet as ft
+from flet.core.page import _session_page
+
+from BaseComponents import body, caption, enable_client_theming, get_theme_colors, switch_theme
+
+ROWS = 1000
+
+
+class FakePage:
+    """模拟 ft.Page 会话，只需要能挂载主题属性"""
+
+    def update(self, *controls):
+        pass
+
+
+def legacy_row(i):
+    colors = get_theme_colors()
+    return ft.Column([
+        ft.Text(f"第 {i} 行", size=14, color=colors.text_primary, text_align=ft.TextAlign.LEFT,
+                weight=ft.FontWeight.NORMAL),
+        ft.Text(f"说明 {i}", size=12, color=colors.text_secondary, text_align=ft.TextAlign.LEFT,
+                weight=ft.FontWeight.NORMAL),
+    ])
+
+
+def current_row(i):
+    return ft.Column([body(f"第 {i} 行", shared_style=True), caption(f"说明 {i}", shared_style=True)])
+
+
+def payload_bytes(rows):
+    """统计添加控件时发送的命令（属性）序列化后的字节数"""
+    commands = ft.Column(rows)._build_add_commands()
+    return sum(len(json.dumps(command.attrs, ensure_ascii=False).encode("utf-8")) for command in commands)
+
+
+def main():
+    _session_page.set(FakePage())
+    switch_theme("light")
+
+    legacy = payload_bytes([legacy_row(i) for i in range(ROWS)])
+    shared = payload_bytes([current_row(i) for i in range(ROWS)])
+    enable_client_theming(_session_page.get(), update=False)
+    hoisted = payload_bytes([current_row(i) for i in range(ROWS)])
+
+    print(f"{ROWS} 行文本（每行 2 个 ft.Text）的序列化字节数:\n")
+    for label, size in (("旧实现（逐个属性）", legacy), ("共享样式", shared), ("客户端主题 theme_style", hoisted)):
+        print(f"  {label:<24} {size:>9,} B  ({size / legacy:6.1%})")
+
+
+if __name__ == "__main__":
+    main()
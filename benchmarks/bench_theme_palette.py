@@ -0,0 +1,86 @@
+# benchmarks/bench_theme_palette.py
+"""主题调色板微基准测试
+
+对比旧实现（每次调用 get_theme_colors 都构建一个 8 键字典）与缓存的
+ThemePalette 在每次工厂调用中的内存分配情况。
+
+运行方式:
+    python benchmarks/bench_theme_palette.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flet as ft
+
+from BaseComponents import AppColors, get_theme_colors, primary_button
+import BaseComponents.buttonComponents as button_module
+
+N = 20000
+
+
+def legacy_theme_colors():
+    """旧版 get_theme_colors 的实现，用于对比"""
+    colors = AppColors
+    return {
+        "background": colors.BACKGROUND,
+        "surface": colors.SURFACE,
+        "primary": colors.PRIMARY,
+        "on_primary": colors.WHITE,
+        "secondary": colors.SECONDARY,
+        "on_secondary": colors.WHITE,
+        "text_primary": colors.TEXT_PRIMARY,
+        "text_secondary": colors.TEXT_SECONDARY,
+    }
+
+
+def measure(label, func):
+    """返回每次调用平均分配的内存块数、字节数和耗时"""
+    func()  # 预热
+    results = []
+    tracemalloc.start()
+    start_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    start_size, _ = tracemalloc.get_traced_memory()
+    for _ in range(N):
+        results.append(func())
+    end_size, _ = tracemalloc.get_traced_memory()
+    end_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.stop()
+    del results
+
+    start = time.perf_counter()
+    for _ in range(N):
+        func()
+    elapsed = time.perf_counter() - start
+
+    blocks = (end_blocks - start_blocks) / N
+    size = (end_size - start_size) / N
+    print(f"{label:<40} {blocks:>8.2f} 块/次 {size:>10.1f} B/次 {elapsed / N * 1e6:>8.2f} us/次")
+
+
+def main():
+    print(f"每项调用 {N} 次\n")
+    measure("get_theme_colors (旧: 构建字典)", legacy_theme_colors)
+    measure("get_theme_colors (新: 缓存调色板)", get_theme_colors)
+
+    original = button_module.get_theme_colors
+    try:
+        # 旧实现返回字典，需要按键访问，这里包装成与新调色板相同的接口
+        button_module.get_theme_colors = lambda: _DictPalette(legacy_theme_colors())
+        measure("primary_button (旧: 每次构建字典)", lambda: primary_button("按钮"))
+    finally:
+        button_module.get_theme_colors = original
+    measure("primary_button (新: 缓存调色板)", lambda: primary_button("按钮"))
+    measure("ft.ElevatedButton (基线)", lambda: ft.ElevatedButton(text="按钮"))
+
+
+class _DictPalette(dict):
+    """让字典支持属性访问，以便用旧实现驱动新版工厂函数"""
+    __getattr__ = dict.__getitem__
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# benchmarks/bench_theme_reload.py
+"""主题文件热重载基准测试
+
+测量主题文件的首次解析与缓存命中耗时，以及在 N 个已登记控件上
+热重载一个颜色角色与重建全部控件的耗时对比。
+
+运行方式:
+    python benchmarks/bench_theme_reload.py
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BaseComponents import ThemeFileWatcher, body, get_theme_manager, primary_button, read_theme_file, switch_theme
+
+N = 5000
+
+
+def write_theme(path, primary):
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"light": {"primary": primary}, "dark": {"primary": primary}}, file)
+
+
+def build_controls():
+    return [primary_button(f"按钮 {i}") if i % 2 else body(f"文本 {i}") for i in range(N)]
+
+
+def main():
+    path = os.path.join(tempfile.mkdtemp(), "theme.json")
+    write_theme(path, "#6200EE")
+    switch_theme("light")
+
+    start = time.perf_counter()
+    read_theme_file(path)
+    cold = time.perf_counter() - start
+    start = time.perf_counter()
+    read_theme_file(path)
+    warm = time.perf_counter() - start
+    print(f"读取主题文件: 首次 {cold * 1000:.2f} ms, 缓存命中 {warm * 1e6:.1f} us")
+
+    watcher = ThemeFileWatcher(path)
+    watcher.check(update=False)
+    controls = build_controls()  # noqa: F841 保持控件存活
+
+    start = time.perf_counter()
+    build_controls()
+    rebuild = time.perf_counter() - start
+
+    time.sleep(0.01)
+    write_theme(path, "#03DAC6")
+    start = time.perf_counter()
+    changed = watcher.check(update=False)
+    reload = time.perf_counter() - start
+
+    assert changed and get_theme_manager().palette.primary == "#03DAC6"
+    print(f"{N} 个控件: 重建全部 {rebuild * 1000:.1f} ms, 热重载 primary {reload * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# benchmarks/bench_themed_styles.py
+"""主题化组件创建吞吐量基准测试
+
+对比旧实现（每次调用都重建 button_configs / text_configs / container_configs
+配置表）与共享样式表实现创建 10k 个控件的耗时。两种实现都向主题注册表登记
+同样的属性，差异只来自配置表的构建。
+
+运行方式:
+    python benchmarks/bench_themed_styles.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flet as ft
+
+from BaseComponents import AppColors, bind_theme, get_theme_colors, themed_button, themed_container, themed_text
+
+N = 10000
+
+
+def legacy_themed_button(text, on_click=None, button_type="primary", **kwargs):
+    colors = get_theme_colors()
+    button_configs = {
+        "primary": {"color": colors.on_primary, "bgcolor": colors.primary},
+        "secondary": {"color": colors.on_secondary, "bgcolor": colors.secondary},
+        "success": {"color": "white", "bgcolor": AppColors.SUCCESS},
+        "warning": {"color": "black", "bgcolor": AppColors.WARNING},
+        "error": {"color": "white", "bgcolor": AppColors.ERROR},
+    }
+    button_roles = {
+        "primary": {"color": "on_primary", "bgcolor": "primary"},
+        "secondary": {"color": "on_secondary", "bgcolor": "secondary"},
+    }
+    config = button_configs.get(button_type, button_configs["primary"])
+    button = ft.ElevatedButton(text=text, on_click=on_click, color=config["color"], bgcolor=config["bgcolor"], **kwargs)
+    if button_type in button_roles:
+        bind_theme(button, **button_roles[button_type])
+    return button
+
+
+def legacy_themed_text(text, text_type="body", **kwargs):
+    colors = get_theme_colors()
+    text_roles = {"heading": "text_primary", "body": "text_primary", "caption": "text_secondary", "link": "primary"}
+    text_configs = {
+        "heading": {"size": 24, "color": colors.text_primary, "weight": ft.FontWeight.BOLD},
+        "body": {"size": 16, "color": colors.text_primary, "weight": ft.FontWeight.NORMAL},
+        "caption": {"size": 12, "color": colors.text_secondary, "weight": ft.FontWeight.NORMAL},
+        "link": {"size": 16, "color": colors.primary, "weight": ft.FontWeight.NORMAL},
+    }
+    config = text_configs.get(text_type, text_configs["body"])
+    for key, value in kwargs.items():
+        config[key] = value
+    text_control = ft.Text(text, **config)
+    if "color" not in kwargs:
+        bind_theme(text_control, color=text_roles.get(text_type, "text_primary"))
+    return text_control
+
+
+def legacy_themed_container(content, container_type="surface", **kwargs):
+    colors = get_theme_colors()
+    container_configs = {
+        "card": {"bgcolor": colors.surface, "border_radius": 8, "padding": 16},
+        "surface": {"bgcolor": colors.surface, "padding": 16},
+        "outlined": {
+            "bgcolor": colors.surface,
+            "border": ft.border.all(1, colors.text_secondary),
+            "border_radius": 4,
+            "padding": 16,
+        },
+    }
+    config = container_configs.get(container_type, container_configs["card"])
+    for key, value in kwargs.items():
+        config[key] = value
+    container = ft.Container(content=content, **config)
+    container_roles = {}
+    if "bgcolor" not in kwargs:
+        container_roles["bgcolor"] = "surface"
+    if container_type == "outlined" and "border" not in kwargs:
+        container_roles["border"] = ("text_secondary", lambda color: ft.border.all(1, color))
+    if container_roles:
+        bind_theme(container, **container_roles)
+    return container
+
+
+def throughput(func):
+    func()  # 预热
+    controls = []
+    start = time.perf_counter()
+    for _ in range(N):
+        controls.append(func())
+    return N / (time.perf_counter() - start)
+
+
+CASES = [
+    ("themed_button", lambda: legacy_themed_button("按钮"), lambda: themed_button("按钮")),
+    ("themed_text", lambda: legacy_themed_text("文本", "caption"), lambda: themed_text("文本", "caption")),
+    ("themed_container(outlined)", lambda: legacy_themed_container(None, "outlined"),
+     lambda: themed_container(None, "outlined")),
+]
+
+
+def main():
+    print(f"每项创建 {N} 个控件，单位: 个/秒\n")
+    print(f"{'组件':<28} {'旧实现':>12} {'共享样式表':>12}")
+    for label, legacy, current in CASES:
+        print(f"{label:<28} {throughput(legacy):>12.0f} {throughput(current):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
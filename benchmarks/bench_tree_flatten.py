@@ -0,0 +1,60 @@
+# benchmarks/bench_tree_flatten.py
+"""控件树压平基准测试
+
+构建一个包含大量卡片和对齐文本的页面，比较 flatten_tree 前后的
+控件数量和添加到页面时发送的序列化字节数。
+
+运行方式:
+    python benchmarks/bench_tree_flatten.py
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flet as ft
+
+from BaseComponents import center_text, clickable_card, flatten_tree, left_text, right_text, simple_card
+
+CARDS = 500
+
+
+def build_page():
+    rows = []
+    for i in range(CARDS):
+        rows.append(simple_card(center_text(f"卡片 {i}", size=16)))
+        rows.append(clickable_card(right_text(f"详情 {i}", size=14), on_click=lambda e: None))
+    # 列表中的对齐文本可以直接改用文本自身的 text_align
+    rows.append(ft.ListView([left_text(f"列表项 {i}", size=14) for i in range(CARDS)], height=400))
+    return ft.Column(rows, scroll=ft.ScrollMode.AUTO)
+
+
+def count_controls(control):
+    return 1 + sum(count_controls(child) for child in control._get_children())
+
+
+def payload_bytes(control):
+    return sum(len(json.dumps(command.attrs, ensure_ascii=False).encode("utf-8"))
+               for command in control._build_add_commands())
+
+
+def main():
+    before = build_page()
+    controls_before = count_controls(before)
+    bytes_before = payload_bytes(before)
+
+    after = build_page()
+    start = time.perf_counter()
+    removed = flatten_tree(after)
+    elapsed = time.perf_counter() - start
+
+    print(f"页面: {CARDS * 2} 张卡片 + {CARDS} 行列表\n")
+    print(f"控件数   {controls_before:>8,} -> {count_controls(after):>8,}  (删除 {removed:,})")
+    print(f"字节数   {bytes_before:>8,} -> {payload_bytes(after):>8,}")
+    print(f"flatten_tree 耗时 {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# benchmarks/bench_virtual_list.py
+"""虚拟化列表基准测试
+
+比较 ScrollablePage.create（所有行放入一个 ft.Column）与
+ScrollablePage.create_virtual（只创建可见区域附近的行）在不同行数下的
+首次构建耗时、控件数量和首次添加到页面时的序列化字节数，并模拟滚动
+统计虚拟列表发送的更新次数。
+
+运行方式:
+    python benchmarks/bench_virtual_list.py
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flet as ft
+
+from BaseComponents import ScrollablePage, body
+
+SIZES = (1000, 10000, 50000)
+ROW_HEIGHT = 40
+
+
+def build_row(item):
+    return ft.Container(body(item), height=ROW_HEIGHT)
+
+
+def bind_row(control, item):
+    control.content.value = item
+
+
+def count_controls(control):
+    return 1 + sum(count_controls(child) for child in control._get_children())
+
+
+def payload_bytes(control):
+    return sum(len(json.dumps(command.attrs, ensure_ascii=False).encode("utf-8"))
+               for command in control._build_add_commands())
+
+
+def measure(build):
+    start = time.perf_counter()
+    control = build()
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    size = payload_bytes(control)
+    serialized = time.perf_counter() - start
+    return (built + serialized) * 1000, count_controls(control), size
+
+
+def main():
+    print(f"{'行数':>8} {'布局':<10} {'构建+序列化':>12} {'控件数':>10} {'字节数':>12}")
+    for size in SIZES:
+        items = [f"第 {i} 行" for i in range(size)]
+        cases = (
+            ("Column", lambda: ScrollablePage.create([build_row(item) for item in items])),
+            ("虚拟列表", lambda: ScrollablePage.create_virtual(
+                build_row, items=items, item_binder=bind_row, item_extent=ROW_HEIGHT).control),
+        )
+        for label, build in cases:
+            elapsed, controls, payload = measure(build)
+            print(f"{size:>8} {label:<10} {elapsed:>10.1f}ms {controls:>10,} {payload:>12,}")
+
+    view = ScrollablePage.create_virtual(build_row, items=items, item_binder=bind_row, item_extent=ROW_HEIGHT)
+    renders = 0
+    start = time.perf_counter()
+    for offset in range(0, 200 * ROW_HEIGHT * 10, ROW_HEIGHT // 2):
+        window = view._window
+        view.update_viewport(offset, 600)
+        renders += view._window is not window
+    elapsed = time.perf_counter() - start
+    print(f"\n模拟滚动 {offset // ROW_HEIGHT} 行: 重新渲染 {renders} 次, 共 {elapsed * 1000:.1f} ms, "
+          f"始终保持 {len(view._window)} 个行控件")
+
+
+if __name__ == "__main__":
+    main()
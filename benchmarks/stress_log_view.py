@@ -0,0 +1,120 @@
+# benchmarks/stress_log_view.py
+"""流式日志组件压力测试
+
+4 个生产者线程以尽可能快的速度写入日志，对比:
+- 旧写法: 每行 append 一个 body() 并单独调用 page.update()
+- LogView: 环形缓冲区 + 每帧最多一次更新 + 复用被淘汰的文本控件
+
+使用只统计消息的连接代替真实客户端，报告发送的更新消息数、字节数
+和页面上保留的控件数量。
+
+运行方式:
+    python benchmarks/stress_log_view.py
+"""
+import asyncio
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flet as ft
+from flet.core.page import _session_page
+from flet.core.protocol import PageCommandsBatchResponsePayload
+from flet.core.pubsub.pubsub_hub import PubSubHub
+
+from BaseComponents import body, log_view, scrollable_page
+
+PRODUCERS = 4
+LINES_PER_PRODUCER = 250
+CAPACITY = 500
+
+
+class CountingConnection:
+    """只统计消息数和字节数的连接，为添加的控件分配 id"""
+
+    def __init__(self):
+        self.pubsubhub = PubSubHub()
+        self.messages = 0
+        self.bytes = 0
+        self._ids = itertools.count(1)
+
+    def send_commands(self, session_id, commands):
+        self.messages += 1
+        results = []
+        for command in commands:
+            self.bytes += len(json.dumps(
+                [command.name, command.values, command.attrs, [inner.attrs for inner in command.commands]],
+                ensure_ascii=False,
+            ).encode("utf-8"))
+            if command.name == "add":
+                results.append(" ".join(f"_{next(self._ids)}" for _ in command.commands))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    def send_command(self, session_id, command):
+        return self.send_commands(session_id, [command])
+
+
+def new_page():
+    connection = CountingConnection()
+    page = ft.Page(connection, "bench", asyncio.new_event_loop())
+    _session_page.set(page)
+    return page, connection
+
+
+def run_producers(write):
+    def producer(index):
+        for i in range(LINES_PER_PRODUCER):
+            write(f"[producer-{index}] line {i}")
+
+    threads = [threading.Thread(target=producer, args=(i,)) for i in range(PRODUCERS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def legacy():
+    page, connection = new_page()
+    content = scrollable_page([], auto_scroll=True)
+    page.add(content)
+    column = content.content
+    lock = threading.Lock()
+
+    def write(line):
+        with lock:
+            column.controls.append(body(line))
+            column.update()
+
+    elapsed = run_producers(write)
+    return elapsed, connection, len(column.controls)
+
+
+def streaming():
+    page, connection = new_page()
+    log = log_view(capacity=CAPACITY)
+    page.add(log.control)
+    elapsed = run_producers(log.append)
+    time.sleep(0.1)  # 等待最后一帧
+    log.close()
+    return elapsed, connection, len(log.column.controls)
+
+
+def main():
+    total = PRODUCERS * LINES_PER_PRODUCER
+    print(f"{PRODUCERS} 个生产者线程共写入 {total} 行\n")
+    for label, run in (("旧写法（每行 update）", legacy), (f"LogView（容量 {CAPACITY}）", streaming)):
+        elapsed, connection, controls = run()
+        print(f"{label}")
+        print(f"  耗时 {elapsed:.2f}s ({total / elapsed:,.0f} 行/秒), 更新消息 {connection.messages:,} 条, "
+              f"{connection.bytes / 1024:,.0f} KB")
+        print(f"  页面控件 {controls:,} 个\n")
+
+
+if __name__ == "__main__":
+    main()
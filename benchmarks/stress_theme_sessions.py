@@ -0,0 +1,130 @@
+# benchmarks/stress_theme_sessions.py
+"""会话级主题状态的并发压力测试
+
+模拟大量 Web 会话并行切换主题，分别覆盖 Flet 的线程处理函数模型和
+asyncio 处理函数模型，检查每个会话只看到自己的主题颜色，且同一会话内
+并发切换不会丢失版本号。
+
+运行方式:
+    python benchmarks/stress_theme_sessions.py
+"""
+import asyncio
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flet.core.page import _session_page
+
+from BaseComponents import body, get_theme_colors, get_theme_manager, primary_button, switch_theme, theme_manager
+
+SESSIONS = 200
+SWITCHES_PER_SESSION = 50
+THREADS = 32
+
+
+class FakePage:
+    """模拟 ft.Page 会话，只需要能挂载属性并接收批量更新"""
+
+    def __init__(self, name):
+        self.name = name
+        self.updates = 0
+
+    def update(self, *controls):
+        self.updates += 1
+
+
+def expected_text_color(theme):
+    return theme_manager.palettes[theme].text_primary
+
+
+def thread_handler(page, theme):
+    """模拟 Flet 的线程处理函数：Flet 会先把会话页面写入上下文变量"""
+    _session_page.set(page)
+    switch_theme(theme)
+    text = body("session text")
+    button = primary_button("ok")
+    colors = get_theme_colors()
+    if text.color != expected_text_color(theme) or colors is not get_theme_manager(page).palette:
+        raise AssertionError(f"{page.name}: 期望 {theme} 主题颜色，实际 {text.color}")
+    return button
+
+
+async def async_handler(page, theme):
+    """模拟 Flet 的异步处理函数"""
+    _session_page.set(page)
+    switch_theme(theme)
+    await asyncio.sleep(0)
+    text = body("session text")
+    if text.color != expected_text_color(theme):
+        raise AssertionError(f"{page.name}: 期望 {theme} 主题颜色，实际 {text.color}")
+
+
+def run_threads(pages):
+    """每个会话串行切换主题，不同会话在线程池中交错执行"""
+    last_theme = {}
+
+    def session_worker(page):
+        for _ in range(SWITCHES_PER_SESSION):
+            theme = random.choice(("light", "dark"))
+            thread_handler(page, theme)
+            last_theme[page.name] = theme
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        list(executor.map(session_worker, pages))
+
+    for page in pages:
+        manager = get_theme_manager(page)
+        assert manager.current_theme == last_theme[page.name], page.name
+        assert manager.version == SWITCHES_PER_SESSION, (page.name, manager.version)
+
+
+def run_shared_session(page):
+    """同一会话被多个线程并发切换时，版本号和调色板保持一致"""
+    total = THREADS * SWITCHES_PER_SESSION
+
+    def worker(_):
+        _session_page.set(page)
+        for _ in range(SWITCHES_PER_SESSION):
+            switch_theme(random.choice(("light", "dark")))
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        list(executor.map(worker, range(THREADS)))
+
+    manager = get_theme_manager(page)
+    assert manager.version == total, (manager.version, total)
+    assert manager.palette is manager.palettes[manager.current_theme]
+
+
+async def run_tasks(pages):
+    async def session_task(page):
+        for _ in range(SWITCHES_PER_SESSION):
+            await async_handler(page, random.choice(("light", "dark")))
+
+    await asyncio.gather(*(session_task(page) for page in pages))
+
+
+def main():
+    global_theme = theme_manager.current_theme
+
+    start = time.perf_counter()
+    run_threads([FakePage(f"thread-{i}") for i in range(SESSIONS)])
+    print(f"线程模型: {SESSIONS} 个会话 x {SWITCHES_PER_SESSION} 次切换, {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    run_shared_session(FakePage("shared"))
+    print(f"同一会话并发切换: {THREADS} 个线程, {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    asyncio.run(run_tasks([FakePage(f"task-{i}") for i in range(SESSIONS)]))
+    print(f"asyncio 模型: {SESSIONS} 个会话 x {SWITCHES_PER_SESSION} 次切换, {time.perf_counter() - start:.2f}s")
+
+    assert theme_manager.current_theme == global_theme, "会话切换不应影响全局主题"
+    print("全部通过: 各会话主题互不影响")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,16 +15,15 @@ def main(page: ft.Page):
 
     # 创建一个切换主题的函数
     def toggle_theme(e):
-        if theme_manager.current_theme == "light":
+        if get_theme_manager().current_theme == "light":
             switch_theme("dark")
             toggle_button.text = "切换到浅色主题"
         else:
             switch_theme("light")
             toggle_button.text = "切换到深色主题"
 
-        # 重新加载页面以应用主题更改
-        load_demo_content()
-        page.update()
+        # 主题化控件已由 switch_theme 就地更新，这里只需更新按钮文字
+        toggle_button.update()
 
     # 创建切换主题按钮
     toggle_button = ft.ElevatedButton(
@@ -107,7 +106,7 @@ def main(page: ft.Page):
 
                 ft.Column([
                     clickable_card(
-                        content=ft.Text("点击我！", size=20, color=get_theme_colors()["primary"]),
+                        content=themed_text("点击我！", text_type="link", size=20),
                         on_click=card_clicked
                     )
                 ], col={"xs": 12, "sm": 6, "md": 4}),
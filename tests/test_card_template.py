@@ -0,0 +1,43 @@
+# tests/test_card_template.py
+import flet as ft
+
+from BaseComponents import bulk_cards, card_template
+
+
+def _action_button(card):
+    return card.content.content.controls[-1].controls[0]
+
+
+def test_stamped_cards_do_not_share_button_styles():
+    template = card_template(actions=[ft.ElevatedButton("确定", style=ft.ButtonStyle(color="blue"))])
+    assert template.cloning
+    first, second = template.stamp("内容", "标题"), template.stamp("内容", "标题")
+
+    button = _action_button(first)
+    button.bgcolor = "red"
+    button.before_update()
+    _action_button(second).before_update()
+
+    assert _action_button(second).style is not button.style
+    assert _action_button(second).style.bgcolor is None
+
+
+def _click_target(control):
+    """返回登记了点击事件的控件，Flet 派发事件时 e.control 就是它"""
+    if getattr(control, "on_click", None) is not None:
+        return control
+    for child in control._get_children():
+        target = _click_target(child)
+        if target is not None:
+            return target
+    return None
+
+
+def test_bulk_card_ids_are_available_in_click_handlers():
+    clicked = []
+    cards = bulk_cards(titles=["甲", "乙"], bodies=["一", "二"], ids=[101, 102],
+                       on_click=lambda e: clicked.append(e.control.data))
+    for card in cards:
+        target = _click_target(card)
+        target.on_click(ft.ControlEvent(target="_0", name="click", data="", control=target, page=None))
+    assert clicked == [101, 102]
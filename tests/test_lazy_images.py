@@ -0,0 +1,25 @@
+# tests/test_lazy_images.py
+import flet as ft
+
+from BaseComponents import LazyImageLoader, lazy_image
+
+
+def _rows(count):
+    return [ft.Container(content=lazy_image(f"https://example.com/{index}.png", height=200)) for index in range(count)]
+
+
+def test_refresh_registers_only_appended_rows():
+    column = ft.Column(controls=_rows(40), scroll=ft.ScrollMode.AUTO)
+    loader = LazyImageLoader(column)
+    initial = loader.pending_count
+    assert 0 < initial < 40
+
+    rows = _rows(10)
+    column.controls.extend(rows)
+    loader.refresh(rows)
+    assert loader.pending_count == initial + 10
+
+    column.controls.clear()
+    loader.refresh()
+    assert loader.pending_count == 0
+    loader.close()
@@ -0,0 +1,37 @@
+# tests/test_reconciler.py
+import flet as ft
+import pytest
+
+from BaseComponents import Reconciler, body, get_theme_colors, keyed, switch_theme
+
+
+@pytest.fixture
+def light_theme():
+    switch_theme("light", update=False)
+    yield
+    switch_theme("light", update=False)
+
+
+def test_patched_explicit_color_survives_theme_switch(light_theme):
+    reconciler = Reconciler(ft.Column())
+    reconciler.render([keyed("row", body, "文本")], update=False)
+    text = reconciler.control("row")
+
+    reconciler.render([keyed("row", body, "文本", color="#FF0000")], update=False)
+    assert reconciler.control("row") is text
+    assert text.color == "#FF0000"
+
+    switch_theme("dark", update=False)
+    assert text.color == "#FF0000"
+
+
+def test_patched_themed_color_follows_theme_switch(light_theme):
+    reconciler = Reconciler(ft.Column())
+    reconciler.render([keyed("row", body, "文本", color="#FF0000")], update=False)
+    text = reconciler.control("row")
+
+    reconciler.render([keyed("row", body, "文本")], update=False)
+    assert reconciler.control("row") is text
+
+    switch_theme("dark", update=False)
+    assert text.color == get_theme_colors().text_primary
@@ -0,0 +1,16 @@
+# tests/test_themed_button.py
+from BaseComponents import get_theme_styles, themed_button
+
+
+def test_themed_buttons_share_style_until_overridden():
+    first, second = themed_button("甲"), themed_button("乙")
+    shared = get_theme_styles().buttons["primary"]
+    assert first.style is shared and second.style is shared
+
+    first.bgcolor = "red"
+    first.before_update()
+    second.before_update()
+
+    assert first.style is not shared
+    assert second.style is shared
+    assert shared.bgcolor != "red"